@@ -13,7 +13,7 @@ const Topbar = ({ toggleSidebar, isSidebarOpen, isAuthenticated, setIsAuthentica
       apiClient
         .get('profile/')
         .then((response) => {
-          setProfileImage(response.data.image || null);
+          setProfileImage(response.data.image_variants?.small || response.data.image || null);
         })
         .catch((error) => {
           console.error('Error fetching profile image:', error);
@@ -31,7 +31,7 @@ const Layout = ({ isAuthenticated, setIsAuthenticated }) => {
         .then((response) => {
           setUser({
             username: response.data.username,
-            image: response.data.image,
+            image: response.data.image_variants?.small || response.data.image,
           });
         })
         .catch((error) => {
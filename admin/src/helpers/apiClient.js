@@ -34,6 +34,11 @@ apiClient.interceptors.response.use(
     if (response.data && response.data.image) {
       response.data.image = getAbsoluteImageUrl(response.data.image);
     }
+    if (response.data && response.data.image_variants) {
+      Object.keys(response.data.image_variants).forEach((size) => {
+        response.data.image_variants[size] = getAbsoluteImageUrl(response.data.image_variants[size]);
+      });
+    }
     return response;
   },
   async (error) => {
@@ -0,0 +1,18 @@
+import apiClient from "./apiClient";
+
+const STORAGE_KEY = "reference_data";
+
+const fetchReferenceData = async () => {
+  const cached = JSON.parse(localStorage.getItem(STORAGE_KEY) || "null");
+  const response = await apiClient.get("/reference-data/", {
+    params: cached ? { version: cached.version } : {},
+    validateStatus: (status) => status === 200 || status === 304,
+  });
+  if (response.status === 304 && cached) {
+    return cached;
+  }
+  localStorage.setItem(STORAGE_KEY, JSON.stringify(response.data));
+  return response.data;
+};
+
+export default fetchReferenceData;
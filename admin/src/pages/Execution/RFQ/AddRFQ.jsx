@@ -3,6 +3,7 @@ import { useNavigate, useLocation } from "react-router-dom";
 import { ArrowLeft, ArrowRight } from "lucide-react";
 import { toast } from "react-toastify";
 import apiClient from "../../../helpers/apiClient";
+import fetchReferenceData from "../../../helpers/referenceData";
 import ClientSelectionModal from "../../../components/ClientSelectionModal";
 import CRMManager from "../../../components/CRMManager";
 
@@ -39,28 +40,23 @@ const AddRFQ = () => {
     const fetchData = async () => {
       try {
         setLoading(true);
-        const [rfqResponse, itemsResponse, unitsResponse, teamResponse] = await Promise.all([
-          apiClient.get("/rfq-channels/"),
-          apiClient.get("/items/"),
-          apiClient.get("/units/"),
-          apiClient.get("/teams/"),
-        ]);
+        const referenceData = await fetchReferenceData();
 
         setFormData((prev) => ({
           ...prev,
-          rfq_channel_options: rfqResponse.data.map((channel) => ({
+          rfq_channel_options: referenceData.rfq_channels.map((channel) => ({
             value: channel.channel_name,
             label: channel.channel_name,
           })),
-          item_options: itemsResponse.data.map((item) => ({
+          item_options: referenceData.items.map((item) => ({
             value: item.name,
             label: item.name,
           })),
-          unit_options: unitsResponse.data.map((unit) => ({
+          unit_options: referenceData.units.map((unit) => ({
             value: unit.name,
             label: unit.name,
           })),
-          assign_to_options: teamResponse.data.map((member) => ({
+          assign_to_options: referenceData.teams.map((member) => ({
             value: String(member.id),
             label: `${member.name} (${member.designation})`,
           })),
@@ -3,6 +3,7 @@ import { useNavigate, useLocation } from "react-router-dom";
 import { Plus, Trash, X } from "lucide-react";
 import { toast } from "react-toastify";
 import apiClient from "../../../helpers/apiClient";
+import fetchReferenceData from "../../../helpers/referenceData";
 import ClientSelectionModal from "../../../components/ClientSelectionModal";
 
 const EditRFQ = () => {
@@ -36,18 +37,9 @@ const EditRFQ = () => {
 
       try {
         setLoading(true);
-        const [
-          rfqResponse,
-          rfqChannelsResponse,
-          itemsResponse,
-          unitsResponse,
-          teamResponse,
-        ] = await Promise.all([
+        const [rfqResponse, referenceData] = await Promise.all([
           apiClient.get(`/add-rfqs/${rfqData.id}/`),
-          apiClient.get("/rfq-channels/"),
-          apiClient.get("/items/").catch(() => ({ data: [] })),
-          apiClient.get("/units/").catch(() => ({ data: [] })),
-          apiClient.get("/teams/"),
+          fetchReferenceData(),
         ]);
 
         // Prioritize rfqData.items in quotation mode, fallback to API response
@@ -103,23 +95,23 @@ const EditRFQ = () => {
         });
 
         setRfqChannels(
-          rfqChannelsResponse.data.map((channel) => ({
+          referenceData.rfq_channels.map((channel) => ({
             value: channel.channel_name,
             label: channel.channel_name,
           }))
         );
         setItems(
-          itemsResponse.data.length
-            ? itemsResponse.data.map((item) => item.name)
+          referenceData.items.length
+            ? referenceData.items.map((item) => item.name)
             : ["Default Item"]
         );
         setUnits(
-          unitsResponse.data.length
-            ? unitsResponse.data.map((unit) => unit.name)
+          referenceData.units.length
+            ? referenceData.units.map((unit) => unit.name)
             : ["Unit", "Piece", "Box"]
         );
         setTeamMembers(
-          teamResponse.data.map((member) => ({
+          referenceData.teams.map((member) => ({
             value: String(member.id),
             label: `${member.name} (${member.designation})`,
           }))
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ItemConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'item'
+
+    def ready(self):
+        from backend.cache import invalidate_on_change
+        from .models import Item, Unit
+
+        invalidate_on_change(Item, 'items')
+        invalidate_on_change(Unit, 'units')
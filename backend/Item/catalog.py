@@ -0,0 +1,37 @@
+from functools import reduce
+from operator import or_
+from django.db.models import Q
+from .models import Item, Unit
+
+def normalize_name(value):
+    return ' '.join((value or '').split()).lower()
+
+def name_lookup(names):
+    # iexact on the raw and whitespace-collapsed spellings, so case and spacing
+    # differences match on every backend, not only under MySQL's CI collations.
+    spellings = {spelling for name in names for spelling in (name.strip(), ' '.join(name.split())) if spelling}
+    return reduce(or_, (Q(name__iexact=spelling) for spelling in spellings))
+
+def resolve_catalog(items_data, prefill_price=True):
+    """Link item dicts to catalog Item/Unit rows and prefill missing prices, in one query per catalog."""
+    item_names = {item.get('item_name') for item in items_data if normalize_name(item.get('item_name'))}
+    unit_names = {item.get('unit') for item in items_data if normalize_name(item.get('unit'))}
+    catalog_items = {
+        normalize_name(item.name): item
+        for item in Item.objects.filter(name_lookup(item_names)).only('id', 'name', 'price')
+    } if item_names else {}
+    catalog_units = {
+        normalize_name(unit.name): unit
+        for unit in Unit.objects.filter(name_lookup(unit_names)).only('id', 'name')
+    } if unit_names else {}
+
+    for item_data in items_data:
+        catalog_item = item_data.get('catalog_item') or catalog_items.get(normalize_name(item_data.get('item_name')))
+        if catalog_item:
+            item_data['catalog_item'] = catalog_item
+            if prefill_price and item_data.get('unit_price') is None:
+                item_data['unit_price'] = catalog_item.price
+        catalog_unit = item_data.get('catalog_unit') or catalog_units.get(normalize_name(item_data.get('unit')))
+        if catalog_unit:
+            item_data['catalog_unit'] = catalog_unit
+    return items_data
@@ -0,0 +1,140 @@
+import csv
+from decimal import Decimal, InvalidOperation
+from django.db import connection, transaction
+from backend.cache import bump_namespace
+from .models import Item, Unit
+
+MAX_REPORTED_REJECTIONS = 100
+
+CATALOGS = {
+    'item': {'model': Item, 'namespace': 'items', 'columns': ('name', 'price')},
+    'unit': {'model': Unit, 'namespace': 'units', 'columns': ('name',)},
+}
+
+class ImportReport:
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.rejected = 0
+        self.rejections = []
+
+    def reject(self, line, reason):
+        self.rejected += 1
+        if len(self.rejections) < MAX_REPORTED_REJECTIONS:
+            self.rejections.append({'line': line, 'reason': reason})
+
+    def as_dict(self):
+        return {
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'rejected': self.rejected,
+            'rejections': self.rejections,
+        }
+
+class ImportAborted(ValueError):
+    """The file became unreadable part way through; ``report`` covers the batches already saved."""
+
+    def __init__(self, message, report):
+        super().__init__(message)
+        self.report = report
+
+def parse_price(value):
+    value = (value or '').strip()
+    if not value:
+        return None
+    price = Decimal(value.replace(',', ''))
+    if not price.is_finite() or price < 0:
+        raise InvalidOperation
+    price = price.quantize(Decimal('0.01'))
+    if len(price.as_tuple().digits) > Item._meta.get_field('price').max_digits:
+        raise InvalidOperation
+    return price
+
+def clean_row(catalog, row):
+    name = ' '.join((row.get('name') or '').split())
+    if not name:
+        raise ValueError("name is required")
+    max_length = catalog['model']._meta.get_field('name').max_length
+    if len(name) > max_length:
+        raise ValueError(f"name is longer than {max_length} characters")
+    values = {'name': name}
+    if 'price' in catalog['columns']:
+        try:
+            values['price'] = parse_price(row.get('price'))
+        except InvalidOperation:
+            raise ValueError(f"invalid price {row.get('price')!r}")
+    return values
+
+def import_catalog(kind, lines, on_conflict='update', batch_size=1000):
+    """
+    Stream CSV ``lines`` (any iterable of text lines with a header row) into the Item or
+    Unit catalog. Rows are upserted ``batch_size`` at a time keyed on the unique name, so
+    memory stays flat however large the file is. ``on_conflict='skip'`` leaves existing
+    rows untouched. Returns an ImportReport.
+
+    Each batch commits on its own. If the file turns out to be malformed or not UTF-8 part
+    way through, the rows read so far are saved and ImportAborted carries their counts.
+    """
+    catalog = CATALOGS[kind]
+    report = ImportReport()
+    reader = csv.DictReader(lines)
+    batch = {}
+    try:
+        if reader.fieldnames is None or 'name' not in [field.strip().lower() for field in reader.fieldnames]:
+            raise ValueError("The CSV needs a header row with a 'name' column.")
+        reader.fieldnames = [field.strip().lower() for field in reader.fieldnames]
+
+        for row in reader:
+            try:
+                values = clean_row(catalog, row)
+            except ValueError as exc:
+                report.reject(reader.line_num, str(exc))
+                continue
+            if values['name'] in batch:
+                report.reject(batch[values['name']][0], f"superseded by line {reader.line_num}")
+            batch[values['name']] = (reader.line_num, values)
+            if len(batch) >= batch_size:
+                upsert_batch(catalog, batch, on_conflict, report)
+                batch = {}
+        if batch:
+            upsert_batch(catalog, batch, on_conflict, report)
+    except (csv.Error, UnicodeDecodeError) as exc:
+        if batch:
+            upsert_batch(catalog, batch, on_conflict, report)
+        raise ImportAborted(f"Could not read the CSV after line {reader.line_num}: {exc}", report) from exc
+    finally:
+        # bulk_create skips post_save, so the namespace is bumped here, also for batches
+        # saved before a failure.
+        if report.inserted or report.updated:
+            transaction.on_commit(lambda: bump_namespace(catalog['namespace']))
+    return report
+
+def upsert_batch(catalog, batch, on_conflict, report):
+    model = catalog['model']
+    update_fields = [column for column in catalog['columns'] if column != 'name']
+    existing = model.objects.filter(name__in=list(batch)).in_bulk(field_name='name')
+    to_write = []
+    for name, (line, values) in batch.items():
+        current = existing.get(name)
+        if current is None:
+            report.inserted += 1
+        elif on_conflict == 'skip' or all(getattr(current, field) == values[field] for field in update_fields):
+            report.unchanged += 1
+            continue
+        else:
+            report.updated += 1
+        to_write.append(model(**values))
+    if not to_write:
+        return
+
+    with transaction.atomic():
+        if on_conflict == 'skip' or not update_fields:
+            # Rows inserted concurrently since the lookup above are left alone.
+            model.objects.bulk_create(to_write, ignore_conflicts=True)
+        else:
+            options = {'update_conflicts': True, 'update_fields': update_fields}
+            if connection.features.supports_update_conflicts_with_target:
+                options['unique_fields'] = ['name']
+            model.objects.bulk_create(to_write, **options)
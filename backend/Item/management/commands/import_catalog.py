@@ -0,0 +1,31 @@
+import json
+import time
+from django.core.management.base import BaseCommand, CommandError
+from item.importer import CATALOGS, import_catalog
+
+class Command(BaseCommand):
+    help = "Stream a CSV file into the Item or Unit catalog, upserting on name."
+
+    def add_arguments(self, parser):
+        parser.add_argument('catalog', choices=sorted(CATALOGS))
+        parser.add_argument('path')
+        parser.add_argument('--on-conflict', choices=['update', 'skip'], default='update')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--encoding', default='utf-8-sig')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            with open(options['path'], encoding=options['encoding'], newline='') as handle:
+                report = import_catalog(
+                    options['catalog'], handle,
+                    on_conflict=options['on_conflict'], batch_size=options['batch_size'],
+                )
+        except (OSError, ValueError, UnicodeDecodeError) as exc:
+            raise CommandError(str(exc))
+        elapsed = time.perf_counter() - started
+        result = report.as_dict()
+        rows = report.inserted + report.updated + report.unchanged + report.rejected
+        result['seconds'] = round(elapsed, 2)
+        result['rows_per_second'] = round(rows / elapsed, 1) if elapsed else None
+        self.stdout.write(json.dumps(result, indent=2))
@@ -13,4 +13,4 @@ class Unit(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
@@ -1,3 +1,72 @@
+from decimal import Decimal
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from .catalog import resolve_catalog
+from .importer import import_catalog
+from .models import Item, Unit
 
-# Create your tests here.
+class ResolveCatalogTests(TestCase):
+    def setUp(self):
+        self.gauge = Item.objects.create(name='Pressure Gauge', price=Decimal('12.50'))
+        self.unit = Unit.objects.create(name='Nos')
+
+    def test_matches_names_differing_in_case_and_whitespace(self):
+        items = [{'item_name': '  pressure   GAUGE ', 'unit': 'NOS'}, {'item_name': 'Unknown', 'unit': ' '}]
+        with self.assertNumQueries(2):
+            resolve_catalog(items)
+        self.assertEqual(items[0]['catalog_item'], self.gauge)
+        self.assertEqual(items[0]['unit_price'], Decimal('12.50'))
+        self.assertEqual(items[0]['catalog_unit'], self.unit)
+        self.assertNotIn('catalog_item', items[1])
+        self.assertNotIn('catalog_unit', items[1])
+
+    def test_explicit_price_is_kept(self):
+        items = [{'item_name': 'pressure gauge', 'unit_price': Decimal('9.00')}]
+        resolve_catalog(items)
+        self.assertEqual(items[0]['unit_price'], Decimal('9.00'))
+
+class CatalogImportTests(TestCase):
+    def setUp(self):
+        Item.objects.create(name='Pressure Gauge', price=Decimal('12.50'))
+        Item.objects.create(name='Valve', price=Decimal('4.00'))
+
+    def test_update_mode_overwrites_changed_prices(self):
+        lines = ['name,price', 'Pressure  Gauge,15.00', 'Valve,4.00', 'Thermometer,"1,200.5"', ',3', 'Pump,abc']
+        with mock.patch('item.importer.bump_namespace') as bump, self.captureOnCommitCallbacks(execute=True):
+            report = import_catalog('item', lines, batch_size=2).as_dict()
+        self.assertEqual((report['inserted'], report['updated'], report['unchanged'], report['rejected']), (1, 1, 1, 2))
+        self.assertEqual([rejection['line'] for rejection in report['rejections']], [5, 6])
+        self.assertEqual(Item.objects.get(name='Pressure Gauge').price, Decimal('15.00'))
+        self.assertEqual(Item.objects.get(name='Thermometer').price, Decimal('1200.50'))
+        bump.assert_called_once_with('items')
+
+    def test_skip_mode_leaves_existing_rows(self):
+        lines = ['Name,Price', 'Pressure Gauge,99.00', 'Thermometer,8']
+        report = import_catalog('item', lines, on_conflict='skip').as_dict()
+        self.assertEqual((report['inserted'], report['updated'], report['unchanged']), (1, 0, 1))
+        self.assertEqual(Item.objects.get(name='Pressure Gauge').price, Decimal('12.50'))
+        self.assertEqual(Item.objects.get(name='Thermometer').price, Decimal('8.00'))
+
+    def test_unit_import_and_missing_header(self):
+        report = import_catalog('unit', ['name', 'Nos', 'Box', 'Nos']).as_dict()
+        self.assertEqual((report['inserted'], report['rejected']), (2, 1))
+        with self.assertRaises(ValueError):
+            import_catalog('unit', ['label', 'Nos'])
+
+    def upload(self, content):
+        return self.client.post('/api/items/import/', {'file': SimpleUploadedFile('items.csv', content)})
+
+    def test_malformed_file_returns_400_with_partial_counts(self):
+        content = b'name,price\nThermometer,8\n"' + b'x' * 200000 + b'",1\n'
+        with mock.patch('item.importer.bump_namespace') as bump, self.captureOnCommitCallbacks(execute=True):
+            response = self.upload(content)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('after line 2', response.json()['error'])
+        self.assertEqual(response.json()['inserted'], 1)
+        self.assertTrue(Item.objects.filter(name='Thermometer').exists())
+        bump.assert_called_once_with('items')
+
+    def test_non_utf8_file_returns_400(self):
+        response = self.upload('name\nCafé'.encode('latin-1'))
+        self.assertEqual(response.status_code, 400)
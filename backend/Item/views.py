@@ -1,11 +1,42 @@
-from rest_framework import viewsets
+import io
+from rest_framework import viewsets, status
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny
 from .models import  Item, Unit
 from .serializers import  ItemSerializer, UnitSerializer
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.db.models import Count, Sum
+from quotation.models import QuotationItem
+from backend.cache import CachedResponseMixin
+from .importer import ImportAborted, import_catalog
 
-class ItemViewSet(viewsets.ModelViewSet):
+class CatalogImportMixin:
+    catalog_kind = None
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser])
+    def import_csv(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': "Upload the CSV as the 'file' field."}, status=status.HTTP_400_BAD_REQUEST)
+        on_conflict = request.query_params.get('on_conflict', 'update')
+        if on_conflict not in ('update', 'skip'):
+            return Response({'error': "on_conflict must be 'update' or 'skip'."}, status=status.HTTP_400_BAD_REQUEST)
+        # Large uploads are spooled to disk by Django; the wrapper reads them line by line.
+        lines = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            report = import_catalog(self.catalog_kind, lines, on_conflict=on_conflict)
+        except ImportAborted as exc:
+            return Response({'error': str(exc), **exc.report.as_dict()}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report.as_dict())
+
+class ItemViewSet(CatalogImportMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ('items',)
+    catalog_kind = 'item'
     queryset = Item.objects.all()
     serializer_class = ItemSerializer
     permission_classes = [AllowAny]  
@@ -13,7 +44,31 @@ class ItemViewSet(viewsets.ModelViewSet):
     search_fields = ['name'] 
     filterset_fields = ['name']
 
-class UnitViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=['get'], url_path='most-quoted')
+    def most_quoted(self, request):
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), 100)
+        except ValueError:
+            limit = 10
+        rows = (
+            QuotationItem.objects.filter(catalog_item__isnull=False)
+            .values('catalog_item', 'catalog_item__name')
+            .annotate(times_quoted=Count('id'), total_quantity=Sum('quantity'))
+            .order_by('-times_quoted')[:limit]
+        )
+        return Response([
+            {
+                'id': row['catalog_item'],
+                'name': row['catalog_item__name'],
+                'times_quoted': row['times_quoted'],
+                'total_quantity': row['total_quantity'],
+            }
+            for row in rows
+        ])
+
+class UnitViewSet(CatalogImportMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ('units',)
+    catalog_kind = 'unit'
     queryset = Unit.objects.all()
     serializer_class = UnitSerializer
     permission_classes = [AllowAny]
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class TeamConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'team'
+
+    def ready(self):
+        from backend.cache import invalidate_on_change
+        from .models import TeamMember
+
+        invalidate_on_change(TeamMember, 'teams')
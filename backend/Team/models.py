@@ -10,4 +10,4 @@ class TeamMember(models.Model):
         return f"{self.name} - {self.designation}"
 
     class Meta:
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
@@ -2,8 +2,10 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from .models import TeamMember
 from .serializers import TeamMemberSerializer
+from backend.cache import CachedResponseMixin
 
-class TeamMemberViewSet(viewsets.ModelViewSet):
+class TeamMemberViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ('teams',)
     queryset = TeamMember.objects.all()
     serializer_class = TeamMemberSerializer
     permission_classes = [AllowAny]
\ No newline at end of file
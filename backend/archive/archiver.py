@@ -0,0 +1,116 @@
+from datetime import timedelta
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from rfq.models import RFQ
+from rfq.serializers import RFQSerializer
+from quotation.models import Quotation
+from quotation.serializers import QuotationSerializer
+from .models import ArchivedRecord
+
+def work_order_model():
+    if apps.is_installed('job_execution'):
+        return apps.get_model('job_execution', 'WorkOrder')
+    return None
+
+def retention_cutoff(days=None):
+    if days is None:
+        days = getattr(settings, 'ARCHIVE_RETENTION_DAYS', 730)
+    return timezone.now() - timedelta(days=days)
+
+def still_open(queryset, closed_statuses, cutoff):
+    return queryset.filter(~Q(current_status__in=closed_statuses) | Q(created_at__gte=cutoff))
+
+def archivable_rfqs(cutoff):
+    """
+    Completed RFQs created before ``cutoff`` whose quotations and work orders are all
+    closed and also older than ``cutoff``. An RFQ is archived together with everything
+    under it, so one open quotation keeps the whole tree hot.
+    """
+    quotations = Quotation.objects.filter(rfq=OuterRef('pk'))
+    queryset = RFQ.objects.filter(current_status='Completed', created_at__lt=cutoff).exclude(
+        Exists(still_open(quotations, getattr(settings, 'ARCHIVE_QUOTATION_STATUSES', ('PO Created',)), cutoff))
+    )
+    WorkOrder = work_order_model()
+    if WorkOrder is not None:
+        work_orders = WorkOrder.objects.filter(quotation__rfq=OuterRef('pk'))
+        queryset = queryset.exclude(
+            Exists(still_open(work_orders, getattr(settings, 'ARCHIVE_WORK_ORDER_STATUSES', ('Closed',)), cutoff))
+        )
+    return queryset
+
+def archive_batch(rfq_ids, cutoff):
+    """
+    Move one batch of RFQ trees to the archive in a single transaction. Eligibility is
+    re-checked under row locks, so a record reopened since it was selected stays hot.
+    """
+    counts = {'rfqs': 0, 'quotations': 0, 'work_orders': 0, 'bytes': 0}
+    with transaction.atomic():
+        locked = list(archivable_rfqs(cutoff).filter(pk__in=rfq_ids).select_for_update().values_list('pk', flat=True))
+        if not locked:
+            return counts
+        rfqs = RFQ.objects.filter(pk__in=locked).select_related('assign_to').prefetch_related('items')
+        rfq_numbers = {}
+        records = []
+        for rfq in rfqs:
+            rfq_numbers[rfq.pk] = rfq.rfq_no or ''
+            records.append(archived(rfq, 'rfq', rfq.rfq_no, rfq.pk, rfq.rfq_no, RFQSerializer(rfq).data))
+        quotations = Quotation.objects.filter(rfq_id__in=locked).prefetch_related('items', 'purchase_order__items')
+        for quotation in quotations:
+            records.append(archived(
+                quotation, 'quotation', quotation.quotation_no, quotation.rfq_id, rfq_numbers[quotation.rfq_id],
+                QuotationSerializer(quotation).data,
+            ))
+        WorkOrder = work_order_model()
+        if WorkOrder is not None:
+            from job_execution.serializers import WorkOrderSerializer
+            work_orders = WorkOrder.objects.filter(quotation__rfq_id__in=locked).select_related('quotation').prefetch_related('items')
+            for work_order in work_orders:
+                rfq_id = work_order.quotation.rfq_id
+                records.append(archived(
+                    work_order, 'work_order', work_order.work_order_no, rfq_id, rfq_numbers[rfq_id],
+                    WorkOrderSerializer(work_order).data,
+                ))
+
+        ArchivedRecord.objects.bulk_create(records)
+        # Items, purchase orders and work orders go with their RFQ through on_delete=CASCADE.
+        RFQ.objects.filter(pk__in=locked).delete()
+
+    for record in records:
+        counts[f'{record.kind}s'] += 1
+        counts['bytes'] += len(record.payload)
+    return counts
+
+def archived(instance, kind, number, rfq_id, rfq_no, data):
+    return ArchivedRecord(
+        kind=kind, number=number or '', source_id=instance.pk, rfq_source_id=rfq_id, rfq_no=rfq_no or '',
+        created_at=instance.created_at, payload=ArchivedRecord.pack(data),
+    )
+
+def archive_closed(retention_days=None, batch_size=None, limit=None, dry_run=False):
+    """
+    Archive every eligible RFQ tree in batches of ``batch_size`` RFQs, stopping after
+    ``limit`` RFQs if given. Returns counts of archived RFQs, quotations and work orders.
+    """
+    cutoff = retention_cutoff(retention_days)
+    batch_size = batch_size or getattr(settings, 'ARCHIVE_BATCH_SIZE', 200)
+    report = {'cutoff': cutoff.isoformat(), 'batches': 0, 'rfqs': 0, 'quotations': 0, 'work_orders': 0, 'bytes': 0}
+    candidates = archivable_rfqs(cutoff).order_by('pk')
+    if dry_run:
+        report['rfqs'] = candidates.count() if limit is None else min(candidates.count(), limit)
+        return report
+
+    last_pk = 0
+    while limit is None or report['rfqs'] < limit:
+        size = batch_size if limit is None else min(batch_size, limit - report['rfqs'])
+        ids = list(candidates.filter(pk__gt=last_pk).values_list('pk', flat=True)[:size])
+        if not ids:
+            break
+        last_pk = ids[-1]
+        counts = archive_batch(ids, cutoff)
+        report['batches'] += 1
+        for key, value in counts.items():
+            report[key] += value
+    return report
@@ -0,0 +1,24 @@
+import json
+from django.core.management.base import BaseCommand
+from archive.archiver import archive_closed
+
+class Command(BaseCommand):
+    help = (
+        "Move completed RFQs older than the retention window, with their quotations, purchase "
+        "orders and work orders, into the compressed archive in batched transactions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-days', type=int, help="Defaults to settings.ARCHIVE_RETENTION_DAYS.")
+        parser.add_argument('--batch-size', type=int, help="RFQs per transaction; defaults to settings.ARCHIVE_BATCH_SIZE.")
+        parser.add_argument('--limit', type=int, help="Stop after archiving this many RFQs.")
+        parser.add_argument('--dry-run', action='store_true', help="Only count the RFQs that would be archived.")
+
+    def handle(self, *args, **options):
+        report = archive_closed(
+            retention_days=options['retention_days'],
+            batch_size=options['batch_size'],
+            limit=options['limit'],
+            dry_run=options['dry_run'],
+        )
+        self.stdout.write(json.dumps(report, indent=2))
@@ -0,0 +1,46 @@
+import re
+import zlib
+import orjson
+from django.db import models
+from django.db.models import Max
+from backend.renderers import ORJSONRenderer
+
+class ArchivedRecord(models.Model):
+    """
+    Cold copy of a closed RFQ, quotation or work order. ``payload`` is the record's API
+    representation (with its items and purchase orders) as zlib-compressed JSON.
+    """
+    KIND_CHOICES = [('rfq', 'RFQ'), ('quotation', 'Quotation'), ('work_order', 'Work Order')]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    number = models.CharField(max_length=100, blank=True)
+    source_id = models.BigIntegerField()
+    # The RFQ the record was archived with. Numbers can repeat, ids cannot.
+    rfq_source_id = models.BigIntegerField(null=True, db_index=True)
+    rfq_no = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    payload = models.BinaryField()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['kind', 'source_id'], name='archive_kind_source_id')]
+        indexes = [models.Index(fields=['kind', 'number'], name='archive_kind_number')]
+
+    def __str__(self):
+        return f"Archived {self.get_kind_display()} {self.number or self.source_id}"
+
+    @classmethod
+    def last_sequence(cls, kind, prefix):
+        """Highest sequence among archived numbers of the form <prefix><digits>, or 0."""
+        latest = cls.objects.filter(
+            kind=kind, number__regex=rf'^{re.escape(prefix)}[0-9]+$',
+        ).aggregate(Max('number'))['number__max']
+        return int(latest[len(prefix):]) if latest else 0
+
+    @classmethod
+    def pack(cls, data):
+        return zlib.compress(ORJSONRenderer().render(data))
+
+    @property
+    def data(self):
+        return orjson.loads(zlib.decompress(self.payload))
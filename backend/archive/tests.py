@@ -0,0 +1,181 @@
+import json
+from datetime import date, timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from job_execution.models import WorkOrder, WorkOrderItem
+from quotation.models import PurchaseOrder, Quotation, QuotationItem
+from rfq.models import RFQ, RFQItem
+from series.models import NumberSeries
+from .archiver import archivable_rfqs, archive_batch, retention_cutoff
+from .models import ArchivedRecord
+
+def backdate(instance, days):
+    type(instance).objects.filter(pk=instance.pk).update(created_at=timezone.now() - timedelta(days=days))
+
+def build_tree(number, age=1000, quotation_status='PO Created', work_order_status='Closed', quotation_age=None):
+    """A completed RFQ with one quotation, purchase order and work order, all ``age`` days old."""
+    rfq = RFQ.objects.create(company_name='Acme', rfq_no=f'RFQ-{number:07d}', current_status='Completed')
+    RFQItem.objects.create(rfq=rfq, item_name='Gauge', quantity=2, unit_price='12.50')
+    quotation = Quotation.objects.create(quotation_no=f'QT-{number:07d}', rfq=rfq, company_name='Acme', current_status=quotation_status)
+    QuotationItem.objects.create(quotation=quotation, item_name='Gauge', quantity=2, unit_price='12.50', total_price='25.00')
+    purchase_order = PurchaseOrder.objects.create(quotation=quotation, client_po_number=f'PO-{number}', order_type='full')
+    work_order = WorkOrder.objects.create(
+        work_order_no=f'WO-{number:07d}', quotation=quotation, purchase_order=purchase_order,
+        date_received=date(2022, 1, 10), current_status=work_order_status,
+    )
+    WorkOrderItem.objects.create(work_order=work_order, item_name='Gauge', quantity=2)
+    for instance in (rfq, purchase_order, work_order):
+        backdate(instance, age)
+    backdate(quotation, age if quotation_age is None else quotation_age)
+    return rfq, quotation, work_order
+
+class EligibilityTests(TestCase):
+    def test_open_records_keep_the_tree_hot(self):
+        closed, _, _ = build_tree(1)
+        build_tree(2, quotation_status='Pending')
+        build_tree(3, work_order_status='In Progress')
+        build_tree(4, quotation_age=10)
+        build_tree(5, age=10)
+        RFQ.objects.filter(rfq_no='RFQ-0000005').update(current_status='Processing')
+        self.assertEqual(list(archivable_rfqs(retention_cutoff()).values_list('pk', flat=True)), [closed.pk])
+
+    def test_eligibility_is_rechecked_under_the_lock(self):
+        rfq, quotation, _ = build_tree(1)
+        cutoff = retention_cutoff()
+        ids = list(archivable_rfqs(cutoff).values_list('pk', flat=True))
+        Quotation.objects.filter(pk=quotation.pk).update(current_status='Pending')
+        counts = archive_batch(ids, cutoff)
+        self.assertEqual(counts['rfqs'], 0)
+        self.assertTrue(RFQ.objects.filter(pk=rfq.pk).exists())
+        self.assertFalse(ArchivedRecord.objects.exists())
+
+    def test_batch_moves_the_whole_tree(self):
+        rfq, quotation, work_order = build_tree(1)
+        counts = archive_batch([rfq.pk], retention_cutoff())
+        self.assertEqual((counts['rfqs'], counts['quotations'], counts['work_orders']), (1, 1, 1))
+        self.assertFalse(RFQ.objects.exists())
+        self.assertFalse(WorkOrder.objects.exists())
+        self.assertEqual(
+            set(ArchivedRecord.objects.values_list('kind', 'source_id', 'rfq_source_id')),
+            {('rfq', rfq.pk, rfq.pk), ('quotation', quotation.pk, rfq.pk), ('work_order', work_order.pk, rfq.pk)},
+        )
+
+class ArchiveCommandTests(TestCase):
+    def setUp(self):
+        self.rfqs = [build_tree(number)[0] for number in (1, 2, 3)]
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('archive_records', *args, stdout=out)
+        return json.loads(out.getvalue())
+
+    def test_dry_run_only_counts(self):
+        report = self.run_command('--dry-run')
+        self.assertEqual((report['rfqs'], report['batches']), (3, 0))
+        self.assertEqual(self.run_command('--dry-run', '--limit', '2')['rfqs'], 2)
+        self.assertEqual(RFQ.objects.count(), 3)
+        self.assertFalse(ArchivedRecord.objects.exists())
+
+    def test_limit_stops_after_that_many_rfqs(self):
+        report = self.run_command('--limit', '2', '--batch-size', '1')
+        self.assertEqual((report['rfqs'], report['quotations'], report['work_orders'], report['batches']), (2, 2, 2, 2))
+        self.assertGreater(report['bytes'], 0)
+        self.assertEqual(list(RFQ.objects.values_list('pk', flat=True)), [self.rfqs[2].pk])
+
+    def test_retention_days_moves_the_cutoff(self):
+        self.assertEqual(self.run_command('--retention-days', '2000')['rfqs'], 0)
+        self.assertEqual(RFQ.objects.count(), 3)
+
+class ArchiveLookupTests(TestCase):
+    def lookup(self, kind, number, **params):
+        return self.client.get(f'/api/archive/{kind}/{number}/', params)
+
+    def test_payload_round_trips_the_api_representation(self):
+        rfq, quotation, work_order = build_tree(1)
+        before = {
+            'rfq': self.client.get(f'/api/add-rfqs/{rfq.pk}/').json(),
+            'quotation': self.client.get(f'/api/quotations/{quotation.pk}/').json(),
+            'work_order': self.client.get(f'/api/work-orders/{work_order.pk}/').json(),
+        }
+        archive_batch([rfq.pk], retention_cutoff())
+        for record in ArchivedRecord.objects.all():
+            self.assertEqual(record.data, before[record.kind], record.kind)
+        self.assertEqual(self.lookup('quotations', 'QT-0000001').json()['record'], before['quotation'])
+
+    def test_read_through_prefers_the_live_record(self):
+        build_tree(1)
+        response = self.lookup('rfqs', 'RFQ-0000001')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['archived'])
+        self.assertEqual(response.json()['record']['rfq_no'], 'RFQ-0000001')
+
+    def test_archived_record_lists_its_tree(self):
+        rfq, quotation, work_order = build_tree(1)
+        archive_batch([rfq.pk], retention_cutoff())
+        body = self.lookup('work-orders', 'WO-0000001').json()
+        self.assertTrue(body['archived'])
+        self.assertEqual(body['source_id'], work_order.pk)
+        self.assertEqual(body['record']['work_order_no'], 'WO-0000001')
+        self.assertEqual(body['related'], [
+            {'kind': 'quotation', 'number': 'QT-0000001', 'source_id': quotation.pk},
+            {'kind': 'rfq', 'number': 'RFQ-0000001', 'source_id': rfq.pk},
+        ])
+
+    def test_unknown_kind_or_number(self):
+        self.assertEqual(self.lookup('invoices', 'X-1').status_code, 404)
+        self.assertEqual(self.lookup('rfqs', 'RFQ-9999999').status_code, 404)
+        self.assertEqual(self.lookup('rfqs', 'RFQ-9999999', source_id='abc').status_code, 400)
+
+class NumberReuseTests(TestCase):
+    def setUp(self):
+        self.rfq, self.quotation, self.work_order = build_tree(5)
+        archive_batch([self.rfq.pk], retention_cutoff())
+
+    def test_new_quotation_and_work_order_numbers_skip_archived_ones(self):
+        rfq = RFQ.objects.create(company_name='Globex', rfq_no='RFQ-0000006', current_status='Completed')
+        response = self.client.post('/api/quotations/', {
+            'rfq': rfq.pk, 'items': [{'item_name': 'Gauge', 'quantity': 1, 'unit_price': '5.00'}],
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()['quotation_no'], 'QT-0000006')
+        response = self.client.post('/api/work-orders/', {
+            'quotation': response.json()['id'], 'date_received': '2024-01-10',
+            'items': [{'item_name': 'Gauge', 'quantity': 1}],
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()['work_order_no'], 'WO-0000006')
+
+    def test_renumbering_a_series_starts_after_archived_numbers(self):
+        series = NumberSeries.objects.create(series_name='RFQ', prefix='RFQ', current_sequence=7)
+        first = RFQ.objects.create(company_name='A', rfq_no='RFQ-0000006', series=series)
+        second = RFQ.objects.create(company_name='B', rfq_no='RFQ-0000007', series=series)
+        self.assertEqual(self.client.delete(f'/api/add-rfqs/{first.pk}/').status_code, 204)
+        second.refresh_from_db()
+        series.refresh_from_db()
+        self.assertEqual((second.rfq_no, series.current_sequence), ('RFQ-0000006', 6))
+        self.assertEqual(series.get_next_sequence(), 'RFQ-0000007')
+
+    def test_repeated_numbers_are_listed_and_selectable(self):
+        # Legacy data: a live quotation that reused an archived number.
+        rfq = RFQ.objects.create(company_name='Globex', current_status='Completed')
+        live = Quotation.objects.create(quotation_no='QT-0000005', rfq=rfq)
+        body = self.lookup('QT-0000005').json()
+        self.assertEqual((body['archived'], body['source_id']), (False, live.pk))
+        self.assertEqual([(match['source_id'], match['archived']) for match in body['matches']], [
+            (live.pk, False), (self.quotation.pk, True),
+        ])
+        body = self.lookup('QT-0000005', source_id=self.quotation.pk).json()
+        self.assertEqual((body['archived'], body['source_id']), (True, self.quotation.pk))
+        self.assertEqual(body['record']['rfq'], self.rfq.pk)
+
+    def test_related_records_follow_the_rfq_id_not_its_number(self):
+        other_rfq, _, other_work_order = build_tree(6)
+        RFQ.objects.filter(pk=other_rfq.pk).update(rfq_no='RFQ-0000005')
+        archive_batch([other_rfq.pk], retention_cutoff())
+        body = self.lookup('QT-0000006').json()
+        self.assertEqual({related['source_id'] for related in body['related']}, {other_rfq.pk, other_work_order.pk})
+
+    def lookup(self, number, **params):
+        return self.client.get(f'/api/archive/quotations/{number}/', params)
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import ArchiveLookupView
+
+urlpatterns = [
+    path('archive/<str:kind>/<str:number>/', ArchiveLookupView.as_view(), name='archive-lookup'),
+]
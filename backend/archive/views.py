@@ -0,0 +1,87 @@
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.exceptions import NotFound, ValidationError
+from rfq.serializers import RFQSerializer
+from rfq.views import rfq_queryset
+from quotation.serializers import QuotationSerializer
+from quotation.views import quotation_queryset
+from .archiver import work_order_model
+from .models import ArchivedRecord
+
+KINDS = {'rfqs': 'rfq', 'quotations': 'quotation', 'work-orders': 'work_order'}
+
+def hot_lookup(kind):
+    """Queryset, number field and serializer for the live table of ``kind``."""
+    if kind == 'rfq':
+        return rfq_queryset({}), 'rfq_no', RFQSerializer
+    if kind == 'quotation':
+        return quotation_queryset({}), 'quotation_no', QuotationSerializer
+    WorkOrder = work_order_model()
+    if WorkOrder is None:
+        return None
+    from job_execution.serializers import WorkOrderSerializer
+    return WorkOrder.objects.prefetch_related('items'), 'work_order_no', WorkOrderSerializer
+
+class ArchiveLookupView(APIView):
+    """
+    Read-through lookup by number: the live tables are checked first, then the archive.
+    Numbers are only unique within the live table (older data and renumbered series may
+    repeat an archived number), so every match is listed and ``?source_id=`` picks one.
+    Archived records also list the other archived records of the same RFQ.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, kind, number):
+        if kind not in KINDS:
+            raise NotFound()
+        kind = KINDS[kind]
+        source_id = request.query_params.get('source_id')
+        if source_id is not None and not source_id.isdigit():
+            raise ValidationError({'source_id': 'Must be a record id.'})
+
+        lookup = hot_lookup(kind)
+        hot = None
+        if lookup is not None:
+            queryset, number_field, serializer_class = lookup
+            queryset = queryset.filter(**{number_field: number})
+            hot = (queryset.filter(pk=source_id) if source_id else queryset).first()
+        archived = ArchivedRecord.objects.filter(kind=kind, number=number).defer('payload').order_by('-archived_at')
+        matches = ([{'source_id': hot.pk, 'archived': False, 'archived_at': None}] if hot else []) + [
+            {'source_id': record_id, 'archived': True, 'archived_at': archived_at}
+            for record_id, archived_at in archived.values_list('source_id', 'archived_at')
+        ]
+        if source_id:
+            archived = archived.filter(source_id=source_id)
+
+        if hot is not None:
+            return Response({
+                'kind': kind,
+                'number': number,
+                'source_id': hot.pk,
+                'archived': False,
+                'archived_at': None,
+                'record': serializer_class(hot, context={'request': request}).data,
+                'matches': matches,
+            })
+
+        record = archived.first()
+        if record is None:
+            raise NotFound()
+        related = []
+        if record.rfq_source_id is not None:
+            related = [
+                {'kind': related_kind, 'number': related_number, 'source_id': related_id}
+                for related_kind, related_number, related_id in ArchivedRecord.objects.filter(rfq_source_id=record.rfq_source_id)
+                .exclude(pk=record.pk).order_by('kind', 'number').values_list('kind', 'number', 'source_id')
+            ]
+        return Response({
+            'kind': kind,
+            'number': number,
+            'source_id': record.source_id,
+            'archived': True,
+            'archived_at': record.archived_at,
+            'record': record.data,
+            'matches': matches,
+            'related': related,
+        })
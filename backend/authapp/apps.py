@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AuthappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authapp'
+
+    def ready(self):
+        from django.db.models.signals import post_save, post_delete
+        from .authentication import invalidate_user_cache
+        from .models import CustomUser
+
+        post_save.connect(invalidate_user_cache, sender=CustomUser, dispatch_uid='auth:user-cache:save')
+        post_delete.connect(invalidate_user_cache, sender=CustomUser, dispatch_uid='auth:user-cache:delete')
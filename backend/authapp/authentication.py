@@ -0,0 +1,42 @@
+import copy
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from backend.db.replicas import primary_reads
+from backend.lru_cache import LRUCache
+
+user_cache = LRUCache(
+    max_size=getattr(settings, 'JWT_USER_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'JWT_USER_CACHE_TTL', 30),
+)
+
+def invalidate_cached_user(user):
+    user_cache.delete(str(getattr(user, api_settings.USER_ID_FIELD)))
+
+def invalidate_user_cache(sender, instance, **kwargs):
+    invalidate_cached_user(instance)
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that resolves users from a short-lived in-process cache."""
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        cached = user_cache.get(str(user_id)) if user_id is not None else None
+        if cached is None:
+            with primary_reads():
+                user = super().get_user(validated_token)
+            user_cache.set(str(user_id), user)
+            return copy.copy(user)
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(cached.password):
+            raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+        # Each request gets its own copy so views can mutate request.user safely.
+        return copy.copy(cached)
+
+class TokenClaimsAuthentication(JWTStatelessUserAuthentication):
+    """JWT authentication for endpoints that only need the token claims, never the user row."""
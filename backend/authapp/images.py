@@ -0,0 +1,67 @@
+import logging
+import threading
+from io import BytesIO
+from pathlib import PurePosixPath
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections
+from PIL import Image, ImageOps
+from .models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+def render_variant(source, size):
+    image = source.copy()
+    image.thumbnail((size, size), Image.LANCZOS)
+    output = BytesIO()
+    # Saving from decoded pixels (without passing exif/icc info) drops all metadata.
+    image.save(output, format=settings.PROFILE_IMAGE_FORMAT, quality=settings.PROFILE_IMAGE_QUALITY, method=4)
+    return output.getvalue()
+
+def process_profile_image(user_id):
+    user = CustomUser.objects.only('id', 'image').filter(pk=user_id).first()
+    if user is None or not user.image:
+        return
+    image_name = user.image.name
+    with default_storage.open(image_name, 'rb') as handle:
+        source = ImageOps.exif_transpose(Image.open(handle))
+        source = source.convert('RGBA' if source.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+    directory = f'profile_images/variants/{user_id}'
+    if default_storage.exists(directory):
+        for filename in default_storage.listdir(directory)[1]:
+            default_storage.delete(f'{directory}/{filename}')
+
+    stem = PurePosixPath(image_name).stem
+    extension = settings.PROFILE_IMAGE_FORMAT.lower()
+    variants = {}
+    for name, size in settings.PROFILE_IMAGE_VARIANTS.items():
+        path = f'{directory}/{stem}-{name}.{extension}'
+        variants[name] = default_storage.save(path, ContentFile(render_variant(source, size)))
+
+    # Only record the variants if the user hasn't uploaded another image meanwhile.
+    updated = CustomUser.objects.filter(pk=user_id, image=image_name).update(image_variants=variants)
+    if updated:
+        from .authentication import invalidate_cached_user
+        invalidate_cached_user(user)
+
+def _process_safely(user_id):
+    try:
+        process_profile_image(user_id)
+    except Exception:
+        logger.exception("Failed to process profile image for user %s", user_id)
+
+def _process_in_thread(user_id):
+    try:
+        _process_safely(user_id)
+    finally:
+        # The thread's connections are never closed by the request cycle; without this
+        # each upload would keep a pooled connection checked out.
+        connections.close_all()
+
+def schedule_profile_image_processing(user_id):
+    if settings.PROFILE_IMAGE_PROCESS_ASYNC:
+        threading.Thread(target=_process_in_thread, args=(user_id,), daemon=True).start()
+    else:
+        _process_safely(user_id)
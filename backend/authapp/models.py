@@ -8,9 +8,19 @@ class CustomUser(AbstractUser):
     address = models.TextField(blank=True)
     phone_number = models.CharField(max_length=15, blank=True)
     image = models.ImageField(upload_to='profile_images/', null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
 
     def __str__(self):
-        return self.email
\ No newline at end of file
+        return self.email
+
+class PasswordResetOTP(models.Model):
+    email = models.EmailField(unique=True)
+    code_hash = models.CharField(max_length=64)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"OTP for {self.email}"
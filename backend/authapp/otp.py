@@ -0,0 +1,59 @@
+import logging
+import secrets
+import threading
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db.models import F
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+from .models import PasswordResetOTP
+
+logger = logging.getLogger(__name__)
+
+def hash_otp(email, otp):
+    return salted_hmac('authapp.otp', f'{email.lower()}:{otp}').hexdigest()
+
+def issue_otp(email):
+    otp = f'{secrets.randbelow(10 ** 6):06d}'
+    PasswordResetOTP.objects.update_or_create(
+        email=email.lower(),
+        defaults={
+            'code_hash': hash_otp(email, otp),
+            'attempts': 0,
+            'expires_at': timezone.now() + timedelta(minutes=settings.OTP_TTL_MINUTES),
+        },
+    )
+    return otp
+
+def verify_otp(email, otp):
+    """Check an OTP, consuming it on success. Returns an error message, or None when valid."""
+    entry = PasswordResetOTP.objects.filter(email=email.lower()).first()
+    if entry is None:
+        return 'Invalid OTP'
+    if entry.expires_at < timezone.now():
+        entry.delete()
+        return 'OTP has expired'
+    if entry.attempts >= settings.OTP_MAX_ATTEMPTS:
+        entry.delete()
+        return 'Too many invalid attempts, request a new OTP'
+    if not constant_time_compare(hash_otp(email, otp), entry.code_hash):
+        PasswordResetOTP.objects.filter(pk=entry.pk).update(attempts=F('attempts') + 1)
+        return 'Invalid OTP'
+    entry.delete()
+    return None
+
+def _send_otp_email(email, otp):
+    try:
+        send_mail(
+            subject='Your OTP for Password Reset',
+            message=f'Your OTP is {otp}. It is valid for {settings.OTP_TTL_MINUTES} minutes.',
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=[email],
+            fail_silently=False,
+        )
+    except Exception:
+        logger.exception("Failed to send OTP email to %s", email)
+
+def send_otp_email(email, otp):
+    threading.Thread(target=_send_otp_email, args=(email, otp), daemon=True).start()
@@ -1,5 +1,8 @@
+from django.core.files.storage import default_storage
+from django.db import transaction
 from rest_framework import serializers
 from .models import CustomUser
+from .images import schedule_profile_image_processing
 
 class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField()
@@ -15,16 +18,28 @@ class ResetPasswordSerializer(serializers.Serializer):
 
 class ProfileSerializer(serializers.ModelSerializer):
     image = serializers.ImageField(max_length=None, use_url=True, allow_null=True, required=False)
+    image_variants = serializers.SerializerMethodField()
     
     def validate_image(self, value):
         max_size = 5 * 1024 * 1024 
         if value and value.size > max_size:
             raise serializers.ValidationError('Image size cannot exceed 5MB.')
         return value
+
+    def get_image_variants(self, obj):
+        return {name: default_storage.url(path) for name, path in (obj.image_variants or {}).items()}
+
+    def update(self, instance, validated_data):
+        if 'image' in validated_data:
+            instance.image_variants = {}
+        instance = super().update(instance, validated_data)
+        if 'image' in validated_data and instance.image:
+            transaction.on_commit(lambda: schedule_profile_image_processing(instance.pk))
+        return instance
     
     class Meta:
         model = CustomUser
-        fields = ['email', 'name', 'username', 'address', 'phone_number', 'image']
+        fields = ['email', 'name', 'username', 'address', 'phone_number', 'image', 'image_variants']
         read_only_fields = ['email']
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -1,3 +1,77 @@
-from django.test import TestCase
+import shutil
+import tempfile
+import threading
+from io import BytesIO
+from unittest import mock
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from PIL import Image
+from rest_framework_simplejwt.tokens import AccessToken
+from . import images
+from .authentication import user_cache
+from .models import CustomUser
 
-# Create your tests here.
+def png_upload(size=(400, 300)):
+    output = BytesIO()
+    Image.new('RGB', size, (200, 30, 30)).save(output, format='PNG')
+    return SimpleUploadedFile('avatar.png', output.getvalue(), content_type='image/png')
+
+class ProfileImageTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, PROFILE_IMAGE_PROCESS_ASYNC=False)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.user = CustomUser.objects.create(username='u', email='u@example.com')
+
+    def test_upload_generates_metadata_free_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                '/api/profile/', encode_multipart(BOUNDARY, {'image': png_upload()}), content_type=MULTIPART_CONTENT,
+                HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}',
+            )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(set(self.user.image_variants), {'small', 'medium', 'large'})
+        with default_storage.open(self.user.image_variants['medium'], 'rb') as handle:
+            variant = Image.open(handle)
+            variant.load()
+        self.assertEqual(variant.format, 'WEBP')
+        self.assertEqual(max(variant.size), 128)
+        self.assertNotIn('exif', variant.info)
+
+    def test_background_thread_closes_its_connections(self):
+        thread_closed = []
+        started = []
+        real_thread = threading.Thread
+
+        def start_thread(*args, **kwargs):
+            started.append(real_thread(*args, **kwargs))
+            return started[-1]
+
+        with mock.patch.object(images, 'connections') as connections, \
+                mock.patch.object(images, 'process_profile_image', side_effect=RuntimeError), \
+                mock.patch.object(images.threading, 'Thread', side_effect=start_thread), \
+                override_settings(PROFILE_IMAGE_PROCESS_ASYNC=True), \
+                self.assertLogs('authapp.images', 'ERROR'):
+            connections.close_all.side_effect = lambda: thread_closed.append(threading.current_thread().name)
+            images.schedule_profile_image_processing(self.user.pk)
+            started[0].join(5)
+        self.assertEqual(len(thread_closed), 1)
+        self.assertNotEqual(thread_closed[0], threading.current_thread().name)
+
+class UserCacheTests(TestCase):
+    def test_saving_or_deleting_a_user_drops_the_cached_copy(self):
+        user = CustomUser.objects.create_user(username='cached', email='cached@example.com', password='secret')
+        key = str(user.pk)
+        user_cache.set(key, user)
+        user.name = 'Renamed'
+        user.save()
+        self.assertIsNone(user_cache.get(key))
+
+        user_cache.set(key, user)
+        user.delete()
+        self.assertIsNone(user_cache.get(key))
@@ -1,13 +1,11 @@
-import random
-import string
-from django.core.mail import send_mail
-from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
+from backend.throttling import IPTokenBucketThrottle, AccountTokenBucketThrottle
 from .models import CustomUser
+from .otp import issue_otp, verify_otp, send_otp_email
 from .serializers import (
     LoginSerializer,
     RequestOTPSerializer,
@@ -17,6 +15,9 @@ from .serializers import (
 )
 
 class LoginView(APIView):
+    throttle_classes = [IPTokenBucketThrottle, AccountTokenBucketThrottle]
+    throttle_scope = 'login'
+
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
         if serializer.is_valid():
@@ -36,59 +37,55 @@ class LoginView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class RequestOTPView(APIView):
+    throttle_classes = [IPTokenBucketThrottle, AccountTokenBucketThrottle]
+    throttle_scope = 'otp'
+
     def post(self, request):
         serializer = RequestOTPSerializer(data=request.data)
         if serializer.is_valid():
             email = serializer.validated_data['email']
-            try:
-                user = CustomUser.objects.get(email=email)
-                otp = ''.join(random.choices(string.digits, k=6))
-                user.otp = otp
-                user.save()
-                send_mail(
-                    subject='Your OTP for Password Reset',
-                    message=f'Your OTP is {otp}. It is valid for 10 minutes.',
-                    from_email=settings.EMAIL_HOST_USER,
-                    recipient_list=[email],
-                    fail_silently=False,
-                )
-                return Response(
-                    {'message': 'OTP sent to your email'},
-                    status=status.HTTP_200_OK
-                )
-            except CustomUser.DoesNotExist:
+            if not CustomUser.objects.filter(email=email).exists():
                 return Response(
                     {'error': 'User with this email does not exist'},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            otp = issue_otp(email)
+            send_otp_email(email, otp)
+            return Response(
+                {'message': 'OTP sent to your email'},
+                status=status.HTTP_200_OK
+            )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class ResetPasswordView(APIView):
+    throttle_classes = [IPTokenBucketThrottle, AccountTokenBucketThrottle]
+    throttle_scope = 'otp'
+
     def post(self, request):
         serializer = ResetPasswordSerializer(data=request.data)
         if serializer.is_valid():
             email = serializer.validated_data['email']
             otp = serializer.validated_data['otp']
             new_password = serializer.validated_data['new_password']
-            try:
-                user = CustomUser.objects.get(email=email)
-                if user.otp == otp:
-                    user.set_password(new_password)
-                    user.otp = None
-                    user.save()
-                    return Response(
-                        {'message': 'Password reset successfully'},
-                        status=status.HTTP_200_OK
-                    )
+            error = verify_otp(email, otp)
+            if error:
                 return Response(
-                    {'error': 'Invalid OTP'},
+                    {'error': error},
                     status=status.HTTP_400_BAD_REQUEST
                 )
+            try:
+                user = CustomUser.objects.only('id', 'password').get(email=email)
             except CustomUser.DoesNotExist:
                 return Response(
                     {'error': 'User with this email does not exist'},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            user.set_password(new_password)
+            user.save(update_fields=['password'])
+            return Response(
+                {'message': 'Password reset successfully'},
+                status=status.HTTP_200_OK
+            )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class ProfileView(APIView):
@@ -0,0 +1,46 @@
+from functools import wraps
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException, AuthenticationFailed, MethodNotAllowed, NotAuthenticated, NotFound
+from authapp.authentication import TokenClaimsAuthentication
+from .renderers import ORJSONRenderer
+
+def json_response(data, status=200, **kwargs):
+    return HttpResponse(ORJSONRenderer().render(data), status=status, content_type='application/json', **kwargs)
+
+def async_read_view(view):
+    """
+    Wraps an ``async def`` view for the read-only async API: GET/HEAD only, optional
+    stateless JWT authentication (no database hit) and DRF-shaped error bodies.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        authenticator = TokenClaimsAuthentication()
+        try:
+            if request.method not in ('GET', 'HEAD'):
+                raise MethodNotAllowed(request.method)
+            user_auth = authenticator.authenticate(request)
+            if user_auth is not None:
+                request.user, request.auth = user_auth
+            return await view(request, *args, **kwargs)
+        except APIException as exc:
+            headers = {}
+            if isinstance(exc, MethodNotAllowed):
+                headers['Allow'] = 'GET, HEAD'
+            if isinstance(exc, (AuthenticationFailed, NotAuthenticated)):
+                headers['WWW-Authenticate'] = authenticator.authenticate_header(request)
+            data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            return json_response(data, status=exc.status_code, headers=headers)
+    return wrapper
+
+async def serialize_many(serializer_class, queryset, context=None):
+    # Related rows must be select_related/prefetch_related on the queryset: serializers
+    # run on the event loop, where a lazy relation lookup raises SynchronousOnlyOperation.
+    instances = [instance async for instance in queryset]
+    return serializer_class(instances, many=True, context=context or {}).data
+
+async def serialize_one(serializer_class, queryset, context=None, **lookup):
+    try:
+        instance = await queryset.aget(**lookup)
+    except queryset.model.DoesNotExist:
+        raise NotFound()
+    return serializer_class(instance, context=context or {}).data
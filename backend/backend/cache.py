@@ -0,0 +1,90 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from rest_framework.response import Response
+from .db.replicas import primary_reads
+
+def namespace_key(namespace):
+    return f'ns:{namespace}'
+
+def namespace_versions(namespaces):
+    keys = [namespace_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, 1, None)
+            versions[key] = cache.get(key, 1)
+    return [versions[key] for key in keys]
+
+async def anamespace_versions(namespaces):
+    keys = [namespace_key(namespace) for namespace in namespaces]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, 1, None)
+            versions[key] = await cache.aget(key, 1)
+    return [versions[key] for key in keys]
+
+def bump_namespace(namespace):
+    key = namespace_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, None)
+        cache.incr(key)
+
+def invalidate_on_change(model, *namespaces, ignore_fields=()):
+    """
+    Bump the given cache namespaces after any committed save or delete of ``model``.
+    Saves limited by ``update_fields`` to ``ignore_fields`` leave the namespaces alone.
+    """
+    ignore_fields = frozenset(ignore_fields)
+
+    def handler(sender, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields and ignore_fields.issuperset(update_fields):
+            return
+        for namespace in namespaces:
+            transaction.on_commit(lambda namespace=namespace: bump_namespace(namespace))
+    uid = f"cache:{model._meta.label}:{','.join(namespaces)}"
+    post_save.connect(handler, sender=model, weak=False, dispatch_uid=f'{uid}:save')
+    post_delete.connect(handler, sender=model, weak=False, dispatch_uid=f'{uid}:delete')
+
+class CachedResponseMixin:
+    """
+    Caches list/retrieve responses of a viewset. Keys include the versions of
+    ``cache_namespaces``, the caller's auth scope and the full query string, so a
+    namespace bump or a different filter never serves a stale payload.
+    """
+    cache_namespaces = ()
+    cache_timeout = None
+
+    def get_response_cache_key(self, request):
+        versions = namespace_versions(self.cache_namespaces)
+        user = getattr(request, 'user', None)
+        scope = f'user:{user.pk}' if user is not None and user.is_authenticated else 'anon'
+        query = sorted(request.query_params.lists())
+        digest = hashlib.sha256(f'{request.path}|{query}'.encode()).hexdigest()[:32]
+        version = '.'.join(str(v) for v in versions)
+        return f'api:{self.basename}:{self.action}:{version}:{scope}:{digest}'
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data, headers={'X-Cache': 'HIT'})
+        with primary_reads():
+            response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            timeout = self.cache_timeout or getattr(settings, 'API_CACHE_TIMEOUT', 300)
+            cache.set(key, response.data, timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
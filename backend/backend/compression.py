@@ -0,0 +1,217 @@
+import zlib
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import FileResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+class Compressor:
+    """
+    Flushes only once flush_size bytes of input have arrived since the last flush, so a
+    stream of small chunks is not paid for with a sync flush (and its framing) per chunk.
+    Without a flush_size the output is only completed by finish().
+    """
+
+    def __init__(self, level, flush_size=None):
+        self.flush_size = flush_size
+        self.pending = 0
+
+    def compress(self, data):
+        output = self.process(data)
+        if self.flush_size is None:
+            return output
+        self.pending += len(data)
+        if self.pending < self.flush_size:
+            return output
+        self.pending = 0
+        return output + self.flush()
+
+class GzipCompressor(Compressor):
+    def __init__(self, level, flush_size=None):
+        super().__init__(level, flush_size)
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def process(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self):
+        return self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self.compressor.flush()
+
+class BrotliCompressor(Compressor):
+    def __init__(self, level, flush_size=None):
+        super().__init__(level, flush_size)
+        self.compressor = brotli.Compressor(quality=level)
+
+    def process(self, data):
+        return self.compressor.process(data)
+
+    def flush(self):
+        return self.compressor.flush()
+
+    def finish(self):
+        return self.compressor.finish()
+
+class ZstdCompressor(Compressor):
+    def __init__(self, level, flush_size=None):
+        super().__init__(level, flush_size)
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def process(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self):
+        return self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self.compressor.flush()
+
+DEFAULT_LEVELS = {'gzip': 6, 'br': 5, 'zstd': 3}
+
+CODECS = {'gzip': GzipCompressor}
+if brotli is not None:
+    CODECS['br'] = BrotliCompressor
+if zstandard is not None:
+    CODECS['zstd'] = ZstdCompressor
+
+def parse_accept_encoding(header):
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+def negotiate_encoding(header, preference=None):
+    """Pick the server's most preferred available coding among those the client accepts with the highest q."""
+    accepted = parse_accept_encoding(header or '')
+    wildcard = accepted.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for coding in preference or getattr(settings, 'COMPRESSION_ENCODINGS', ('br', 'zstd', 'gzip')):
+        if coding not in CODECS:
+            continue
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+def etag_matches(request, etag):
+    """Weak If-None-Match comparison: compression turns ETags into W/"..." on the way out."""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return '*' in tags or etag.removeprefix('W/') in [tag.removeprefix('W/') for tag in tags]
+
+def compressible(response):
+    content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+    return any(
+        content_type.startswith(prefix)
+        for prefix in getattr(settings, 'COMPRESSION_CONTENT_TYPES', ('application/json', 'text/'))
+    )
+
+class CompressionMiddleware:
+    """
+    Compresses JSON, text and export responses with the best coding the client accepts
+    (brotli and zstd when their packages are installed, gzip otherwise). Small bodies,
+    partial content, range-capable files and types that are already compressed (images, PDFs, archives) pass
+    through untouched; streaming responses are compressed as they go and flushed every
+    COMPRESSION_STREAM_FLUSH_SIZE bytes of input. Async requests are handled natively
+    rather than through sync_to_async.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        # Range-capable responses (media files) must keep their byte offsets valid.
+        if (
+            response.status_code == 206
+            or response.has_header('Content-Encoding')
+            or response.has_header('Accept-Ranges')
+            or isinstance(response, FileResponse)
+            or not compressible(response)
+        ):
+            return response
+        min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = negotiate_encoding(request.headers.get('Accept-Encoding'))
+        if coding is None:
+            return response
+        level = getattr(settings, 'COMPRESSION_LEVELS', {}).get(coding, DEFAULT_LEVELS[coding])
+
+        if response.streaming:
+            compressor = CODECS[coding](level, getattr(settings, 'COMPRESSION_STREAM_FLUSH_SIZE', 16384))
+            if response.is_async:
+                original = response.streaming_content
+
+                async def compress_async():
+                    async for chunk in original:
+                        data = compressor.compress(chunk)
+                        if data:
+                            yield data
+                    yield compressor.finish()
+
+                response.streaming_content = compress_async()
+            else:
+                response.streaming_content = self.compress_sequence(compressor, response.streaming_content)
+            del response.headers['Content-Length']
+        else:
+            compressor = CODECS[coding](level)
+            compressed = compressor.compress(response.content) + compressor.finish()
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = coding
+        return response
+
+    def compress_sequence(self, compressor, sequence):
+        for chunk in sequence:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
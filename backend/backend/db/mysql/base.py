@@ -0,0 +1,10 @@
+from django.db.backends.mysql.base import DatabaseWrapper as MySQLDatabaseWrapper
+from backend.db.pool import PooledDatabaseWrapperMixin
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, MySQLDatabaseWrapper):
+    def check_raw_connection(self, raw):
+        try:
+            raw.ping()
+            return True
+        except Exception:
+            return False
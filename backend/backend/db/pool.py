@@ -0,0 +1,210 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from django.db.utils import OperationalError
+
+logger = logging.getLogger(__name__)
+
+class ConnectionPool:
+    """
+    Bounded pool of raw DB-API connections shared by the threads of one worker process.
+    Idle connections are health-checked before reuse and recycled after ``max_lifetime`` seconds.
+    Checked-out connections are tracked per thread, so a slot held by a thread that exited
+    without closing its connection is reclaimed on the next ``acquire``.
+    """
+
+    def __init__(self, connect, check=None, max_size=10, timeout=5, max_lifetime=1800, health_check_interval=30):
+        self.connect = connect
+        self.check = check
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._idle = deque()
+        self._created_at = {}
+        self._size = 0
+        self._in_use = 0
+        self._owners = {}
+        self._condition = threading.Condition()
+        self.counters = {
+            'created': 0, 'reused': 0, 'recycled': 0, 'failed_checks': 0, 'waits': 0, 'timeouts': 0, 'reclaimed': 0,
+        }
+
+    def _expired(self, raw, now):
+        return now - self._created_at.get(id(raw), now) > self.max_lifetime
+
+    def _discard(self, raw):
+        self._created_at.pop(id(raw), None)
+        self._size -= 1
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def _checkout(self, raw):
+        self._in_use += 1
+        self._owners[id(raw)] = (raw, threading.current_thread())
+
+    def _reclaim_orphans(self):
+        # The owner may have died mid-transaction, so its connection is closed rather than reused.
+        for key, (raw, owner) in list(self._owners.items()):
+            if not owner.is_alive():
+                del self._owners[key]
+                self._in_use -= 1
+                self.counters['reclaimed'] += 1
+                self._discard(raw)
+                logger.warning('Reclaimed a pooled connection left open by exited thread %s', owner.name)
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._idle:
+                    raw, released_at = self._idle.pop()
+                    if self._expired(raw, now):
+                        self.counters['recycled'] += 1
+                        self._discard(raw)
+                        continue
+                    if self.check and now - released_at > self.health_check_interval and not self.check(raw):
+                        self.counters['failed_checks'] += 1
+                        self._discard(raw)
+                        continue
+                    self.counters['reused'] += 1
+                    self._checkout(raw)
+                    return raw
+                if self._size >= self.max_size:
+                    self._reclaim_orphans()
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - now
+                if remaining <= 0:
+                    self.counters['timeouts'] += 1
+                    raise OperationalError(
+                        f"Timed out after {self.timeout}s waiting for a pooled connection "
+                        f"({self.max_size} in use)."
+                    )
+                if not waited:
+                    self.counters['waits'] += 1
+                    waited = True
+                # Dead owners never notify, so wake up periodically to sweep for them.
+                self._condition.wait(min(remaining, 1))
+
+        try:
+            raw = self.connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._created_at[id(raw)] = time.monotonic()
+            self.counters['created'] += 1
+            self._checkout(raw)
+        return raw
+
+    def release(self, raw, discard=False):
+        with self._condition:
+            if self._owners.pop(id(raw), None) is None:
+                # Already reclaimed from a thread that was presumed dead.
+                return
+            self._in_use -= 1
+            now = time.monotonic()
+            if discard or self._expired(raw, now):
+                self.counters['recycled'] += 1
+                self._discard(raw)
+            else:
+                self._idle.append((raw, now))
+            self._condition.notify()
+
+    def close_all(self):
+        with self._condition:
+            while self._idle:
+                raw, _ = self._idle.pop()
+                self._discard(raw)
+
+    def stats(self):
+        with self._condition:
+            return {
+                'max_size': self.max_size,
+                'size': self._size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                **self.counters,
+            }
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(alias, factory):
+    # Keyed by pid so forked workers never share sockets inherited from the parent.
+    key = (alias, os.getpid())
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = factory()
+    return pool
+
+def pool_stats():
+    pid = os.getpid()
+    return {alias: pool.stats() for (alias, owner), pool in list(_pools.items()) if owner == pid}
+
+class PooledDatabaseWrapperMixin:
+    """
+    Makes a Django database wrapper check connections out of a ConnectionPool instead of
+    opening one per request. Configured through the ``POOL`` key of the database settings.
+    """
+
+    @property
+    def pool_settings(self):
+        return self.settings_dict.get('POOL') or {}
+
+    @property
+    def pool_enabled(self):
+        return self.pool_settings.get('ENABLED', False)
+
+    def check_raw_connection(self, raw):
+        try:
+            with raw.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            return True
+        except Exception:
+            return False
+
+    def get_pool(self, conn_params):
+        options = self.pool_settings
+        return get_pool(self.alias, lambda: ConnectionPool(
+            connect=lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(conn_params),
+            check=self.check_raw_connection,
+            max_size=options.get('MAX_SIZE', 10),
+            timeout=options.get('TIMEOUT', 5),
+            max_lifetime=options.get('MAX_LIFETIME', 1800),
+            health_check_interval=options.get('HEALTH_CHECK_INTERVAL', 30),
+        ))
+
+    def get_new_connection(self, conn_params):
+        if not self.pool_enabled:
+            return super().get_new_connection(conn_params)
+        self._pool = self.get_pool(conn_params)
+        return self._pool.acquire()
+
+    def _close(self):
+        pool = getattr(self, '_pool', None)
+        if self.connection is None or pool is None:
+            return super()._close()
+        raw, self._pool = self.connection, None
+        # A connection closed mid-transaction stays attached to this wrapper, and one closed after
+        # errors is what close_if_unusable_or_obsolete() found dead: neither may be shared.
+        discard = self.in_atomic_block or self.errors_occurred
+        try:
+            if not self.get_autocommit():
+                raw.rollback()
+        except Exception:
+            discard = True
+        pool.release(raw, discard=discard)
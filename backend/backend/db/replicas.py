@@ -0,0 +1,166 @@
+import hashlib
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Reads go to replicas only where this is switched on: safe requests (see the middleware
+# below) or code wrapped in replica_reads(). Management commands and jobs stay on the primary.
+_use_replicas = ContextVar('use_replicas', default=False)
+
+_metrics_lock = threading.Lock()
+replica_metrics = Counter()
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', ())
+
+@contextmanager
+def replica_reads(enabled=True):
+    token = _use_replicas.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replicas.reset(token)
+
+def primary_reads():
+    """
+    For code filling a shared cache: an entry built from a lagging replica outlives the lag
+    and would be served even to clients pinned to the primary.
+    """
+    return replica_reads(False)
+
+def replication_lag(connection):
+    """Seconds the replica is behind its source, or None when replication is not running."""
+    if connection.vendor != 'mysql':
+        return 0
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute('SHOW REPLICA STATUS')
+        except DatabaseError:
+            # MySQL before 8.0.22 / MariaDB
+            cursor.execute('SHOW SLAVE STATUS')
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        status = dict(zip([column[0] for column in cursor.description], row))
+    return status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+
+class ReplicaHealth:
+    """
+    Per-process view of replica lag. Each replica is re-checked at most every
+    REPLICA_CHECK_INTERVAL seconds; one that is unreachable, not replicating or more than
+    REPLICA_MAX_LAG_SECONDS behind is skipped until a later check passes.
+    """
+
+    def __init__(self):
+        self.checked_at = {}
+        self.healthy = {}
+        self.lag = {}
+
+    def is_healthy(self, alias):
+        now = time.monotonic()
+        if now - self.checked_at.get(alias, float('-inf')) >= getattr(settings, 'REPLICA_CHECK_INTERVAL', 15):
+            self.checked_at[alias] = now
+            self.healthy[alias] = self.check(alias)
+        return self.healthy[alias]
+
+    def check(self, alias):
+        try:
+            lag = replication_lag(connections[alias])
+        except Exception:
+            logger.warning("Replica %s failed its lag check; reading from the primary.", alias, exc_info=True)
+            self.lag[alias] = None
+            return False
+        self.lag[alias] = lag
+        max_lag = getattr(settings, 'REPLICA_MAX_LAG_SECONDS', 5)
+        if lag is None or lag > max_lag:
+            logger.warning("Replica %s is lagging (%s s behind); reading from the primary.", alias, lag)
+            return False
+        return True
+
+    def reset(self):
+        self.checked_at.clear()
+        self.healthy.clear()
+        self.lag.clear()
+
+health = ReplicaHealth()
+
+class ReplicaRouter:
+    """
+    Sends reads to a healthy replica when replica reads are enabled for the current
+    request and no transaction is open on the primary; everything else, and all writes,
+    use ``default``. select_for_update() and save() route as writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _use_replicas.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        candidates = [alias for alias in replica_aliases() if health.is_healthy(alias)]
+        with _metrics_lock:
+            replica_metrics['replica' if candidates else 'fallback'] += 1
+        if not candidates:
+            return DEFAULT_DB_ALIAS
+        return random.choice(candidates)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+def pin_key(request):
+    # Same client = same bearer token, or the same address for anonymous callers.
+    authorization = request.headers.get('Authorization')
+    ident = f"auth:{authorization}" if authorization else f"ip:{request.META.get('REMOTE_ADDR', '')}"
+    return 'replica-pin:' + hashlib.sha256(ident.encode()).hexdigest()[:32]
+
+class ReplicaRoutingMiddleware:
+    """
+    Enables replica reads for GET/HEAD/OPTIONS requests. A client that has just sent a
+    write is pinned to the primary for REPLICA_PIN_SECONDS so it reads its own writes
+    even while replicas catch up. Not loaded when no replicas are configured.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replica_aliases():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        key = pin_key(request)
+        with replica_reads(request.method in SAFE_METHODS and not cache.get(key)):
+            response = self.get_response(request)
+        if request.method not in SAFE_METHODS:
+            cache.set(key, True, getattr(settings, 'REPLICA_PIN_SECONDS', 10))
+        return response
+
+    async def __acall__(self, request):
+        key = pin_key(request)
+        with replica_reads(request.method in SAFE_METHODS and not await cache.aget(key)):
+            response = await self.get_response(request)
+        if request.method not in SAFE_METHODS:
+            await cache.aset(key, True, getattr(settings, 'REPLICA_PIN_SECONDS', 10))
+        return response
@@ -0,0 +1,106 @@
+import mimetypes
+import os
+import re
+import stat
+from urllib.parse import quote
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import (
+    FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse,
+)
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+RANGE_HEADER = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+def cache_headers(response, path, etag, mtime):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(mtime)
+    response['Accept-Ranges'] = 'bytes'
+    if HASHED_NAME.search(path):
+        response['Cache-Control'] = f'public, max-age={settings.MEDIA_CACHE_MAX_AGE}, immutable'
+    else:
+        response['Cache-Control'] = 'public, max-age=0, must-revalidate'
+    return response
+
+def not_modified(request, etag, mtime):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+    if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return if_modified_since is not None and int(mtime) <= if_modified_since
+
+def parse_range(header, size):
+    match = RANGE_HEADER.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if start == '':
+        length = int(end)
+        return (max(size - length, 0), size - 1) if length else None
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    return (start, end) if start <= end else None
+
+def iter_range(handle, start, length):
+    try:
+        handle.seek(start)
+        while length > 0:
+            chunk = handle.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        handle.close()
+
+@require_safe
+def serve_media(request, path):
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        file_stat = os.stat(full_path)
+    except (OSError, ValueError, SuspiciousFileOperation):
+        raise Http404
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise Http404
+
+    size, mtime = file_stat.st_size, file_stat.st_mtime
+    etag = f'"{int(mtime):x}-{size:x}"'
+    if not_modified(request, etag, mtime):
+        return cache_headers(HttpResponseNotModified(), path, etag, mtime)
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+
+    accel_prefix = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', None)
+    if accel_prefix:
+        # The front web server streams the file (and handles ranges) from its internal location.
+        response = HttpResponse(content_type=content_type)
+        response[settings.MEDIA_ACCEL_REDIRECT_HEADER] = f"{accel_prefix.rstrip('/')}/{quote(path)}"
+        return cache_headers(response, path, etag, mtime)
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if_range = request.headers.get('If-Range')
+    if range_header and (if_range is None or if_range == etag):
+        byte_range = parse_range(range_header, size)
+        if byte_range is None or byte_range[0] >= size:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return cache_headers(response, path, etag, mtime)
+
+    handle = open(full_path, 'rb')
+    if byte_range is None:
+        # FileResponse hands the file object to wsgi.file_wrapper, which uses sendfile() where available.
+        response = FileResponse(handle, content_type=content_type)
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(iter_range(handle, start, end - start + 1), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    return cache_headers(response, path, etag, mtime)
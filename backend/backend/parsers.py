@@ -0,0 +1,34 @@
+import re
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils import json
+from .renderers import ORJSONRenderer
+
+# orjson cannot hold integers beyond 64 bits (older releases silently turn them into floats).
+_LONG_NUMBER = re.compile(rb'\d{19,}')
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser that decodes UTF-8 bodies with orjson. Other encodings and documents
+    orjson rejects but the stdlib accepts (e.g. integers beyond 64 bits) take the
+    stock path, so the set of accepted payloads is unchanged.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        body = stream.read()
+        if encoding.lower().replace('-', '') == 'utf8' and not _LONG_NUMBER.search(body):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+        try:
+            parse_constant = json.strict_constant if self.strict else None
+            return json.loads(body.decode(encoding), parse_constant=parse_constant)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,51 @@
+import math
+import re
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_LINE_SEPARATOR = '\u2028'.encode()
+_PARAGRAPH_SEPARATOR = '\u2029'.encode()
+# orjson writes exponents as 1e16/1e-7 where the stdlib writes 1e+16/1e-07. Inside a string
+# this can only misfire into the (identical) slow path.
+_EXPONENT = re.compile(rb'(?:^|[:,\[])-?\d+(?:\.\d+)?e-?\d')
+
+def has_non_finite(data):
+    """True if data holds NaN or infinity, which orjson quietly writes as null."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_non_finite(value) for value in data)
+    return False
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer that encodes with orjson straight to bytes. Anything orjson does
+    not handle natively (Decimal, date/datetime, lazy strings, querysets, ...) goes through
+    DRF's JSONEncoder.default so the output matches the stock renderer byte for byte.
+    Indented or ASCII-escaped output, floats in exponent notation and non-finite floats
+    (which the stock renderer rejects in strict mode) fall back to the stock renderer.
+    """
+
+    default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        if self.ensure_ascii or not self.compact or self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder still accepts.
+            return super().render(data, accepted_media_type, renderer_context)
+        if _EXPONENT.search(ret) or (b'null' in ret and has_non_finite(data)):
+            return super().render(data, accepted_media_type, renderer_context)
+        if _LINE_SEPARATOR in ret or _PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b'\\u2028').replace(_PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
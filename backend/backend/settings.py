@@ -37,11 +37,19 @@ INSTALLED_APPS = [
     'team',
     'series',
     'quotation',
-    # 'job_execution',
+    'reference_data',
+    'performance',
+    'archive',
+    'changelog',
+    'job_execution',
 ]
 
 MIDDLEWARE = [
+    'performance.middleware.PerformanceMiddleware',
+    'performance.middleware.QueryDetectorMiddleware',
+    'backend.db.replicas.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'backend.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -49,6 +57,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'changelog.middleware.ChangeLogMiddleware',
 ]
 
 ROOT_URLCONF = 'backend.urls'
@@ -73,15 +82,95 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        'ENGINE': 'backend.db.mysql',
         'NAME': os.getenv('DB_NAME', 'prime_db'),
         'USER': os.getenv('DB_USER', 'your_mysql_user'),
         'PASSWORD': os.getenv('DB_PASSWORD', 'your_mysql_password'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '3306'),
+        # Persistent per-thread connections, used when the pool below is disabled.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),
+        'CONN_HEALTH_CHECKS': True,
+        # Per-worker connection pool; connections are returned to it at the end of each request.
+        'POOL': {
+            'ENABLED': os.getenv('DB_POOL_ENABLED', 'True') == 'True',
+            'MAX_SIZE': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+            'TIMEOUT': float(os.getenv('DB_POOL_TIMEOUT', '5')),
+            'MAX_LIFETIME': int(os.getenv('DB_POOL_MAX_LIFETIME', '1800')),
+            'HEALTH_CHECK_INTERVAL': int(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', '30')),
+        },
     }
 }
 
+# Read replicas: comma-separated hosts in DB_REPLICA_HOSTS. Safe requests read from a
+# healthy replica; writes, transactions and clients that wrote in the last
+# REPLICA_PIN_SECONDS use the primary. Pins live in the cache, so multi-worker
+# deployments need a shared cache backend.
+# Replicas use DB_REPLICA_USER/DB_REPLICA_PASSWORD when set, otherwise the primary's
+# credentials. The account needs SELECT plus REPLICATION CLIENT, which the lag check
+# (SHOW REPLICA STATUS) requires; without it every check fails and reads stay on the primary.
+DATABASE_REPLICAS = []
+for index, host in enumerate(host.strip() for host in os.getenv('DB_REPLICA_HOSTS', '').split(',') if host.strip()):
+    alias = f'replica{index + 1}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'USER': os.getenv('DB_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.getenv('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        'POOL': dict(DATABASES['default']['POOL']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ['backend.db.replicas.ReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.getenv('DB_REPLICA_PIN_SECONDS', '10'))
+REPLICA_MAX_LAG_SECONDS = int(os.getenv('DB_REPLICA_MAX_LAG_SECONDS', '5'))
+REPLICA_CHECK_INTERVAL = 15
+
+# Cache: 'locmem' (single process), 'file' or 'redis'. Multi-worker deployments
+# need 'file' or 'redis' so namespace invalidation is visible to every worker.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'prime-crm',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / 'cache')),
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', 'redis://127.0.0.1:6379/0'),
+    },
+}
+CACHES = {
+    'default': {
+        **CACHE_BACKENDS[CACHE_BACKEND],
+        'KEY_PREFIX': 'prime',
+        'TIMEOUT': 300,
+    },
+}
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', '300'))
+
+# Share of requests timed for Server-Timing headers and /metrics histograms.
+PERFORMANCE_SAMPLE_RATE = float(os.getenv('PERFORMANCE_SAMPLE_RATE', '1.0' if DEBUG else '0.1'))
+# /metrics requires this bearer token; when it is unset the endpoint is served only under DEBUG.
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+# N+1 / slow query detection: 'off', 'log' or 'raise'. Keep it off in production.
+QUERY_DETECTOR_MODE = os.getenv('QUERY_DETECTOR_MODE', 'log' if DEBUG else 'off')
+QUERY_DETECTOR_TEST_MODE = os.getenv('QUERY_DETECTOR_TEST_MODE', 'raise')
+QUERY_DETECTOR_REPEAT_THRESHOLD = int(os.getenv('QUERY_DETECTOR_REPEAT_THRESHOLD', '5'))
+QUERY_DETECTOR_SLOW_MS = float(os.getenv('QUERY_DETECTOR_SLOW_MS', '100'))
+TEST_RUNNER = 'performance.runner.QueryDetectorTestRunner'
+
+# Response compression. Brotli and zstd are offered when the brotli/zstandard packages are installed.
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_ENCODINGS = ('br', 'zstd', 'gzip')
+COMPRESSION_CONTENT_TYPES = ('application/json', 'application/yaml', 'text/')
+# Streamed exports are flushed to the client once this much input has been compressed.
+COMPRESSION_STREAM_FLUSH_SIZE = 16 * 1024
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -108,17 +197,93 @@ USE_TZ = True
 STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+STORAGES = {
+    'default': {'BACKEND': 'backend.storage.HashedFileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+# Set to the front server's internal location (e.g. nginx `internal` /protected-media/)
+# to offload media downloads via X-Accel-Redirect.
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv('MEDIA_ACCEL_REDIRECT_PREFIX')
+MEDIA_ACCEL_REDIRECT_HEADER = os.getenv('MEDIA_ACCEL_REDIRECT_HEADER', 'X-Accel-Redirect')
+
+# Profile image variants, generated off the request thread after upload
+PROFILE_IMAGE_VARIANTS = {'small': 64, 'medium': 128, 'large': 256}
+PROFILE_IMAGE_FORMAT = 'WEBP'
+PROFILE_IMAGE_QUALITY = 80
+PROFILE_IMAGE_PROCESS_ASYNC = True
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework settings
 REST_FRAMEWORK = {
+    # Reverse proxies in front of the app. 0 keys throttles on REMOTE_ADDR and ignores a
+    # client-supplied X-Forwarded-For; set it to 1 behind a single nginx/load balancer.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', '0')),
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authapp.authentication.CachedJWTAuthentication',
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'backend.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    'DEFAULT_PARSER_CLASSES': [
+        'backend.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# Cached JWT user resolution
+JWT_USER_CACHE_SIZE = 1024
+JWT_USER_CACHE_TTL = 30
+
+# Client typeahead settings
+CLIENT_TYPEAHEAD_MIN_LENGTH = 1
+CLIENT_TYPEAHEAD_MAX_LIMIT = 25
+CLIENT_TYPEAHEAD_CACHE_SIZE = 2048
+CLIENT_TYPEAHEAD_CACHE_TTL = 60
+
+# Largest create/update/delete batch accepted by /api/add-items/bulk/
+RFQ_ITEM_BULK_MAX_ITEMS = 500
+
+# Archival of closed records: completed RFQs older than the retention window move to
+# archive.ArchivedRecord together with their quotations, purchase orders and work orders
+ARCHIVE_RETENTION_DAYS = 730
+ARCHIVE_BATCH_SIZE = 200
+ARCHIVE_QUOTATION_STATUSES = ('PO Created',)
+ARCHIVE_WORK_ORDER_STATUSES = ('Closed',)
+
+# Reference data bootstrap settings
+REFERENCE_DATA_CACHE_TIMEOUT = 3600
+
+# API documentation settings
+# Written on deploy by `manage.py generate_schema` and loaded at startup. Outside DEBUG the
+# file is trusted as is; `generate_schema --check` verifies it against the code.
+DOCUMENTATION_SCHEMA_FILE = BASE_DIR / 'documentation' / 'schema.json'
+DOCUMENTATION_SCHEMA_VERIFY = DEBUG
+SWAGGER_SETTINGS = {
+    'SPEC_URL': ('schema-json', {'format': 'json'}),
+}
+REDOC_SETTINGS = {
+    'SPEC_URL': ('schema-json', {'format': 'json'}),
 }
 
+# Token-bucket throttles, keyed as <view throttle_scope>_<ip|account>
+THROTTLE_BUCKETS = {
+    'login_ip': {'capacity': 20, 'refill_per_minute': 10},
+    'login_account': {'capacity': 5, 'refill_per_minute': 1},
+    'otp_ip': {'capacity': 5, 'refill_per_minute': 1},
+    'otp_account': {'capacity': 5, 'refill_per_minute': 0.5},
+    'reminder_ip': {'capacity': 10, 'refill_per_minute': 2},
+    'reminder_account': {'capacity': 2, 'refill_per_minute': 0.1},
+}
+
+# Password reset OTP settings
+OTP_TTL_MINUTES = 10
+OTP_MAX_ATTEMPTS = 5
+
 # Simple JWT settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=2),  
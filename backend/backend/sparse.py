@@ -0,0 +1,97 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.permissions import SAFE_METHODS
+
+def parse_field_list(value):
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+def sparse_context(params):
+    return {
+        'fields': parse_field_list(params.get('fields')),
+        'expand': parse_field_list(params.get('expand')),
+    }
+
+class SparseFieldsetSerializerMixin:
+    """
+    Lets a read serializer render a subset of its fields. ``relations`` names groups of
+    heavy fields (nested rows, denormalised assignee details) together with the
+    select_related/prefetch_related they need:
+
+        relations = {'items': {'fields': ('items',), 'prefetch_related': ('items',)}}
+
+    With no ``fields``/``expand`` in the context the full shape is rendered. ``expand``
+    alone gives the compact shape (every field outside a relation group) plus the listed
+    groups; ``fields`` selects exact fields or group names. ``id`` is always kept.
+    """
+
+    relations = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        names = self.sparse_field_names(fields)
+        if names is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in names}
+
+    def sparse_field_names(self, fields):
+        requested = self.context.get('fields')
+        expand = self.context.get('expand')
+        if requested is None and expand is None:
+            return None
+        grouped = {name for group in self.relations.values() for name in group['fields']}
+        names = set(requested) if requested is not None else set(fields) - grouped
+        for group_name in (expand or set()) | (requested or set()):
+            if group_name in self.relations:
+                names.update(self.relations[group_name]['fields'])
+        names.add('id')
+        return names
+
+    def active_relations(self):
+        active = set(self.fields)
+        return [group for group in self.relations.values() if active & set(group['fields'])]
+
+def narrow_queryset(queryset, serializer):
+    """
+    Match the query to a sparse serializer: drop select/prefetch for relation groups that
+    are not rendered and defer model columns no rendered field reads.
+    """
+    if serializer.context.get('fields') is None and serializer.context.get('expand') is None:
+        return queryset
+    model = queryset.model
+    columns = {model._meta.pk.name}
+    queryset = queryset.select_related(None).prefetch_related(None)
+    for group in serializer.active_relations():
+        if group.get('select_related'):
+            queryset = queryset.select_related(*group['select_related'])
+            columns.update(group['select_related'])
+        if group.get('prefetch_related'):
+            queryset = queryset.prefetch_related(*group['prefetch_related'])
+    for field in serializer.fields.values():
+        source = field.source.split('.')[0]
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            continue
+        if model_field.concrete:
+            columns.add(model_field.name)
+    return queryset.only(*columns)
+
+class SparseFieldsetViewMixin:
+    """
+    Reads ``?fields=`` and ``?expand=`` on GET requests, passes them to the serializer
+    and narrows the list/detail queryset to the columns and relations actually rendered.
+    Narrowing happens in filter_queryset so viewsets keep their own get_queryset.
+    """
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request is not None and self.request.method in SAFE_METHODS:
+            context.update(sparse_context(self.request.query_params))
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        return narrow_queryset(queryset, self.get_serializer_class()(context=self.get_serializer_context()))
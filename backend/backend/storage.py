@@ -0,0 +1,30 @@
+import hashlib
+import os
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+class HashedFileSystemStorage(FileSystemStorage):
+    """Stores uploads under names that embed a hash of their content, so URLs can be cached forever."""
+
+    hash_length = 12
+
+    def content_hash(self, content):
+        digest = hashlib.sha256()
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        return digest.hexdigest()[:self.hash_length]
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        root, ext = os.path.splitext(name)
+        hashed_name = f'{root}.{self.content_hash(content)}{ext}'
+        if self.exists(hashed_name):
+            return hashed_name.replace('\\', '/')
+        return super().save(hashed_name, content, max_length=max_length)
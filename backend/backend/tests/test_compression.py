@@ -0,0 +1,145 @@
+import gzip
+import unittest
+import zlib
+from unittest import mock
+from asgiref.sync import iscoroutinefunction
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, override_settings
+from backend import compression
+from backend.compression import CompressionMiddleware, GzipCompressor, etag_matches, negotiate_encoding
+
+BODY = b'{"items": [' + b'{"name": "Widget"},' * 200 + b'{}]}'
+
+def json_response():
+    return HttpResponse(BODY, content_type='application/json')
+
+@override_settings(COMPRESSION_LEVELS={})
+class CompressionMiddlewareTests(SimpleTestCase):
+    def test_sync_response_is_gzipped(self):
+        middleware = CompressionMiddleware(lambda request: json_response())
+        response = middleware(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), BODY)
+
+    async def test_async_stack_is_handled_natively(self):
+        async def view(request):
+            return json_response()
+
+        middleware = CompressionMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = await middleware(AsyncRequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_small_bodies_pass_through(self):
+        middleware = CompressionMiddleware(lambda request: HttpResponse(b'{}', content_type='application/json'))
+        response = middleware(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_streaming_response_flushes_once_enough_is_buffered(self):
+        chunks = [b'{"name": "Widget %d"},' % index for index in range(500)]
+        middleware = CompressionMiddleware(lambda request: StreamingHttpResponse(iter(chunks), content_type='application/json'))
+        with override_settings(COMPRESSION_STREAM_FLUSH_SIZE=4096):
+            response = middleware(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+            output = list(response.streaming_content)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(gzip.decompress(b''.join(output)), b''.join(chunks))
+        # One piece per ~4 KiB of input plus the trailer, not one per chunk.
+        self.assertLess(len(output), len(chunks) // 10)
+        decompressor = zlib.decompressobj(31)
+        sizes = [len(decompressor.decompress(piece)) for piece in output[:-1]]
+        self.assertTrue(all(size == 0 or size >= 4096 for size in sizes), sizes)
+
+    async def test_async_streaming_response(self):
+        chunks = [b'line of text\n' * 50] * 20
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        async def view(request):
+            return StreamingHttpResponse(stream(), content_type='text/plain')
+
+        middleware = CompressionMiddleware(view)
+        response = await middleware(AsyncRequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+        output = [chunk async for chunk in response.streaming_content]
+        self.assertEqual(gzip.decompress(b''.join(output)), b''.join(chunks))
+
+    def test_body_compression_does_not_flush_midway(self):
+        compressor = GzipCompressor(6)
+        self.assertEqual(gzip.decompress(compressor.compress(BODY * 50) + compressor.finish()), BODY * 50)
+
+    def test_negotiation_honours_q_values_and_preference(self):
+        codecs = {'gzip': GzipCompressor, 'br': GzipCompressor, 'zstd': GzipCompressor}
+        with mock.patch.dict(compression.CODECS, codecs):
+            self.assertEqual(negotiate_encoding('gzip, br, zstd'), 'br')
+            self.assertEqual(negotiate_encoding('gzip, zstd'), 'zstd')
+            self.assertEqual(negotiate_encoding('br;q=0.5, gzip;q=1.0'), 'gzip')
+            self.assertEqual(negotiate_encoding('*;q=0.3, br;q=0'), 'zstd')
+            self.assertEqual(negotiate_encoding('gzip;q=0, identity'), None)
+            self.assertEqual(negotiate_encoding('GZIP ; Q=0.8'), 'gzip')
+            self.assertEqual(negotiate_encoding('br;q=bogus, gzip'), 'gzip')
+            self.assertEqual(negotiate_encoding('gzip, br', preference=('gzip', 'br')), 'gzip')
+
+    def test_unavailable_codings_are_not_offered(self):
+        with mock.patch.dict(compression.CODECS, {'gzip': GzipCompressor}, clear=True):
+            self.assertEqual(negotiate_encoding('br, zstd, gzip;q=0.1'), 'gzip')
+            self.assertEqual(negotiate_encoding('br, zstd'), None)
+
+    @unittest.skipIf(compression.brotli is None, 'brotli is not installed')
+    def test_brotli_round_trip(self):
+        middleware = CompressionMiddleware(lambda request: json_response())
+        response = middleware(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip, br'}))
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(compression.brotli.decompress(response.content), BODY)
+
+    @unittest.skipIf(compression.zstandard is None, 'zstandard is not installed')
+    def test_zstd_round_trip(self):
+        middleware = CompressionMiddleware(lambda request: json_response())
+        response = middleware(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip, zstd'}))
+        self.assertEqual(response['Content-Encoding'], 'zstd')
+        self.assertEqual(compression.zstandard.ZstdDecompressor().decompressobj().decompress(response.content), BODY)
+
+    def test_strong_etag_is_weakened(self):
+        def view(request):
+            response = json_response()
+            response['ETag'] = '"v1"'
+            return response
+
+        request = RequestFactory().get('/', headers={'Accept-Encoding': 'gzip'})
+        response = CompressionMiddleware(view)(request)
+        self.assertEqual(response['ETag'], 'W/"v1"')
+        conditional = RequestFactory().get('/', headers={'If-None-Match': response['ETag']})
+        self.assertTrue(etag_matches(conditional, '"v1"'))
+        self.assertFalse(etag_matches(conditional, '"v2"'))
+
+    def test_uncompressed_response_keeps_strong_etag(self):
+        def view(request):
+            response = json_response()
+            response['ETag'] = '"v1"'
+            return response
+
+        response = CompressionMiddleware(view)(RequestFactory().get('/', headers={'Accept-Encoding': 'identity'}))
+        self.assertEqual(response['ETag'], '"v1"')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_skipped_media_types(self):
+        for content_type in ('image/png', 'application/pdf', 'application/zip', 'application/octet-stream'):
+            middleware = CompressionMiddleware(lambda request: HttpResponse(BODY, content_type=content_type))
+            response = middleware(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+            self.assertFalse(response.has_header('Content-Encoding'), content_type)
+            self.assertEqual(response.content, BODY)
+
+    def test_partial_and_file_responses_are_skipped(self):
+        def partial(request):
+            response = json_response()
+            response.status_code = 206
+            return response
+
+        response = CompressionMiddleware(partial)(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        file_response = FileResponse(iter([BODY]), content_type='application/json')
+        response = CompressionMiddleware(lambda request: file_response)(RequestFactory().get('/', headers={'Accept-Encoding': 'gzip'}))
+        self.assertFalse(response.has_header('Content-Encoding'))
@@ -0,0 +1,32 @@
+import os
+import shutil
+import tempfile
+from django.test import TestCase, override_settings
+
+class MediaTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        os.makedirs(os.path.join(self.media_root, 'docs'))
+        for name in ('notes.txt', 'прайс лист.txt'):
+            with open(os.path.join(self.media_root, 'docs', name), 'w') as handle:
+                handle.write('line of text\n' * 500)
+
+    def test_accel_redirect_quotes_non_latin_names(self):
+        with override_settings(MEDIA_ROOT=self.media_root, MEDIA_ACCEL_REDIRECT_PREFIX='/protected/'):
+            response = self.client.get('/media/docs/прайс лист.txt')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response['X-Accel-Redirect'],
+            '/protected/docs/%D0%BF%D1%80%D0%B0%D0%B9%D1%81%20%D0%BB%D0%B8%D1%81%D1%82.txt',
+        )
+
+    def test_media_files_are_not_compressed(self):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            response = self.client.get('/media/docs/notes.txt', HTTP_ACCEPT_ENCODING='gzip')
+            partial = self.client.get('/media/docs/notes.txt', HTTP_ACCEPT_ENCODING='gzip', HTTP_RANGE='bytes=0-9')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(b''.join(response.streaming_content), b'line of text\n' * 500)
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(b''.join(partial.streaming_content), b'line of te')
@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest import mock
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.sqlite3 import base as sqlite3_base
+from django.db.utils import OperationalError
+from django.test import SimpleTestCase
+from backend.db.pool import ConnectionPool, PooledDatabaseWrapperMixin, _pools
+
+class ConnectionPoolTests(SimpleTestCase):
+    def make_pool(self, **kwargs):
+        return ConnectionPool(connect=mock.Mock, max_size=1, timeout=0.2, **kwargs)
+
+    def test_released_connection_is_reused(self):
+        pool = self.make_pool()
+        raw = pool.acquire()
+        pool.release(raw)
+        self.assertIs(pool.acquire(), raw)
+        self.assertEqual(pool.stats()['reused'], 1)
+
+    def test_exhausted_pool_times_out(self):
+        pool = self.make_pool()
+        pool.acquire()
+        with self.assertRaises(OperationalError):
+            pool.acquire()
+        self.assertEqual(pool.stats()['timeouts'], 1)
+
+    def test_slot_leaked_by_exited_thread_is_reclaimed(self):
+        pool = self.make_pool()
+        leaked = []
+        worker = threading.Thread(target=lambda: leaked.append(pool.acquire()))
+        worker.start()
+        worker.join()
+
+        with self.assertLogs('backend.db.pool', 'WARNING'):
+            raw = pool.acquire()
+        self.assertIsNot(raw, leaked[0])
+        leaked[0].close.assert_called_once_with()
+        stats = pool.stats()
+        self.assertEqual((stats['size'], stats['in_use'], stats['reclaimed']), (1, 1, 1))
+
+        pool.release(raw)
+        self.assertEqual(pool.stats()['in_use'], 0)
+
+class PooledSQLiteWrapper(PooledDatabaseWrapperMixin, sqlite3_base.DatabaseWrapper):
+    pass
+
+class PooledWrapperTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        alias = f'pool_test_{id(self)}'
+        settings_dict = connections.configure_settings({
+            DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+            alias: {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': os.path.join(directory, 'pool.sqlite3'),
+                'POOL': {'ENABLED': True, 'MAX_SIZE': 2, 'TIMEOUT': 0.2},
+            },
+        })[alias]
+        self.wrapper = PooledSQLiteWrapper(settings_dict, alias)
+        self.addCleanup(self.wrapper.close)
+        self.addCleanup(_pools.pop, (alias, os.getpid()), None)
+
+    def test_healthy_connection_returns_to_the_pool(self):
+        self.wrapper.ensure_connection()
+        raw = self.wrapper.connection
+        self.wrapper.close()
+        self.assertIs(self.wrapper.get_pool(None).acquire(), raw)
+
+    def test_connection_found_unusable_is_not_handed_out_again(self):
+        self.wrapper.ensure_connection()
+        raw = self.wrapper.connection
+        pool = self.wrapper._pool
+        self.wrapper.errors_occurred = True
+        with mock.patch.object(self.wrapper, 'is_usable', return_value=False):
+            self.wrapper.close_if_unusable_or_obsolete()
+        self.assertIsNone(self.wrapper.connection)
+        self.assertEqual(pool.stats()['idle'], 0)
+        self.assertIsNot(pool.acquire(), raw)
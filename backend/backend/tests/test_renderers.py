@@ -0,0 +1,71 @@
+import datetime
+import io
+from decimal import Decimal
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from backend.parsers import ORJSONParser
+from backend.renderers import ORJSONRenderer
+
+class ORJSONRendererTests(SimpleTestCase):
+    def assertMatchesStock(self, data):
+        rendered = ORJSONRenderer().render(data)
+        self.assertEqual(rendered, JSONRenderer().render(data))
+        return rendered
+
+    def test_matches_stock_renderer(self):
+        self.assertMatchesStock({
+            'price': Decimal('12.50'),
+            'due': datetime.date(2024, 5, 1),
+            'at': datetime.datetime(2024, 5, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'naive': datetime.datetime(2024, 5, 1, 9, 30),
+            'time': datetime.time(9, 30, 15, 250000),
+            'name': 'Schraube ä',
+            'count': 3,
+            'missing': None,
+        })
+
+    def test_escapes_line_separators(self):
+        rendered = self.assertMatchesStock({'note': 'one\u2028two\u2029three'})
+        self.assertIn(b'\\u2028', rendered)
+        self.assertIn(b'\\u2029', rendered)
+
+    def test_integers_beyond_64_bits(self):
+        rendered = self.assertMatchesStock({'big': 2 ** 70, 'negative': -(2 ** 64)})
+        self.assertIn(str(2 ** 70).encode(), rendered)
+
+    def test_exponent_floats(self):
+        rendered = self.assertMatchesStock({'large': 1e16, 'small': 1e-7, 'list': [2.5e-10, 0.1]})
+        self.assertIn(b'1e+16', rendered)
+        self.assertIn(b'1e-07', rendered)
+        self.assertEqual(ORJSONRenderer().render(1e22), b'1e+22')
+
+    def test_non_finite_floats_are_rejected(self):
+        for value in (float('nan'), float('inf'), float('-inf')):
+            with self.assertRaises(ValueError):
+                ORJSONRenderer().render({'values': [1.0, value]})
+
+    def test_null_without_non_finite_floats_stays_on_fast_path(self):
+        self.assertMatchesStock({'value': None, 'ratio': 0.5})
+
+class ORJSONParserTests(SimpleTestCase):
+    def parse(self, body, encoding='utf-8'):
+        return ORJSONParser().parse(io.BytesIO(body), 'application/json', {'encoding': encoding})
+
+    def test_round_trips_rendered_payloads(self):
+        data = {'price': Decimal('12.50'), 'note': 'a\u2028b', 'big': 2 ** 70, 'large': 1e16}
+        parsed = self.parse(ORJSONRenderer().render(data))
+        # Bare Decimals render as numbers; serializer fields coerce them to strings first.
+        self.assertEqual(parsed, {'price': 12.5, 'note': 'a\u2028b', 'big': 2 ** 70, 'large': 1e16})
+        self.assertIsInstance(parsed['big'], int)
+
+    def test_integers_beyond_64_bits_stay_exact(self):
+        self.assertEqual(self.parse(b'{"id": 123456789012345678901234567890}'), {'id': 123456789012345678901234567890})
+
+    def test_rejects_non_finite_constants(self):
+        for body in (b'{"value": NaN}', b'{"value": Infinity}'):
+            with self.assertRaises(ParseError):
+                self.parse(body)
+
+    def test_other_encodings_use_stock_path(self):
+        self.assertEqual(self.parse('{"name": "Größe"}'.encode('latin-1'), encoding='latin-1'), {'name': 'Größe'})
@@ -0,0 +1,99 @@
+import json
+from unittest import mock
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from authapp.authentication import CachedJWTAuthentication, user_cache
+from rfq.models import RFQ, Client
+from rfq.typeahead import client_typeahead_cache, search_clients
+from series.models import NumberSeries
+from backend.db import replicas
+
+REPLICA = 'replica_test'
+
+# Registered at import so the test runner creates (and migrates) its test database
+# along with the primary's whenever these tests are selected.
+connections.settings.setdefault(REPLICA, connections.configure_settings({
+    DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+    REPLICA: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+})[REPLICA])
+
+@override_settings(DATABASE_REPLICAS=[REPLICA])
+class ReplicaRoutingTests(TransactionTestCase):
+    """
+    Runs against an extra SQLite alias standing in for a replica. It has the schema but
+    none of the rows, so every read shows which database served it.
+    """
+
+    databases = {'default', REPLICA}
+
+    def setUp(self):
+        cache.clear()
+        replicas.health.reset()
+        client_typeahead_cache.clear()
+        user_cache.clear()
+        RFQ.objects.create(company_name='Acme')
+
+    def list_rfqs(self, **extra):
+        response = self.client.get('/api/add-rfqs/', **extra)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_safe_requests_read_from_the_replica(self):
+        self.assertEqual(self.list_rfqs(), [])
+        self.assertEqual(RFQ.objects.count(), 1)
+
+    def test_writes_locks_and_transactions_use_the_primary(self):
+        with replicas.replica_reads():
+            self.assertEqual(RFQ.objects.all().db, REPLICA)
+            self.assertEqual(RFQ.objects.select_for_update().db, 'default')
+            RFQ.objects.create(company_name='Globex')
+            with transaction.atomic():
+                self.assertEqual(RFQ.objects.count(), 2)
+        self.assertEqual(RFQ.objects.using(REPLICA).count(), 0)
+
+    def test_client_is_pinned_to_the_primary_after_a_write(self):
+        series = NumberSeries.objects.create(series_name='RFQ', prefix='RFQ')
+        response = self.client.post(
+            '/api/add-rfqs/', json.dumps({'company_name': 'Globex', 'series': series.pk}), content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(len(self.list_rfqs()), 2)
+        self.assertEqual(self.list_rfqs(REMOTE_ADDR='10.0.0.9'), [])
+
+    def test_falls_back_to_the_primary_when_the_replica_is_unhealthy(self):
+        with mock.patch.object(replicas, 'replication_lag', side_effect=Exception('access denied')):
+            with self.assertLogs('backend.db.replicas', 'WARNING'):
+                self.assertEqual(len(self.list_rfqs()), 1)
+        self.assertIs(replicas.health.healthy[REPLICA], False)
+
+        replicas.health.reset()
+        with mock.patch.object(replicas, 'replication_lag', return_value=60):
+            with self.assertLogs('backend.db.replicas', 'WARNING'):
+                self.assertEqual(len(self.list_rfqs()), 1)
+        self.assertEqual(replicas.health.lag, {REPLICA: 60})
+
+    def test_response_cache_is_filled_from_the_primary(self):
+        response = self.client.post('/api/items/', json.dumps({'name': 'Gauge'}), content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        # Another client misses the cache; reading the lagging replica would cache [] for everyone.
+        other = self.client.get('/api/items/', REMOTE_ADDR='10.0.0.9')
+        self.assertEqual((other['X-Cache'], [item['name'] for item in other.json()]), ('MISS', ['Gauge']))
+        # The writer is pinned to the primary and must not be served a stale entry.
+        own = self.client.get('/api/items/')
+        self.assertEqual((own['X-Cache'], [item['name'] for item in own.json()]), ('HIT', ['Gauge']))
+
+    def test_typeahead_cache_is_filled_from_the_primary(self):
+        Client.objects.create(company_name='Globex')
+        with replicas.replica_reads():
+            self.assertEqual([row['company_name'] for row in search_clients('glo', 10)], ['Globex'])
+            self.assertEqual(RFQ.objects.count(), 0)
+
+    def test_user_cache_is_filled_from_the_primary(self):
+        user = get_user_model().objects.create_user(username='dana', password='secret')
+        token = AccessToken.for_user(user)
+        with replicas.replica_reads():
+            self.assertEqual(CachedJWTAuthentication().get_user(token).pk, user.pk)
+        self.assertIsNotNone(user_cache.get(str(user.pk)))
@@ -0,0 +1,45 @@
+import json
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+BUCKETS = {
+    'login_ip': {'capacity': 3, 'refill_per_minute': 60},
+    'login_account': {'capacity': 2, 'refill_per_minute': 60},
+}
+
+@override_settings(THROTTLE_BUCKETS=BUCKETS)
+class TokenBucketThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def login(self, body, **extra):
+        return self.client.post('/api/login/', json.dumps(body), content_type='application/json', **extra)
+
+    def test_account_bucket_returns_429_with_retry_after(self):
+        with mock.patch('backend.throttling.time.time', return_value=1000.0):
+            statuses = [self.login({'email': 'a@example.com', 'password': 'x'}).status_code for _ in range(2)]
+            response = self.login({'email': 'A@example.com ', 'password': 'x'})
+        self.assertEqual(statuses, [401, 401])
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '1')
+
+    def test_bucket_refills_over_time(self):
+        with mock.patch('backend.throttling.time.time', return_value=1000.0):
+            for _ in range(2):
+                self.login({'email': 'a@example.com', 'password': 'x'})
+            self.assertEqual(self.login({'email': 'a@example.com', 'password': 'x'}).status_code, 429)
+        with mock.patch('backend.throttling.time.time', return_value=1001.0):
+            self.assertEqual(self.login({'email': 'a@example.com', 'password': 'x'}).status_code, 401)
+            self.assertEqual(self.login({'email': 'a@example.com', 'password': 'x'}).status_code, 429)
+
+    def test_ip_bucket_ignores_client_forwarded_for(self):
+        with mock.patch('backend.throttling.time.time', return_value=1000.0):
+            for index in range(3):
+                self.login({'email': f'user{index}@example.com', 'password': 'x'}, HTTP_X_FORWARDED_FOR=f'10.0.0.{index}')
+            response = self.login({'email': 'other@example.com', 'password': 'x'}, HTTP_X_FORWARDED_FOR='10.0.0.99')
+        self.assertEqual(response.status_code, 429)
+
+    def test_non_object_body_is_rejected_not_crashing(self):
+        response = self.login([1])
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,77 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+_metrics_lock = threading.Lock()
+throttle_metrics = Counter()
+
+def record_throttle_metric(scope, key_type, outcome):
+    with _metrics_lock:
+        throttle_metrics[(scope, key_type, outcome)] += 1
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token-bucket throttle keyed on ``view.throttle_scope`` and stored in the shared cache.
+    Buckets are configured in ``settings.THROTTLE_BUCKETS`` as ``<scope>_<key_type>``.
+    Subclasses set ``key_type`` and may override ``get_ident_value``; the default keys on
+    the client address.
+    """
+    key_type = 'ip'
+
+    def get_ident_value(self, request, view):
+        # REMOTE_ADDR, or the X-Forwarded-For entry added by the NUM_PROXIES trusted proxies.
+        return self.get_ident(request)
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        scope = getattr(view, 'throttle_scope', None)
+        config = getattr(settings, 'THROTTLE_BUCKETS', {}).get(f'{scope}_{self.key_type}')
+        ident = self.get_ident_value(request, view) if config else None
+        if ident is None:
+            return True
+
+        capacity = config['capacity']
+        refill_per_second = config['refill_per_minute'] / 60
+        digest = hashlib.sha256(str(ident).encode()).hexdigest()[:32]
+        key = f'throttle:{scope}:{self.key_type}:{digest}'
+        now = time.time()
+        tokens, updated_at = cache.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        elif refill_per_second:
+            self.wait_seconds = (1 - tokens) / refill_per_second
+        timeout = int((capacity - tokens) / refill_per_second) + 1 if refill_per_second else None
+        cache.set(key, (tokens, now), timeout)
+
+        record_throttle_metric(scope, self.key_type, 'allowed' if allowed else 'throttled')
+        if not allowed:
+            logger.warning("Throttled %s request on scope %s", self.key_type, scope)
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    key_type = 'ip'
+
+class AccountTokenBucketThrottle(TokenBucketThrottle):
+    """Buckets on the request field named by ``view.throttle_account_field`` (default ``email``)."""
+    key_type = 'account'
+
+    def get_ident_value(self, request, view):
+        if not isinstance(request.data, dict):
+            return None
+        value = request.data.get(getattr(view, 'throttle_account_field', 'email'))
+        if value in (None, ''):
+            return None
+        return str(value).strip().lower()
@@ -1,7 +1,8 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
-from django.conf.urls.static import static
+from performance.views import metrics
+from .media import serve_media
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -16,11 +17,14 @@ urlpatterns = [
                 path("", include("team.urls")),
                 path("", include("series.urls")),
                 path("", include("quotation.urls")),
-                # path("", include("job_execution.urls")),
+                path("", include("reference_data.urls")),
+                path("", include("archive.urls")),
+                path("", include("changelog.urls")),
+                path("", include("job_execution.urls")),
             ]
         ),
     ),
     path("documentation/", include("documentation.urls")),
+    path("metrics", metrics, name="metrics"),
+    re_path(rf"^{settings.MEDIA_URL.lstrip('/')}(?P<path>.*)$", serve_media, name="media"),
 ]
-
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ChangelogConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'changelog'
+
+    def ready(self):
+        from .tracking import track_models
+        track_models()
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+class ChangeLogEntry(models.Model):
+    """
+    One committed create, update or delete of a tracked record. ``changes`` maps each
+    changed column to ``[old, new]``; creates list the non-empty initial values with
+    ``old`` as null and deletes carry no diff.
+    """
+    ACTION_CHOICES = [('create', 'Create'), ('update', 'Update'), ('delete', 'Delete')]
+
+    model = models.CharField(max_length=30)
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=6, choices=ACTION_CHOICES)
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+        db_constraint=False, related_name='+',
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['model', 'object_id', 'created_at'], name='changelog_object_time'),
+            models.Index(fields=['created_at'], name='changelog_time'),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.model} {self.object_id}"
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+from .models import ChangeLogEntry
+
+class ChangeLogEntrySerializer(serializers.ModelSerializer):
+    actor_name = serializers.CharField(source='actor.username', read_only=True, default=None)
+
+    class Meta:
+        model = ChangeLogEntry
+        fields = ['id', 'model', 'object_id', 'action', 'changes', 'actor', 'actor_name', 'created_at']
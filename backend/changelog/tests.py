@@ -0,0 +1,59 @@
+from django.db import transaction
+from django.test import TestCase
+from rfq.models import RFQ
+from .models import ChangeLogEntry
+
+class ChangeLogListTests(TestCase):
+    def test_rejects_malformed_filters(self):
+        for query in ('actor=abc', 'object_id=1x', 'since=2024-13-45T00:00:00', 'until=yesterday'):
+            with self.subTest(query=query):
+                response = self.client.get(f'/api/change-log/?{query}')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(query.split('=')[0], response.json())
+
+    def test_filters_one_record(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            rfq = RFQ.objects.create(company_name='Acme')
+            RFQ.objects.create(company_name='Globex')
+        response = self.client.get(f'/api/change-log/?model=rfq&object_id={rfq.pk}&since=2000-01-01T00:00:00')
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([(entry['object_id'], entry['action']) for entry in results], [(rfq.pk, 'create')])
+
+class ChangeLogBufferingTests(TestCase):
+    def test_entries_are_inserted_in_one_statement_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            for name in ('Acme', 'Globex', 'Initech'):
+                RFQ.objects.create(company_name=name)
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(ChangeLogEntry.objects.exists())
+        with self.assertNumQueries(1):
+            callbacks[0]()
+        self.assertEqual(ChangeLogEntry.objects.filter(action='create').count(), 3)
+
+    def test_rolled_back_savepoint_drops_only_its_entries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            kept = RFQ.objects.create(company_name='Kept')
+            try:
+                with transaction.atomic():
+                    RFQ.objects.create(company_name='Discarded')
+                    kept.company_name = 'Renamed inside the savepoint'
+                    kept.save()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            after = RFQ.objects.create(company_name='After')
+        # SQLite may hand the discarded row's id to the next insert, so compare entries, not ids.
+        self.assertEqual(
+            list(ChangeLogEntry.objects.order_by('id').values_list('object_id', 'action', 'changes__company_name')),
+            [(kept.pk, 'create', [None, 'Kept']), (after.pk, 'create', [None, 'After'])],
+        )
+
+    def test_committed_savepoint_entries_are_kept(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            rfq = RFQ.objects.create(company_name='Acme')
+            with transaction.atomic():
+                rfq.company_name = 'Acme Corp'
+                rfq.save()
+        entry = ChangeLogEntry.objects.get(action='update')
+        self.assertEqual(entry.changes, {'company_name': ['Acme', 'Acme Corp']})
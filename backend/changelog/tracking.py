@@ -0,0 +1,137 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.db import connections, transaction
+from django.db.models.fields.files import FieldFile
+from django.db.models.signals import post_init, post_save, post_delete
+from .models import ChangeLogEntry
+
+TRACKED_MODELS = (
+    ('rfq', 'rfq.RFQ'),
+    ('quotation', 'quotation.Quotation'),
+    ('purchase_order', 'quotation.PurchaseOrder'),
+    ('work_order', 'job_execution.WorkOrder'),
+)
+
+# model class -> (key stored in ChangeLogEntry.model, logged fields: concrete, minus pk and timestamps)
+TRACKED = {}
+
+current_request = ContextVar('changelog_request', default=None)
+_suspended = ContextVar('changelog_suspended', default=False)
+
+@contextmanager
+def suspended():
+    """Skip change logging inside the block, e.g. for data fixes and benchmarks."""
+    token = _suspended.set(True)
+    try:
+        yield
+    finally:
+        _suspended.reset(token)
+
+def current_actor_id():
+    user = getattr(current_request.get(), 'user', None)
+    if user is not None and user.is_authenticated:
+        return user.pk
+    return None
+
+def encode(value):
+    return value.name if isinstance(value, FieldFile) else value
+
+def remember(sender, instance, **kwargs):
+    # Plain dict copy of the loaded columns; deferred fields are simply absent.
+    state = instance.__dict__
+    instance._changelog_state = {field.attname: state[field.attname] for field in TRACKED[sender][1] if field.attname in state}
+
+def diff(fields, old, state, created, update_fields):
+    changes = {}
+    for field in fields:
+        name = field.attname
+        if name not in state:
+            continue
+        if update_fields is not None and field.name not in update_fields and name not in update_fields:
+            continue
+        new = state[name]
+        if created:
+            if new is not None and new != '':
+                changes[name] = [None, encode(new)]
+        elif name in old and old[name] != new:
+            # Serializers may assign strings to date/decimal fields; compare like the database does.
+            try:
+                coerced = field.to_python(new)
+            except ValidationError:
+                coerced = new
+            if old[name] != coerced:
+                changes[name] = [encode(old[name]), encode(coerced)]
+    return changes
+
+def record_save(sender, instance, created, raw, using, update_fields, **kwargs):
+    if raw or _suspended.get():
+        return
+    key, fields = TRACKED[sender]
+    changes = diff(fields, getattr(instance, '_changelog_state', {}), instance.__dict__, created, update_fields)
+    remember(sender, instance)
+    if created or changes:
+        enqueue(using, ChangeLogEntry(
+            model=key, object_id=instance.pk, action='create' if created else 'update',
+            changes=changes, actor_id=current_actor_id(),
+        ))
+
+def record_delete(sender, instance, using, **kwargs):
+    if _suspended.get():
+        return
+    enqueue(using, ChangeLogEntry(
+        model=TRACKED[sender][0], object_id=instance.pk, action='delete', actor_id=current_actor_id(),
+    ))
+
+class PendingEntries:
+    """Entries written in one transaction (or savepoint), inserted together on commit."""
+
+    def __init__(self, using):
+        self.using = using
+        self.entries = []
+
+    def __call__(self):
+        ChangeLogEntry.objects.using(self.using).bulk_create(self.entries)
+
+def enqueue(using, entry):
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        ChangeLogEntry.objects.using(using).bulk_create([entry])
+        return
+    # One buffer per savepoint level: rolling back a savepoint drops its on_commit
+    # callback, and with it exactly the entries written inside that savepoint.
+    buffers = connection.__dict__.setdefault('changelog_buffers', {})
+    level = tuple(connection.savepoint_ids)
+    buffer = buffers.get(level)
+    # run_on_commit is private: (savepoint ids, callback, robust) tuples. changelog/tests.py
+    # pins the behaviour this relies on.
+    registered = {id(func) for _, func, _ in connection.run_on_commit}
+    if buffer is None or id(buffer) not in registered:
+        for stale_level, stale in list(buffers.items()):
+            if id(stale) not in registered:
+                del buffers[stale_level]
+        buffer = buffers[level] = PendingEntries(using)
+        transaction.on_commit(buffer, using=using, robust=True)
+    buffer.entries.append(entry)
+
+def track_models():
+    for key, label in TRACKED_MODELS:
+        if not apps.is_installed(label.split('.')[0]):
+            continue
+        model = apps.get_model(label)
+        TRACKED[model] = (key, [
+            field for field in model._meta.concrete_fields
+            if not field.primary_key and not getattr(field, 'auto_now', False) and not getattr(field, 'auto_now_add', False)
+        ])
+        post_init.connect(remember, sender=model, dispatch_uid=f'changelog:{label}:init')
+        post_save.connect(record_save, sender=model, dispatch_uid=f'changelog:{label}:save')
+        post_delete.connect(record_delete, sender=model, dispatch_uid=f'changelog:{label}:delete')
+
+def untrack_models():
+    for model in list(TRACKED):
+        label = model._meta.label
+        post_init.disconnect(sender=model, dispatch_uid=f'changelog:{label}:init')
+        post_save.disconnect(sender=model, dispatch_uid=f'changelog:{label}:save')
+        post_delete.disconnect(sender=model, dispatch_uid=f'changelog:{label}:delete')
+    TRACKED.clear()
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import ChangeLogListView
+
+urlpatterns = [
+    path('change-log/', ChangeLogListView.as_view(), name='change-log'),
+]
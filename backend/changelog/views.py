@@ -0,0 +1,47 @@
+from django.utils.dateparse import parse_datetime
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import AllowAny
+from .models import ChangeLogEntry
+from .serializers import ChangeLogEntrySerializer
+
+class ChangeLogPagination(CursorPagination):
+    page_size = 50
+    page_size_query_param = 'limit'
+    max_page_size = 500
+    ordering = ('-created_at', '-id')
+
+class ChangeLogListView(generics.ListAPIView):
+    """
+    Newest-first change history. Filter by ``model`` and ``object_id`` for one record's
+    history and by ``since``/``until`` (ISO datetimes) for a time window; both paths
+    are served by an index.
+    """
+    permission_classes = [AllowAny]
+    serializer_class = ChangeLogEntrySerializer
+    pagination_class = ChangeLogPagination
+
+    def get_queryset(self):
+        params = self.request.query_params
+        queryset = ChangeLogEntry.objects.select_related('actor')
+        if params.get('model'):
+            queryset = queryset.filter(model=params['model'])
+        if params.get('object_id'):
+            if not params['object_id'].isdigit():
+                raise ValidationError({'object_id': "Must be an integer."})
+            queryset = queryset.filter(object_id=params['object_id'])
+        if params.get('actor'):
+            if not params['actor'].isdigit():
+                raise ValidationError({'actor': "Must be an integer."})
+            queryset = queryset.filter(actor_id=params['actor'])
+        for param, lookup in (('since', 'created_at__gte'), ('until', 'created_at__lt')):
+            if params.get(param):
+                try:
+                    value = parse_datetime(params[param])
+                except ValueError:
+                    value = None
+                if value is None:
+                    raise ValidationError({param: "Must be an ISO 8601 datetime."})
+                queryset = queryset.filter(**{lookup: value})
+        return queryset
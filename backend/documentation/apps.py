@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class DocumentationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'documentation'
+
+    def ready(self):
+        from .schema import preload_schema
+        preload_schema()
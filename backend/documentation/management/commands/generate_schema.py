@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from documentation.schema import build_schema, read_schema_file, source_fingerprint, write_schema_file
+
+class Command(BaseCommand):
+    help = "Pre-generate the OpenAPI schema served by the documentation endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=None, help="Defaults to settings.DOCUMENTATION_SCHEMA_FILE.")
+        parser.add_argument('--check', action='store_true', help="Only verify that the stored schema matches the code.")
+
+    def handle(self, *args, **options):
+        output = options['output'] or getattr(settings, 'DOCUMENTATION_SCHEMA_FILE', None)
+        if not output:
+            raise CommandError("No output path given and DOCUMENTATION_SCHEMA_FILE is not set.")
+        fingerprint = source_fingerprint()
+        if options['check']:
+            if read_schema_file(output, fingerprint) is None:
+                raise CommandError(f"The API schema at {output} is missing or stale; run generate_schema.")
+            self.stdout.write(self.style.SUCCESS(f"API schema at {output} is up to date."))
+            return
+        schema = build_schema(fingerprint)
+        write_schema_file(schema, output)
+        self.stdout.write(self.style.SUCCESS(f"Wrote API schema to {output}"))
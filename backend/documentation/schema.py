@@ -0,0 +1,111 @@
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from django.conf import settings
+from django.test import RequestFactory
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+from drf_yasg.generators import OpenAPISchemaGenerator
+from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_INFO = openapi.Info(
+   title="PRIME API",
+   default_version='v1',
+   description="In Production",
+   terms_of_service="https://www.google.com/policies/terms/",
+   contact=openapi.Contact(email="contact@snippets.local"),
+   license=openapi.License(name="BSD License"),
+)
+
+_lock = threading.Lock()
+_schema = None
+
+def source_fingerprint():
+    """Hash of the project's Python sources, used to tell whether a stored schema is stale."""
+    digest = hashlib.sha256()
+    base_dir = Path(settings.BASE_DIR)
+    for path in sorted(base_dir.rglob('*.py')):
+        relative = path.relative_to(base_dir)
+        if relative.parts[0] in ('venv', 'env', '.venv') or 'migrations' in relative.parts:
+            continue
+        digest.update(str(relative).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def build_schema(fingerprint):
+    # Views expect a request during introspection; host and schemes are dropped so
+    # the UI resolves endpoints against whatever origin serves the schema.
+    request = Request(RequestFactory().get('/documentation/swagger.json/'))
+    swagger = OpenAPISchemaGenerator(SCHEMA_INFO).get_schema(request=request, public=True)
+    swagger.pop('host', None)
+    swagger.pop('schemes', None)
+    json_body = OpenAPICodecJson(validators=[]).encode(swagger)
+    return {
+        'fingerprint': fingerprint,
+        'etag': hashlib.sha256(json_body).hexdigest()[:32],
+        'json': json_body,
+        'yaml': OpenAPICodecYaml(validators=[]).encode(swagger),
+    }
+
+def write_schema_file(schema, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        'fingerprint': schema['fingerprint'],
+        'etag': schema['etag'],
+        'json': schema['json'].decode('utf-8'),
+        'yaml': schema['yaml'].decode('utf-8'),
+    }))
+
+def read_schema_file(path, fingerprint=None):
+    """Load a stored schema; with a ``fingerprint``, only if it was built from those sources."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if fingerprint is not None and data.get('fingerprint') != fingerprint:
+        logger.info("Stored API schema at %s is stale; rebuilding.", path)
+        return None
+    return {
+        'fingerprint': data.get('fingerprint'),
+        'etag': data['etag'],
+        'json': data['json'].encode('utf-8'),
+        'yaml': data['yaml'].encode('utf-8'),
+    }
+
+def verify_stored_schema():
+    # Deploys run generate_schema, so production trusts the stored file instead of hashing
+    # every source file; under DEBUG the file is rebuilt whenever the code changes.
+    return getattr(settings, 'DOCUMENTATION_SCHEMA_VERIFY', settings.DEBUG)
+
+def preload_schema():
+    """Load the stored schema at startup so no request pays for reading or building it."""
+    global _schema
+    path = getattr(settings, 'DOCUMENTATION_SCHEMA_FILE', None)
+    if _schema is None and path and not verify_stored_schema():
+        with _lock:
+            if _schema is None:
+                _schema = read_schema_file(path)
+
+def get_schema():
+    """Return the pre-generated schema, loading it from disk or building it once per process."""
+    global _schema
+    if _schema is None:
+        with _lock:
+            if _schema is None:
+                path = getattr(settings, 'DOCUMENTATION_SCHEMA_FILE', None)
+                fingerprint = source_fingerprint() if verify_stored_schema() else None
+                _schema = path and read_schema_file(path, fingerprint)
+                if not _schema:
+                    logger.warning("No pre-generated API schema at %s; building it now. Run generate_schema on deploy.", path)
+                    _schema = build_schema(fingerprint or source_fingerprint())
+    return _schema
+
+def reset_schema():
+    global _schema
+    with _lock:
+        _schema = None
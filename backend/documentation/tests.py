@@ -1,3 +1,58 @@
-from django.test import TestCase
+import json
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from django.core.management import CommandError, call_command
+from django.test import RequestFactory, TestCase, override_settings
+from . import schema
+from .urls import schema_view
 
-# Create your tests here.
+class SchemaTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.path = Path(self.directory) / 'schema.json'
+        schema.reset_schema()
+        self.addCleanup(schema.reset_schema)
+
+    def test_static_schema_matches_dynamic_schema(self):
+        dynamic_view = schema_view.without_ui(cache_timeout=0)
+        dynamic = dynamic_view(RequestFactory().get('/documentation/swagger.json/'), format='json')
+        dynamic.render()
+        dynamic_schema = json.loads(dynamic.content)
+        static_schema = json.loads(schema.get_schema()['json'])
+        for key in ('host', 'schemes'):
+            dynamic_schema.pop(key, None)
+            static_schema.pop(key, None)
+        self.assertEqual(static_schema, dynamic_schema)
+
+    def test_schema_is_served_with_etag(self):
+        response = self.client.get('/documentation/swagger.json/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        response = self.client.get('/documentation/swagger.json/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_preload_trusts_the_deployed_file_without_hashing_sources(self):
+        with override_settings(DOCUMENTATION_SCHEMA_FILE=self.path, DOCUMENTATION_SCHEMA_VERIFY=False):
+            call_command('generate_schema', stdout=StringIO())
+            schema.reset_schema()
+            with mock.patch.object(schema, 'source_fingerprint') as fingerprint, \
+                    mock.patch.object(schema, 'build_schema') as build:
+                schema.preload_schema()
+                loaded = schema.get_schema()
+        fingerprint.assert_not_called()
+        build.assert_not_called()
+        self.assertEqual(loaded['etag'], json.loads(self.path.read_text())['etag'])
+
+    def test_check_reports_a_stale_schema(self):
+        with override_settings(DOCUMENTATION_SCHEMA_FILE=self.path):
+            with self.assertRaises(CommandError):
+                call_command('generate_schema', check=True, stdout=StringIO())
+            call_command('generate_schema', stdout=StringIO())
+            call_command('generate_schema', check=True, stdout=StringIO())
+            with mock.patch('documentation.management.commands.generate_schema.source_fingerprint', return_value='changed'):
+                with self.assertRaises(CommandError):
+                    call_command('generate_schema', check=True, stdout=StringIO())
@@ -1,23 +1,17 @@
 from django.urls import path
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
+from .schema import SCHEMA_INFO
+from .views import schema_file
 
 schema_view = get_schema_view(
-   openapi.Info(
-      title="PRIME API",
-      default_version='v1',
-      description="In Production",
-      terms_of_service="https://www.google.com/policies/terms/",
-      contact=openapi.Contact(email="contact@snippets.local"),
-      license=openapi.License(name="BSD License"),
-   ),
+   SCHEMA_INFO,
    public=True,
    permission_classes=(permissions.AllowAny,),
 )
 
 urlpatterns = [
-   path('swagger.<format>/', schema_view.without_ui(cache_timeout=0), name='schema-json'),
+   path('swagger.<format>/', schema_file, name='schema-json'),
    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-]
\ No newline at end of file
+]
@@ -1,3 +1,23 @@
-from django.shortcuts import render
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.views.decorators.http import require_GET
+from backend.compression import etag_matches
+from .schema import get_schema
 
-# Create your views here.
+CONTENT_TYPES = {
+    'json': 'application/json',
+    'yaml': 'application/yaml',
+}
+
+@require_GET
+def schema_file(request, format):
+    if format not in CONTENT_TYPES:
+        raise Http404
+    schema = get_schema()
+    etag = f'"{schema["etag"]}-{format}"'
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(schema[format], content_type=CONTENT_TYPES[format])
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    return response
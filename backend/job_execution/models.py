@@ -18,6 +18,13 @@ class WorkOrder(models.Model):
     current_status = models.CharField(max_length=50, default='Collected')
     work_order_type = models.CharField(max_length=20, choices=[('single', 'Single WO'), ('split', 'Split WO')], default='single')
 
+    class Meta:
+        # Status tabs and "my work orders" list newest first; both filter and sort from these.
+        indexes = [
+            models.Index(fields=['current_status', 'created_at'], name='workorder_status_created'),
+            models.Index(fields=['assigned_to', 'current_status', 'created_at'], name='workorder_assignee_status'),
+        ]
+
     def __str__(self):
         return f"WO {self.work_order_no} for Quotation {self.quotation.quotation_no}"
 
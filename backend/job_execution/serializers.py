@@ -4,24 +4,37 @@ from django.db.models import Max
 from .models import WorkOrder, WorkOrderItem
 from quotation.models import Quotation, PurchaseOrder
 from team.models import TeamMember
+from backend.sparse import SparseFieldsetSerializerMixin
+from archive.models import ArchivedRecord
 
 class WorkOrderItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = WorkOrderItem
         fields = ['id', 'item_name', 'product_name', 'quantity', 'unit', 'unit_price']
 
-class WorkOrderSerializer(serializers.ModelSerializer):
+class WorkOrderSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    relations = {
+        'items': {'fields': ('items',), 'prefetch_related': ('items',)},
+        'quotation': {'fields': ('quotation_no',), 'select_related': ('quotation',)},
+        'purchase_order': {'fields': ('client_po_number',), 'select_related': ('purchase_order',)},
+        'assignee': {'fields': ('assigned_to_name',), 'select_related': ('assigned_to',)},
+    }
+
     items = WorkOrderItemSerializer(many=True, required=False)
     quotation = serializers.PrimaryKeyRelatedField(queryset=Quotation.objects.all())
     purchase_order = serializers.PrimaryKeyRelatedField(queryset=PurchaseOrder.objects.all(), required=False, allow_null=True)
     assigned_to = serializers.PrimaryKeyRelatedField(queryset=TeamMember.objects.all(), required=False, allow_null=True)
+    quotation_no = serializers.CharField(source='quotation.quotation_no', read_only=True)
+    client_po_number = serializers.CharField(source='purchase_order.client_po_number', read_only=True, default=None)
+    assigned_to_name = serializers.CharField(source='assigned_to.name', read_only=True, default=None)
 
     class Meta:
         model = WorkOrder
         fields = [
             'id', 'work_order_no', 'quotation', 'purchase_order', 'assigned_to', 'created_at',
             'date_received', 'exp_date_completion', 'onsite_lab', 'range', 'serial_number',
-            'site_location', 'remarks', 'current_status', 'work_order_type', 'items'
+            'site_location', 'remarks', 'current_status', 'work_order_type', 'items',
+            'quotation_no', 'client_po_number', 'assigned_to_name'
         ]
         read_only_fields = ['work_order_no', 'created_at']
 
@@ -60,6 +73,8 @@ class WorkOrderSerializer(serializers.ModelSerializer):
                     new_number = 1
             else:
                 new_number = 1
+            # Archived records keep their numbers, so never hand one out again.
+            new_number = max(new_number, ArchivedRecord.last_sequence('work_order', prefix) + 1)
             work_order_no = f"{prefix}{new_number:07d}"
             validated_data['work_order_no'] = work_order_no
 
@@ -71,28 +86,31 @@ class WorkOrderSerializer(serializers.ModelSerializer):
             work_order = WorkOrder.objects.create(**validated_data)
 
             # Create associated items
-            for item_data in items_data:
-                WorkOrderItem.objects.create(work_order=work_order, **item_data)
+            WorkOrderItem.objects.bulk_create([
+                WorkOrderItem(work_order=work_order, **item_data) for item_data in items_data
+            ])
 
             return work_order
 
     def update(self, instance, validated_data):
-        items_data = validated_data.pop('items', [])
-        instance.date_received = validated_data.get('date_received', instance.date_received)
-        instance.exp_date_completion = validated_data.get('exp_date_completion', instance.exp_date_completion)
-        instance.onsite_lab = validated_data.get('onsite_lab', instance.onsite_lab)
-        instance.range = validated_data.get('range', instance.range)
-        instance.serial_number = validated_data.get('serial_number', instance.serial_number)
-        instance.site_location = validated_data.get('site_location', instance.site_location)
-        instance.remarks = validated_data.get('remarks', instance.remarks)
-        instance.current_status = validated_data.get('current_status', instance.current_status)
-        instance.work_order_type = validated_data.get('work_order_type', instance.work_order_type)
-        instance.assigned_to = validated_data.get('assigned_to', instance.assigned_to) or instance.quotation.rfq.assign_to
-        instance.save()
-
-        # Update items
-        instance.items.all().delete()
-        for item_data in items_data:
-            WorkOrderItem.objects.create(work_order=instance, **item_data)
-
-        return instance
\ No newline at end of file
+        with transaction.atomic():
+            items_data = validated_data.pop('items', [])
+            instance.date_received = validated_data.get('date_received', instance.date_received)
+            instance.exp_date_completion = validated_data.get('exp_date_completion', instance.exp_date_completion)
+            instance.onsite_lab = validated_data.get('onsite_lab', instance.onsite_lab)
+            instance.range = validated_data.get('range', instance.range)
+            instance.serial_number = validated_data.get('serial_number', instance.serial_number)
+            instance.site_location = validated_data.get('site_location', instance.site_location)
+            instance.remarks = validated_data.get('remarks', instance.remarks)
+            instance.current_status = validated_data.get('current_status', instance.current_status)
+            instance.work_order_type = validated_data.get('work_order_type', instance.work_order_type)
+            instance.assigned_to = validated_data.get('assigned_to', instance.assigned_to) or instance.quotation.rfq.assign_to
+            instance.save()
+
+            # Update items
+            instance.items.all().delete()
+            WorkOrderItem.objects.bulk_create([
+                WorkOrderItem(work_order=instance, **item_data) for item_data in items_data
+            ])
+
+            return instance
\ No newline at end of file
@@ -1,3 +1,126 @@
+import json
+from datetime import date
+from unittest import mock
 from django.test import TestCase
+from quotation.models import PurchaseOrder, Quotation
+from rfq.models import RFQ
+from team.models import TeamMember
+from .models import WorkOrder, WorkOrderItem
 
-# Create your tests here.
+STATUSES = ['Collected', 'Processing', 'Delivered']
+
+class WorkOrderTestCase(TestCase):
+    def setUp(self):
+        self.engineer = TeamMember.objects.create(name='Dana', email='dana@example.com')
+        self.other_engineer = TeamMember.objects.create(name='Lee', email='lee@example.com')
+        rfq = RFQ.objects.create(company_name='Acme', current_status='Completed', assign_to=self.engineer)
+        self.quotation = Quotation.objects.create(quotation_no='QT-0000001', rfq=rfq)
+        self.purchase_order = PurchaseOrder.objects.create(quotation=self.quotation, client_po_number='PO-1', order_type='full')
+        self.other_quotation = Quotation.objects.create(
+            quotation_no='QT-0000002', rfq=RFQ.objects.create(company_name='Globex', current_status='Completed'),
+        )
+        self.work_orders = []
+
+    def create_work_orders(self, count, **fields):
+        start = WorkOrder.objects.count()
+        for index in range(start, start + count):
+            work_order = WorkOrder.objects.create(
+                work_order_no=f'WO-{index + 1:07d}', date_received=date(2024, 1, 10),
+                **{'quotation': self.quotation, 'current_status': STATUSES[index % len(STATUSES)], **fields},
+            )
+            WorkOrderItem.objects.create(work_order=work_order, item_name=f'Gauge {index}', quantity=1)
+            self.work_orders.append(work_order)
+
+    def get(self, params=''):
+        response = self.client.get(f'/api/work-orders/?{params}')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+class WorkOrderListTests(WorkOrderTestCase):
+    def test_status_tabs_cost_the_same_number_of_queries(self):
+        for count in (3, 12):
+            self.create_work_orders(count)
+            for status in STATUSES:
+                with self.subTest(status=status, total=WorkOrder.objects.count()), self.assertNumQueries(2):
+                    rows = self.get(f'current_status={status}')
+                self.assertEqual({row['current_status'] for row in rows}, {status})
+                self.assertTrue(all(row['items'] for row in rows))
+
+    def test_filters(self):
+        self.create_work_orders(2, assigned_to=self.engineer, purchase_order=self.purchase_order)
+        self.create_work_orders(1, assigned_to=self.other_engineer, quotation=self.other_quotation)
+        mine = self.get(f'assigned_to={self.engineer.pk}')
+        self.assertEqual({row['assigned_to_name'] for row in mine}, {'Dana'})
+        self.assertEqual(len(mine), 2)
+        self.assertEqual([row['quotation_no'] for row in self.get(f'quotation={self.other_quotation.pk}')], ['QT-0000002'])
+        self.assertEqual({row['client_po_number'] for row in self.get(f'purchase_order={self.purchase_order.pk}')}, {'PO-1'})
+        response = self.client.get('/api/work-orders/?assigned_to=dana')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('assigned_to', response.json())
+
+    def test_list_is_newest_first(self):
+        self.create_work_orders(4)
+        expected = [work_order.work_order_no for work_order in reversed(self.work_orders)]
+        self.assertEqual([row['work_order_no'] for row in self.get()], expected)
+
+class WorkOrderPaginationTests(WorkOrderTestCase):
+    def test_pages_are_opt_in(self):
+        self.create_work_orders(3)
+        self.assertIsInstance(self.get(), list)
+        page = self.get('limit=2')
+        self.assertEqual(len(page['results']), 2)
+        self.assertIsNotNone(page['next'])
+
+    def test_cursor_walks_every_row_once(self):
+        self.create_work_orders(7)
+        seen = []
+        page = self.get('limit=3')
+        while True:
+            seen.extend(row['work_order_no'] for row in page['results'])
+            if not page['next']:
+                break
+            with self.assertNumQueries(2):
+                response = self.client.get(page['next'])
+            page = response.json()
+        self.assertEqual(seen, [work_order.work_order_no for work_order in reversed(self.work_orders)])
+
+    def test_page_size_is_capped(self):
+        self.create_work_orders(3)
+        self.assertEqual(len(self.get('limit=1000')['results']), 3)
+        with mock.patch('job_execution.views.WorkOrderPagination.max_page_size', 2):
+            self.assertEqual(len(self.get('limit=1000')['results']), 2)
+
+class WorkOrderUpdateTests(WorkOrderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_work_orders(1)
+        self.work_order = self.work_orders[0]
+
+    def put(self, **fields):
+        body = {
+            'quotation': self.quotation.pk, 'date_received': '2024-02-01', 'current_status': 'Processing',
+            'items': [{'item_name': 'Caliper', 'quantity': 2}, {'item_name': 'Scale', 'quantity': 1}],
+            **fields,
+        }
+        return self.client.put(f'/api/work-orders/{self.work_order.pk}/', json.dumps(body), content_type='application/json')
+
+    def test_put_replaces_items(self):
+        response = self.put()
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual([item['item_name'] for item in response.json()['items']], ['Caliper', 'Scale'])
+        self.assertEqual(
+            list(self.work_order.items.order_by('id').values_list('item_name', 'quantity')),
+            [('Caliper', 2), ('Scale', 1)],
+        )
+        self.work_order.refresh_from_db()
+        self.assertEqual((self.work_order.current_status, self.work_order.date_received), ('Processing', date(2024, 2, 1)))
+        # Without an explicit assignee the RFQ's sales person is used.
+        self.assertEqual(self.work_order.assigned_to, self.engineer)
+
+    def test_failed_item_write_rolls_back_the_update(self):
+        with mock.patch.object(WorkOrderItem.objects, 'bulk_create', side_effect=RuntimeError('disk full')):
+            with self.assertRaises(RuntimeError):
+                self.put()
+        self.work_order.refresh_from_db()
+        self.assertEqual(self.work_order.current_status, 'Collected')
+        self.assertEqual(list(self.work_order.items.values_list('item_name', flat=True)), ['Gauge 0'])
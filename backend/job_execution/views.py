@@ -0,0 +1,51 @@
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import AllowAny
+from backend.sparse import SparseFieldsetViewMixin
+from .models import WorkOrder
+from .serializers import WorkOrderSerializer
+
+ID_FILTERS = {'assigned_to': 'assigned_to_id', 'quotation': 'quotation_id', 'purchase_order': 'purchase_order_id'}
+
+def work_order_queryset(params):
+    queryset = (
+        WorkOrder.objects.select_related('quotation', 'purchase_order', 'assigned_to')
+        .prefetch_related('items')
+        .order_by('-created_at', '-id')
+    )
+    current_status = params.get('current_status', None)
+    if current_status:
+        queryset = queryset.filter(current_status=current_status)
+    for param, field in ID_FILTERS.items():
+        value = params.get(param, None)
+        if value:
+            if not value.isdigit():
+                raise ValidationError({param: "Must be an integer."})
+            queryset = queryset.filter(**{field: value})
+    return queryset
+
+class WorkOrderPagination(CursorPagination):
+    """
+    Keyset pages over (created_at, id), so a status tab costs the same on page 500 as on
+    page 1. Pages are opt-in with ``?limit=`` or ``?cursor=``; without them the list
+    stays a plain array, which is what the current frontend expects.
+    """
+    page_size = 50
+    page_size_query_param = 'limit'
+    max_page_size = 200
+    ordering = ('-created_at', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+class WorkOrderViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
+    permission_classes = [AllowAny]
+    queryset = WorkOrder.objects.all()
+    serializer_class = WorkOrderSerializer
+    pagination_class = WorkOrderPagination
+
+    def get_queryset(self):
+        return work_order_queryset(self.request.query_params)
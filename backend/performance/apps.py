@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class PerformanceConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'performance'
+
+    def ready(self):
+        from .instrumentation import instrument_serializers
+        from .querywatch import install_query_hooks
+        instrument_serializers()
+        # Connections opened later, e.g. in sync_to_async worker threads, get the dispatcher too.
+        connection_created.connect(install_query_hooks, dispatch_uid='performance:query-hooks')
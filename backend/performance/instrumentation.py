@@ -0,0 +1,96 @@
+import contextvars
+import threading
+import time
+from rest_framework.serializers import BaseSerializer
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+current_timings = contextvars.ContextVar('current_timings', default=None)
+
+class RequestTimings:
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.serializer_depth = 0
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_seconds += time.perf_counter() - started
+
+class RouteMetrics:
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+
+class MetricsRegistry:
+    """Per-process request latency histograms keyed by (route, method, status class)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def observe(self, route, method, status, total_seconds, timings):
+        key = (route, method, f'{status // 100}xx')
+        with self._lock:
+            metrics = self._routes.get(key)
+            if metrics is None:
+                metrics = self._routes[key] = RouteMetrics()
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if total_seconds <= bound:
+                    metrics.bucket_counts[index] += 1
+            metrics.count += 1
+            metrics.seconds += total_seconds
+            metrics.db_queries += timings.db_queries
+            metrics.db_seconds += timings.db_seconds
+            metrics.serializer_seconds += timings.serializer_seconds
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                key: {
+                    'bucket_counts': list(metrics.bucket_counts),
+                    'count': metrics.count,
+                    'seconds': metrics.seconds,
+                    'db_queries': metrics.db_queries,
+                    'db_seconds': metrics.db_seconds,
+                    'serializer_seconds': metrics.serializer_seconds,
+                }
+                for key, metrics in self._routes.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+registry = MetricsRegistry()
+
+def instrument_serializers():
+    """Wrap BaseSerializer.data so top-level serialization time is charged to the sampled request."""
+    original = BaseSerializer.data
+    if getattr(original.fget, 'instrumented', False):
+        return
+
+    def data(self):
+        timings = current_timings.get()
+        if timings is None:
+            return original.fget(self)
+        timings.serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return original.fget(self)
+        finally:
+            timings.serializer_depth -= 1
+            if timings.serializer_depth == 0:
+                timings.serializer_seconds += time.perf_counter() - started
+
+    data.instrumented = True
+    BaseSerializer.data = property(data)
@@ -0,0 +1,70 @@
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from item.importer import import_catalog
+
+class Rollback(Exception):
+    pass
+
+class Command(BaseCommand):
+    help = "Measure catalog CSV import throughput and peak memory for several file sizes, inside a rolled-back transaction."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, action='append', help="File sizes to test; repeatable. Defaults to 20000 and 100000.")
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        results = []
+        for rows in options['rows'] or [20000, 100000]:
+            paths = [self.write_csv(rows), self.write_csv(rows)]
+            try:
+                results.append({'rows': rows, 'file_bytes': os.path.getsize(paths[0]), **self.run(paths, options['batch_size'])})
+            finally:
+                for path in paths:
+                    os.unlink(path)
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def write_csv(self, rows):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, newline='') as handle:
+            handle.write('name,price\n')
+            for index in range(rows):
+                handle.write(f"Synthetic part {index:07d},{self.random.randint(100, 9999999) / 100:.2f}\n")
+        return handle.name
+
+    def import_file(self, path, batch_size):
+        with open(path, newline='') as handle:
+            return import_catalog('item', handle, batch_size=batch_size)
+
+    def run(self, paths, batch_size):
+        passes = {}
+        try:
+            with transaction.atomic():
+                # The first file inserts every row; the second has the same names with new prices.
+                for label, path in (('insert', paths[0]), ('upsert', paths[1])):
+                    started = time.perf_counter()
+                    report = self.import_file(path, batch_size)
+                    elapsed = time.perf_counter() - started
+                    rows = report.inserted + report.updated + report.unchanged + report.rejected
+                    passes[label] = {
+                        'seconds': round(elapsed, 2),
+                        'rows_per_second': round(rows / elapsed, 1) if elapsed else None,
+                        'inserted': report.inserted,
+                        'updated': report.updated,
+                        'unchanged': report.unchanged,
+                    }
+                # Peak Python memory is traced on a separate pass; tracemalloc slows the import down.
+                tracemalloc.start()
+                self.import_file(paths[1], batch_size)
+                passes['peak_memory_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                tracemalloc.stop()
+                raise Rollback
+        except Rollback:
+            pass
+        return passes
@@ -0,0 +1,68 @@
+import json
+import time
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from changelog.models import ChangeLogEntry
+from changelog.tracking import suspended, track_models, untrack_models
+from rfq.models import RFQ
+
+class Command(BaseCommand):
+    help = (
+        "Measure the cost of change logging on an update-heavy workload: load and edit RFQs a "
+        "few per transaction, with tracking disconnected and then enabled. Benchmark rows are "
+        "deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--records', type=int, default=2000)
+        parser.add_argument('--per-transaction', type=int, default=5, help="RFQs edited per transaction, like one save request.")
+        parser.add_argument('--passes', type=int, default=3)
+
+    def handle(self, *args, **options):
+        with suspended():
+            RFQ.objects.bulk_create([
+                RFQ(company_name=f"Changelog benchmark {index}", current_status='Processing')
+                for index in range(options['records'])
+            ])
+        ids = list(RFQ.objects.filter(company_name__startswith="Changelog benchmark ").values_list('pk', flat=True))
+        try:
+            untrack_models()
+            untracked = self.run(ids, options)
+            track_models()
+            tracked = self.run(ids, options)
+        finally:
+            track_models()
+            with suspended():
+                RFQ.objects.filter(pk__in=ids).delete()
+            entries = ChangeLogEntry.objects.filter(model='rfq', object_id__in=ids)
+            tracked['entries_written'] = entries.count()
+            entries.delete()
+
+        report = {
+            'records': len(ids),
+            'per_transaction': options['per_transaction'],
+            'untracked': untracked,
+            'tracked': tracked,
+            'overhead_percent': round((tracked['seconds'] / untracked['seconds'] - 1) * 100, 1) if untracked['seconds'] else None,
+        }
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def run(self, ids, options):
+        size = options['per_transaction']
+        updates = 0
+        started = time.perf_counter()
+        for pass_number in range(options['passes']):
+            for offset in range(0, len(ids), size):
+                with transaction.atomic():
+                    for rfq in RFQ.objects.filter(pk__in=ids[offset:offset + size]):
+                        rfq.due_date = date.today() + timedelta(days=pass_number + 1)
+                        rfq.current_status = 'Completed' if rfq.current_status == 'Processing' else 'Processing'
+                        rfq.save()
+                        updates += 1
+        elapsed = time.perf_counter() - started
+        return {
+            'seconds': round(elapsed, 3),
+            'updates': updates,
+            'microseconds_per_update': round(elapsed / updates * 1e6, 1) if updates else None,
+        }
@@ -0,0 +1,67 @@
+import copy
+import json
+import threading
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from backend.db.pool import PooledDatabaseWrapperMixin, pool_stats
+from performance.benchmarks import summarize
+
+class Command(BaseCommand):
+    help = "Compare per-request connect/query/close latency with and without the connection pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=8)
+
+    def handle(self, *args, **options):
+        alias = options['database']
+        if not isinstance(connections[alias], PooledDatabaseWrapperMixin):
+            raise CommandError(f"Database '{alias}' does not use a pooled engine such as backend.db.mysql.")
+
+        results = {}
+        for label, enabled in (('unpooled', False), ('pooled', True)):
+            results[label] = self.run(alias, enabled, options['requests'], options['concurrency'])
+        results['pool'] = pool_stats().get(alias)
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def run(self, alias, pool_enabled, total, concurrency):
+        settings_dict = copy.deepcopy(connections.settings[alias])
+        settings_dict.setdefault('POOL', {})['ENABLED'] = pool_enabled
+        samples = []
+        errors = []
+        lock = threading.Lock()
+        per_thread = max(1, total // concurrency)
+
+        def worker():
+            try:
+                measure()
+            except Exception as exc:
+                with lock:
+                    errors.append(exc)
+
+        def measure():
+            local = []
+            for _ in range(per_thread):
+                # A fresh wrapper per iteration mirrors a request opening and closing its connection.
+                wrapper = connections.create_connection(alias)
+                wrapper.settings_dict = settings_dict
+                started = time.perf_counter()
+                with wrapper.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+                wrapper.close()
+                local.append((time.perf_counter() - started) * 1000)
+            with lock:
+                samples.extend(local)
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise CommandError(f"{len(errors)} benchmark threads failed: {errors[0]}")
+        return summarize(samples, time.perf_counter() - started)
@@ -0,0 +1,117 @@
+import json
+import platform
+import time
+from contextlib import ExitStack
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client as TestClient
+from django.utils import timezone
+from performance.benchmarks import summarize
+from performance.instrumentation import RequestTimings
+from quotation.models import Quotation
+from rfq.models import RFQ, Client
+
+LIST_ENDPOINTS = [
+    '/api/add-rfqs/',
+    '/api/quotations/',
+    '/api/purchase-orders/',
+    '/api/clients/',
+    '/api/items/',
+    '/api/units/',
+    '/api/teams/',
+    '/api/series/',
+    '/api/reference-data/',
+]
+
+class Command(BaseCommand):
+    help = "Benchmark the main API endpoints in-process and report latency percentiles, query counts and throughput as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help="Measured requests per endpoint.")
+        parser.add_argument('--warmup', type=int, default=5)
+        parser.add_argument('--endpoint', action='append', dest='endpoints', help="Path to benchmark; repeatable. Defaults to the main endpoints.")
+        parser.add_argument('--token', help="JWT access token sent as a Bearer Authorization header.")
+        parser.add_argument('--host', default='localhost')
+        parser.add_argument('--output', help="Write the JSON report to this file instead of stdout.")
+        parser.add_argument('--compare', help="Earlier JSON report to print p95 and query-count deltas against.")
+
+    def handle(self, *args, **options):
+        endpoints = options['endpoints'] or self.default_endpoints()
+        headers = {'HTTP_AUTHORIZATION': f"Bearer {options['token']}"} if options['token'] else {}
+        client = TestClient(SERVER_NAME=options['host'], **headers)
+
+        results = {}
+        for path in endpoints:
+            for _ in range(options['warmup']):
+                client.get(path)
+            results[path] = self.measure(client, path, options['requests'])
+
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connections['default'].vendor,
+            'requests_per_endpoint': options['requests'],
+            'endpoints': results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Wrote report to {options['output']}"))
+        else:
+            self.stdout.write(output)
+        if options['compare']:
+            self.compare(report, options['compare'])
+
+    def default_endpoints(self):
+        endpoints = list(LIST_ENDPOINTS)
+        rfq = RFQ.objects.order_by('-id').values_list('id', flat=True).first()
+        quotation = Quotation.objects.order_by('-id').values_list('id', flat=True).first()
+        company = Client.objects.exclude(company_name=None).values_list('company_name', flat=True).first()
+        if rfq:
+            endpoints.append(f'/api/add-rfqs/{rfq}/')
+        if quotation:
+            endpoints.append(f'/api/quotations/{quotation}/')
+        if company:
+            endpoints.append(f'/api/clients/typeahead/?q={company[:2]}')
+        return endpoints
+
+    def measure(self, client, path, total):
+        samples = []
+        queries = 0
+        statuses = set()
+        started = time.perf_counter()
+        for _ in range(total):
+            timings = RequestTimings()
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings.execute_wrapper))
+                request_started = time.perf_counter()
+                response = client.get(path)
+                samples.append((time.perf_counter() - request_started) * 1000)
+            queries += timings.db_queries
+            statuses.add(response.status_code)
+        if any(status >= 400 for status in statuses):
+            raise CommandError(f"{path} returned {sorted(statuses)}")
+        summary = summarize(samples, time.perf_counter() - started)
+        summary['queries_per_request'] = round(queries / total, 2) if total else 0
+        summary['status_codes'] = sorted(statuses)
+        return summary
+
+    def compare(self, report, baseline_path):
+        try:
+            with open(baseline_path) as handle:
+                baseline = json.load(handle)['endpoints']
+        except (OSError, ValueError, KeyError) as exc:
+            raise CommandError(f"Could not read baseline report: {exc}")
+        for path, current in report['endpoints'].items():
+            previous = baseline.get(path)
+            if not previous:
+                self.stderr.write(f"{path}: no baseline")
+                continue
+            self.stderr.write(
+                f"{path}: p95 {previous['p95_ms']} -> {current['p95_ms']}ms, "
+                f"queries {previous['queries_per_request']} -> {current['queries_per_request']}"
+            )
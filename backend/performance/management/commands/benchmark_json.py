@@ -0,0 +1,92 @@
+import io
+import json
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from backend.parsers import ORJSONParser
+from backend.renderers import ORJSONRenderer
+from performance.benchmarks import summarize
+from quotation.models import QuotationItem
+from quotation.serializers import QuotationItemSerializer
+
+class Command(BaseCommand):
+    help = "Compare DRF's JSONRenderer/JSONParser with the orjson versions on a synthetic quotation list."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--items-per-row', type=int, default=4)
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rows = self.build_rows(options['rows'], options['items_per_row'], random.Random(options['seed']))
+        stock, fast = JSONRenderer(), ORJSONRenderer()
+        expected = stock.render(rows)
+        if fast.render(rows) != expected:
+            raise CommandError("ORJSONRenderer output differs from JSONRenderer.")
+
+        report = {
+            'rows': options['rows'],
+            'payload_bytes': len(expected),
+            'render': {
+                'drf': self.time(lambda: stock.render(rows), options['iterations']),
+                'orjson': self.time(lambda: fast.render(rows), options['iterations']),
+            },
+            'parse': {
+                'drf': self.time(lambda: JSONParser().parse(io.BytesIO(expected)), options['iterations']),
+                'orjson': self.time(lambda: ORJSONParser().parse(io.BytesIO(expected)), options['iterations']),
+            },
+        }
+        for section in ('render', 'parse'):
+            timings = report[section]
+            timings['speedup'] = round(timings['drf']['p50_ms'] / timings['orjson']['p50_ms'], 1) if timings['orjson']['p50_ms'] else None
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def time(self, func, iterations):
+        samples = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call_started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - call_started) * 1000)
+        return summarize(samples, time.perf_counter() - started)
+
+    def build_rows(self, total, items_per_row, rng):
+        # Shaped like QuotationSerializer output: DecimalField values arrive as strings,
+        # get_total_price yields raw Decimals, and nested items come from the real serializer.
+        now = timezone.now()
+        rows = []
+        for index in range(total):
+            items = [
+                QuotationItem(
+                    id=index * items_per_row + position,
+                    item_name=f"Pressure gauge {rng.randint(1, 500)} – 0-{rng.randint(10, 400)} bar",
+                    quantity=rng.randint(1, 50),
+                    unit='Nos',
+                    unit_price=Decimal(rng.randint(100, 500000)) / 100,
+                )
+                for position in range(items_per_row)
+            ]
+            rows.append({
+                'id': index + 1,
+                'quotation_no': f"QT-{index + 1:07d}",
+                'created_at': (now - timedelta(minutes=index)).isoformat(),
+                'rfq': index + 1,
+                'client': rng.randint(1, 2000),
+                'company_name': f"Client {rng.randint(1, 2000)} Trading LLC",
+                'email': f"buyer{index}@example.com",
+                'items': QuotationItemSerializer(items, many=True).data,
+                'due_date': (date.today() + timedelta(days=rng.randint(-30, 30))).isoformat(),
+                'current_status': rng.choice(['Pending', 'Approved', 'PO Created']),
+                'when_approved': None,
+                'latest_remarks': None,
+                'purchase_order': [],
+                'grand_total': sum(item.quantity * item.unit_price for item in items),
+                'next_followup_date': None,
+            })
+        return rows
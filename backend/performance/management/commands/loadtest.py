@@ -0,0 +1,84 @@
+import http.client
+import itertools
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+from django.core.management.base import BaseCommand, CommandError
+from performance.benchmarks import summarize
+
+class Command(BaseCommand):
+    help = (
+        "Drive running servers over HTTP with many concurrent keep-alive clients, e.g. the same "
+        "endpoint under gunicorn (WSGI) and uvicorn (ASGI), and report latency and throughput as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url', action='append', dest='urls', required=True,
+            help="label=URL to load, repeatable, e.g. wsgi=http://127.0.0.1:8000/api/add-rfqs/",
+        )
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--requests', type=int, default=2000, help="Total requests per URL.")
+        parser.add_argument('--timeout', type=float, default=30.0)
+        parser.add_argument('--token', help="JWT access token sent as a Bearer Authorization header.")
+        parser.add_argument('--output', help="Write the JSON report to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        headers = {'Authorization': f"Bearer {options['token']}"} if options['token'] else {}
+        report = {'concurrency': options['concurrency'], 'requests': options['requests'], 'targets': {}}
+        for target in options['urls']:
+            label, separator, url = target.partition('=')
+            if not separator or not url.startswith(('http://', 'https://')):
+                raise CommandError(f"Expected label=URL, got {target!r}")
+            report['targets'][label] = self.run(url, headers, options)
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Wrote report to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    def run(self, url, headers, options):
+        parts = urlsplit(url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        path = parts.path + (f'?{parts.query}' if parts.query else '')
+        tickets = itertools.count()
+        total = options['requests']
+        samples = []
+        errors = {}
+        lock = threading.Lock()
+
+        def worker():
+            connection = connection_class(parts.netloc, timeout=options['timeout'])
+            local = []
+            while next(tickets) < total:
+                started = time.perf_counter()
+                try:
+                    connection.request('GET', path, headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                    outcome = response.status if response.status >= 400 else None
+                except (OSError, http.client.HTTPException) as exc:
+                    connection.close()
+                    outcome = type(exc).__name__
+                if outcome is None:
+                    local.append((time.perf_counter() - started) * 1000)
+                else:
+                    with lock:
+                        errors[str(outcome)] = errors.get(str(outcome), 0) + 1
+            connection.close()
+            with lock:
+                samples.extend(local)
+
+        threads = [threading.Thread(target=worker) for _ in range(options['concurrency'])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        summary = summarize(samples, time.perf_counter() - started)
+        summary['errors'] = errors
+        return summary
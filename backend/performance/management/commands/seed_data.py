@@ -0,0 +1,280 @@
+import random
+import string
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from backend.cache import bump_namespace
+from item.models import Item, Unit
+from quotation.models import PurchaseOrder, PurchaseOrderItem, Quotation, QuotationItem
+from rfq.models import RFQ, Client, RFQItem, client_lookup_key
+from series.models import NumberSeries
+from team.models import TeamMember
+
+SCALES = {
+    'small': {'series': 3, 'team': 10, 'clients': 200, 'rfqs': 1000},
+    'medium': {'series': 5, 'team': 25, 'clients': 2000, 'rfqs': 20000},
+    'large': {'series': 10, 'team': 50, 'clients': 20000, 'rfqs': 200000},
+}
+
+# The stages the job execution screens filter work orders by.
+WORK_ORDER_STATUSES = ['Collected', 'Processing', 'Pending Approval', 'Approved', 'Delivered', 'Closed']
+
+class Command(BaseCommand):
+    help = "Seed realistic synthetic RFQs, quotations, purchase orders and work orders with bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES, default='small')
+        parser.add_argument('--series', type=int)
+        parser.add_argument('--team', type=int)
+        parser.add_argument('--clients', type=int)
+        parser.add_argument('--rfqs', type=int)
+        parser.add_argument('--items-per-rfq', type=int, default=4)
+        parser.add_argument('--quotation-ratio', type=float, default=0.6)
+        parser.add_argument('--purchase-order-ratio', type=float, default=0.4)
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--tag', help="Suffix that keeps unique fields distinct between runs.")
+
+    def handle(self, *args, **options):
+        counts = dict(SCALES[options['scale']])
+        for name in counts:
+            if options[name] is not None:
+                counts[name] = options[name]
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.tag = options['tag'] or format(int(time.time()), 'x')[-6:].upper()
+        self.catalog_items = list(Item.objects.values_list('id', 'name', 'price'))
+        self.catalog_units = list(Unit.objects.values_list('id', 'name'))
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            series = self.seed_series(counts['series'])
+            team = self.seed_team(counts['team'])
+            clients = self.seed_clients(counts['clients'])
+            rfqs = self.seed_rfqs(counts['rfqs'], options['items_per_rfq'], series, team, clients)
+            quotations = self.seed_quotations(rfqs, options['quotation_ratio'])
+            purchase_orders = self.seed_purchase_orders(quotations, options['purchase_order_ratio'])
+            work_orders = self.seed_work_orders(purchase_orders, team)
+        # bulk_create skips post_save, so the cache namespaces are bumped by hand.
+        for namespace in ('series', 'series-definitions', 'teams', 'clients'):
+            bump_namespace(namespace)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(series)} series, {len(team)} team members, {len(clients)} clients, "
+            f"{len(rfqs)} RFQs, {len(quotations)} quotations, {len(purchase_orders)} purchase orders "
+            f"and {work_orders} work orders (tag {self.tag}) in {time.perf_counter() - started:.1f}s."
+        ))
+
+    def word(self, length):
+        return ''.join(self.random.choices(string.ascii_lowercase, k=length)).capitalize()
+
+    def insert(self, model, objects, key_field):
+        """bulk_create in batches and return {key: id}; MySQL does not hand primary keys back."""
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        keys = [getattr(obj, key_field) for obj in objects]
+        ids = {}
+        for start in range(0, len(keys), self.batch_size):
+            chunk = keys[start:start + self.batch_size]
+            ids.update(model.objects.filter(**{f'{key_field}__in': chunk}).values_list(key_field, 'id'))
+        return ids
+
+    def line_item(self):
+        if self.catalog_items and self.random.random() < 0.7:
+            item_id, name, price = self.random.choice(self.catalog_items)
+        else:
+            item_id, name, price = None, f"{self.word(7)} {self.word(5)}", None
+        unit_id, unit = self.random.choice(self.catalog_units) if self.catalog_units else (None, 'Nos')
+        return {
+            'item_name': name,
+            'quantity': self.random.randint(1, 50),
+            'unit': unit,
+            'unit_price': price or Decimal(self.random.randint(100, 500000)) / 100,
+            'catalog_item_id': item_id,
+            'catalog_unit_id': unit_id,
+        }
+
+    def seed_series(self, total):
+        objects = [
+            NumberSeries(series_name=f"Synthetic {self.tag} {index}", prefix=f"S{self.tag}{index}")
+            for index in range(total)
+        ]
+        ids = self.insert(NumberSeries, objects, 'prefix')
+        return [{'id': ids[obj.prefix], 'prefix': obj.prefix, 'sequence': 0} for obj in objects]
+
+    def seed_team(self, total):
+        objects = [
+            TeamMember(
+                name=f"{self.word(6)} {self.word(8)} {self.tag}{index}",
+                designation=self.random.choice(['Sales Engineer', 'Technician', 'Manager', 'Coordinator']),
+                email=f"team{index}.{self.tag.lower()}@example.com",
+            )
+            for index in range(total)
+        ]
+        return list(self.insert(TeamMember, objects, 'email').values())
+
+    def seed_clients(self, total):
+        objects = []
+        for index in range(total):
+            company_name = f"{self.word(6)} {self.random.choice(['Trading', 'Industries', 'Engineering', 'LLC'])} {self.tag}{index}"
+            email = f"contact{index}.{self.tag.lower()}@example.com"
+            objects.append(Client(
+                company_name=company_name,
+                address=f"{self.random.randint(1, 999)} {self.word(8)} Street",
+                phone=f"+971{self.random.randint(500000000, 599999999)}",
+                email=email,
+                rfq_channel=self.random.choice(['Email', 'Phone', 'WhatsApp', 'Website']),
+                attention_name=f"{self.word(5)} {self.word(7)}",
+                attention_phone=f"+971{self.random.randint(500000000, 599999999)}",
+                attention_email=f"attn{index}.{self.tag.lower()}@example.com",
+                lookup_key=client_lookup_key(company_name, email),
+            ))
+        ids = self.insert(Client, objects, 'lookup_key')
+        return [(ids[obj.lookup_key], obj) for obj in objects]
+
+    def seed_rfqs(self, total, items_per_rfq, series, team, clients):
+        rfqs = []
+        items = []
+        today = date.today()
+        for _ in range(total):
+            number_series = self.random.choice(series)
+            number_series['sequence'] += 1
+            client_id, client = self.random.choice(clients)
+            rfq = RFQ(
+                client_id=client_id,
+                company_name=client.company_name,
+                address=client.address,
+                phone=client.phone,
+                email=client.email,
+                rfq_channel=client.rfq_channel,
+                attention_name=client.attention_name,
+                attention_phone=client.attention_phone,
+                attention_email=client.attention_email,
+                due_date=today + timedelta(days=self.random.randint(-60, 60)),
+                assign_to_id=self.random.choice(team) if team else None,
+                current_status=self.random.choice(['Processing', 'Completed']),
+                rfq_no=f"{number_series['prefix']}-{str(number_series['sequence']).zfill(7)}",
+                series_id=number_series['id'],
+            )
+            rfqs.append(rfq)
+            items.append([self.line_item() for _ in range(self.random.randint(1, items_per_rfq * 2 - 1))])
+
+        ids = self.insert(RFQ, rfqs, 'rfq_no')
+        RFQItem.objects.bulk_create(
+            [RFQItem(rfq_id=ids[rfq.rfq_no], **item) for rfq, rfq_items in zip(rfqs, items) for item in rfq_items],
+            batch_size=self.batch_size,
+        )
+        for number_series in series:
+            NumberSeries.objects.filter(id=number_series['id']).update(current_sequence=number_series['sequence'])
+        return [(ids[rfq.rfq_no], rfq, rfq_items) for rfq, rfq_items in zip(rfqs, items)]
+
+    def seed_quotations(self, rfqs, ratio):
+        latest = Quotation.objects.filter(quotation_no__startswith='QT-').order_by('-quotation_no').first()
+        number = int(latest.quotation_no.split('-')[-1]) if latest else 0
+        quotations = []
+        items = []
+        for rfq_id, rfq, rfq_items in rfqs:
+            if self.random.random() >= ratio:
+                continue
+            number += 1
+            quotations.append(Quotation(
+                quotation_no=f"QT-{number:07d}",
+                rfq_id=rfq_id,
+                client_id=rfq.client_id,
+                company_name=rfq.company_name,
+                address=rfq.address,
+                phone=rfq.phone,
+                email=rfq.email,
+                attention_name=rfq.attention_name,
+                attention_phone=rfq.attention_phone,
+                attention_email=rfq.attention_email,
+                due_date=rfq.due_date,
+                current_status=self.random.choice(['Pending', 'Approved', 'PO Created']),
+                next_followup_date=rfq.due_date,
+            ))
+            items.append(rfq_items)
+
+        ids = self.insert(Quotation, quotations, 'quotation_no')
+        QuotationItem.objects.bulk_create(
+            [
+                QuotationItem(
+                    quotation_id=ids[quotation.quotation_no],
+                    total_price=item['unit_price'] * item['quantity'],
+                    **item,
+                )
+                for quotation, quotation_items in zip(quotations, items)
+                for item in quotation_items
+            ],
+            batch_size=self.batch_size,
+        )
+        return [(ids[quotation.quotation_no], quotation, quotation_items) for quotation, quotation_items in zip(quotations, items)]
+
+    def seed_purchase_orders(self, quotations, ratio):
+        purchase_orders = []
+        items = []
+        for quotation_id, quotation, quotation_items in quotations:
+            if self.random.random() >= ratio:
+                continue
+            order_type = self.random.choice(['full', 'partial'])
+            purchase_orders.append(PurchaseOrder(
+                quotation_id=quotation_id,
+                client_po_number=f"PO-{self.tag}-{len(purchase_orders) + 1}",
+                order_type=order_type,
+            ))
+            if order_type == 'partial':
+                quotation_items = quotation_items[:max(1, len(quotation_items) // 2)]
+            items.append(quotation_items)
+
+        ids = self.insert(PurchaseOrder, purchase_orders, 'client_po_number')
+        PurchaseOrderItem.objects.bulk_create(
+            [
+                PurchaseOrderItem(purchase_order_id=ids[purchase_order.client_po_number], **item)
+                for purchase_order, purchase_order_items in zip(purchase_orders, items)
+                for item in purchase_order_items
+            ],
+            batch_size=self.batch_size,
+        )
+        return [
+            (ids[purchase_order.client_po_number], purchase_order, purchase_order_items)
+            for purchase_order, purchase_order_items in zip(purchase_orders, items)
+        ]
+
+    def seed_work_orders(self, purchase_orders, team):
+        if not apps.is_installed('job_execution'):
+            self.stdout.write("job_execution is not installed; skipping work orders.")
+            return 0
+        WorkOrder = apps.get_model('job_execution', 'WorkOrder')
+        WorkOrderItem = apps.get_model('job_execution', 'WorkOrderItem')
+        today = date.today()
+        work_orders = [
+            WorkOrder(
+                work_order_no=f"WO-{self.tag}-{index + 1}",
+                quotation_id=purchase_order.quotation_id,
+                purchase_order_id=purchase_order_id,
+                assigned_to_id=self.random.choice(team) if team else None,
+                date_received=today - timedelta(days=self.random.randint(0, 90)),
+                exp_date_completion=today + timedelta(days=self.random.randint(0, 30)),
+                onsite_lab=self.random.choice(['Onsite', 'Lab']),
+                serial_number=f"SN{self.random.randint(100000, 999999)}",
+                current_status=self.random.choice(WORK_ORDER_STATUSES),
+            )
+            for index, (purchase_order_id, purchase_order, _) in enumerate(purchase_orders)
+        ]
+        ids = self.insert(WorkOrder, work_orders, 'work_order_no')
+        WorkOrderItem.objects.bulk_create(
+            [
+                WorkOrderItem(
+                    work_order_id=ids[work_order.work_order_no],
+                    item_name=item['item_name'],
+                    quantity=item['quantity'],
+                    unit=item['unit'],
+                    unit_price=item['unit_price'],
+                )
+                for work_order, (_, _, purchase_order_items) in zip(work_orders, purchase_orders)
+                for item in purchase_order_items
+            ],
+            batch_size=self.batch_size,
+        )
+        return len(work_orders)
@@ -0,0 +1,94 @@
+import random
+import time
+from contextlib import contextmanager
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from .instrumentation import RequestTimings, current_timings, registry
+from .querywatch import query_hook, watch_queries
+
+class PerformanceMiddleware:
+    """
+    Records total, database and serializer time for a sample of requests, adds them as a
+    Server-Timing header and feeds the per-route histograms exposed on /metrics.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+        timings = RequestTimings()
+        started = time.perf_counter()
+        with self.instrument(timings):
+            response = self.get_response(request)
+        return self.finish(request, response, timings, started)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+        timings = RequestTimings()
+        started = time.perf_counter()
+        with self.instrument(timings):
+            response = await self.get_response(request)
+        return self.finish(request, response, timings, started)
+
+    def sampled(self):
+        return random.random() < getattr(settings, 'PERFORMANCE_SAMPLE_RATE', 1.0)
+
+    @contextmanager
+    def instrument(self, timings):
+        token = current_timings.set(timings)
+        try:
+            with query_hook(timings.execute_wrapper):
+                yield
+        finally:
+            current_timings.reset(token)
+
+    def finish(self, request, response, timings, started):
+        total = time.perf_counter() - started
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.db_queries} queries"',
+            f'serializer;dur={timings.serializer_seconds * 1000:.1f}',
+            f'total;dur={total * 1000:.1f}',
+        ])
+        match = getattr(request, 'resolver_match', None)
+        route = match.route.lstrip('^').rstrip('$') if match else 'unmatched'
+        registry.observe(route, request.method, response.status_code, total, timings)
+        return response
+
+class QueryDetectorMiddleware:
+    """
+    Flags N+1 patterns and slow statements per request. Logs or raises depending on
+    QUERY_DETECTOR_MODE and removes itself from the stack when the mode is 'off'.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if getattr(settings, 'QUERY_DETECTOR_MODE', 'off') == 'off':
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with watch_queries(f'{request.method} {request.path}'):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with watch_queries(f'{request.method} {request.path}'):
+            return await self.get_response(request)
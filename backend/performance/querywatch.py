@@ -0,0 +1,147 @@
+import logging
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from django.conf import settings
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+from rest_framework.views import APIView
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?|NULL)\s*,?)+\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+_IGNORED_PATHS = (
+    os.sep + 'site-packages' + os.sep,
+    os.sep + 'dist-packages' + os.sep,
+    os.path.abspath(__file__),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instrumentation.py'),
+)
+
+# Execute wrappers active for the current request or block. Connections are per thread but
+# context variables follow the request into sync_to_async threads, so every connection runs
+# the same dispatcher and it picks up whichever hooks belong to the running context.
+query_hooks = ContextVar('query_hooks', default=())
+
+class QueryPatternError(AssertionError):
+    pass
+
+def run_query_hooks(execute, sql, params, many, context):
+    for hook in reversed(query_hooks.get()):
+        execute = partial(hook, execute)
+    return execute(sql, params, many, context)
+
+def install_query_hooks(sender=None, connection=None, **kwargs):
+    """connection_created receiver; without a connection, covers this thread's open ones."""
+    for target in [connection] if connection is not None else connections.all():
+        if run_query_hooks not in target.execute_wrappers:
+            # First in line so connection.execute_wrapper() blocks still pop their own wrapper.
+            target.execute_wrappers.insert(0, run_query_hooks)
+
+@contextmanager
+def query_hook(hook):
+    """Run hook around every query in this context, including ORM work in sync_to_async threads."""
+    install_query_hooks()
+    token = query_hooks.set(query_hooks.get() + (hook,))
+    try:
+        yield
+    finally:
+        query_hooks.reset(token)
+
+def normalize_sql(sql):
+    """Reduce a statement to its shape so queries differing only in parameters group together."""
+    shape = _STRING_LITERAL.sub('?', sql)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = shape.replace('%s', '?')
+    shape = _IN_LIST.sub('IN (...)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+def _project_file(filename, base_dir):
+    return filename.startswith(base_dir) and not any(part in filename for part in _IGNORED_PATHS)
+
+def query_origin():
+    """
+    Locate the code responsible for a query: the innermost project frame, or a project view or
+    serializer driven from library code (e.g. ModelSerializer fields). Middleware only wraps
+    the whole request, so its frames are skipped.
+    """
+    base_dir = str(settings.BASE_DIR)
+    frame = sys._getframe(1)
+    while frame is not None:
+        owner = frame.f_locals.get('self')
+        if owner is not None and hasattr(owner, 'get_response'):
+            frame = frame.f_back
+            continue
+        filename = frame.f_code.co_filename
+        if _project_file(filename, base_dir):
+            return f'{os.path.relpath(filename, base_dir)}:{frame.f_lineno} in {frame.f_code.co_name}'
+        if isinstance(owner, (BaseSerializer, APIView)):
+            module = sys.modules.get(type(owner).__module__)
+            module_file = getattr(module, '__file__', None) or ''
+            if _project_file(module_file, base_dir):
+                return f'{os.path.relpath(module_file, base_dir)} in {type(owner).__name__}.{frame.f_code.co_name}'
+        frame = frame.f_back
+    return 'unknown'
+
+class QueryWatcher:
+    """
+    Groups the SQL run inside a request or test by normalized shape and reports shapes repeated
+    more than ``repeat_threshold`` times (typically an N+1 loop) and statements slower than
+    ``slow_ms``, each with the first project frame that issued it.
+    """
+
+    def __init__(self, repeat_threshold=None, slow_ms=None):
+        self.repeat_threshold = repeat_threshold or getattr(settings, 'QUERY_DETECTOR_REPEAT_THRESHOLD', 5)
+        self.slow_ms = slow_ms or getattr(settings, 'QUERY_DETECTOR_SLOW_MS', 100)
+        self.shapes = {}
+        self.slow_queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            shape = normalize_sql(sql)
+            entry = self.shapes.get(shape)
+            if entry is None:
+                self.shapes[shape] = {'count': 1, 'origin': query_origin()}
+            else:
+                entry['count'] += 1
+            if duration_ms >= self.slow_ms:
+                self.slow_queries.append({'sql': shape, 'ms': round(duration_ms, 1), 'origin': query_origin()})
+
+    def problems(self):
+        found = [
+            f'{entry["count"]}x {shape} (first at {entry["origin"]})'
+            for shape, entry in self.shapes.items()
+            if entry['count'] > self.repeat_threshold
+        ]
+        found.extend(f'slow {query["ms"]}ms {query["sql"]} (at {query["origin"]})' for query in self.slow_queries)
+        return found
+
+    def report(self, label, mode=None):
+        mode = mode or getattr(settings, 'QUERY_DETECTOR_MODE', 'off')
+        found = self.problems()
+        if not found or mode == 'off':
+            return found
+        message = f'Query problems in {label}:\n  ' + '\n  '.join(found)
+        if mode == 'raise':
+            raise QueryPatternError(message)
+        logger.warning(message)
+        return found
+
+@contextmanager
+def watch_queries(label='block', mode=None, **thresholds):
+    """Watch every database connection for the duration of the block, then report."""
+    watcher = QueryWatcher(**thresholds)
+    with query_hook(watcher):
+        yield watcher
+    watcher.report(label, mode)
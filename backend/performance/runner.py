@@ -0,0 +1,9 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+class QueryDetectorTestRunner(DiscoverRunner):
+    """Runs the suite with the query detector in QUERY_DETECTOR_TEST_MODE ('raise' by default)."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.QUERY_DETECTOR_MODE = getattr(settings, 'QUERY_DETECTOR_TEST_MODE', 'raise')
@@ -0,0 +1,131 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import path
+from rest_framework import serializers
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from job_execution.models import WorkOrder, WorkOrderItem
+from quotation.models import PurchaseOrder
+from rfq.models import RFQ, Client
+from .instrumentation import registry
+from .management.commands.seed_data import WORK_ORDER_STATUSES
+from .querywatch import QueryPatternError
+
+class MetricsAccessTests(TestCase):
+    @override_settings(METRICS_TOKEN=None, DEBUG=False)
+    def test_denied_without_token_outside_debug(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    @override_settings(METRICS_TOKEN=None, DEBUG=True)
+    def test_served_without_token_under_debug(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_token_required_when_set(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 401)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer s3cret')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('http_request_duration_seconds', response.content.decode())
+
+class RFQClientSerializer(serializers.ModelSerializer):
+    client_name = serializers.CharField(source='client.company_name')
+
+    class Meta:
+        model = RFQ
+        fields = ['id', 'client_name']
+
+class RFQClientList(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response(RFQClientSerializer(RFQ.objects.order_by('id'), many=True).data)
+
+class RFQClientNames(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        names = []
+        for rfq in RFQ.objects.order_by('id'):
+            names.append(rfq.client.company_name)
+        return Response(names)
+
+urlpatterns = [
+    path('rfq-clients/', RFQClientList.as_view()),
+    path('rfq-client-names/', RFQClientNames.as_view()),
+]
+
+@override_settings(ROOT_URLCONF=__name__, QUERY_DETECTOR_REPEAT_THRESHOLD=3)
+class QueryDetectorTests(TestCase):
+    def setUp(self):
+        for index in range(5):
+            RFQ.objects.create(client=Client.objects.create(company_name=f'Client {index}'))
+
+    def test_n_plus_one_raises_with_serializer_origin(self):
+        with self.assertRaises(QueryPatternError) as raised:
+            self.client.get('/rfq-clients/')
+        message = str(raised.exception)
+        self.assertIn('5x SELECT', message)
+        self.assertIn('performance/tests.py in RFQClientSerializer.to_representation', message)
+        self.assertNotIn('middleware', message)
+
+    def test_origin_is_the_view_line_not_middleware(self):
+        with self.assertRaises(QueryPatternError) as raised:
+            self.client.get('/rfq-client-names/')
+        self.assertRegex(str(raised.exception), r'first at performance/tests\.py:\d+ in ')
+
+class SeedDataTests(TestCase):
+    def test_seeds_work_orders_with_items_and_frontend_statuses(self):
+        call_command(
+            'seed_data', series=2, team=3, clients=10, rfqs=60, seed=7, tag='T1',
+            quotation_ratio=1, purchase_order_ratio=1, stdout=StringIO(),
+        )
+        work_orders = WorkOrder.objects.count()
+        self.assertEqual(work_orders, PurchaseOrder.objects.count())
+        self.assertEqual(
+            WorkOrderItem.objects.values('work_order').distinct().count(), work_orders,
+        )
+        statuses = set(WorkOrder.objects.values_list('current_status', flat=True))
+        self.assertTrue(statuses <= set(WORK_ORDER_STATUSES))
+        self.assertTrue({'Processing', 'Pending Approval', 'Delivered'} <= statuses)
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/purchase-orders/')
+        self.assertEqual(len(response.json()), work_orders)
+
+def timed_queries(response):
+    db_timing = response['Server-Timing'].split(', ')[0]
+    return int(db_timing.split('desc="')[1].split(' ')[0])
+
+@override_settings(PERFORMANCE_SAMPLE_RATE=1.0)
+class AsyncInstrumentationTests(TestCase):
+    def setUp(self):
+        for index in range(3):
+            rfq = RFQ.objects.create(company_name=f'Client {index}', rfq_no=f'RFQ-{index}')
+            rfq.items.create(item_name='Gauge', quantity=1)
+        registry.reset()
+
+    async def test_async_list_reports_its_queries(self):
+        response = await self.async_client.get('/api/async/add-rfqs/')
+        self.assertEqual(response.status_code, 200)
+        # The RFQ query plus the items prefetch; under ASGI both views query from a worker thread.
+        self.assertEqual(timed_queries(response), 2)
+        sync_response = await self.async_client.get('/api/add-rfqs/')
+        self.assertEqual(timed_queries(sync_response), timed_queries(response))
+
+    async def test_async_detail_reports_its_queries(self):
+        rfq = await RFQ.objects.afirst()
+        response = await self.async_client.get(f'/api/async/add-rfqs/{rfq.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(timed_queries(response), 2)
+        metrics = registry.snapshot()[('api/async/add-rfqs/<int:pk>/', 'GET', '2xx')]
+        self.assertEqual(metrics['db_queries'], 2)
+
+    @override_settings(QUERY_DETECTOR_REPEAT_THRESHOLD=0)
+    async def test_query_detector_sees_async_queries(self):
+        # With no repeats allowed, any query the detector sees is reported.
+        with self.assertRaises(QueryPatternError) as raised:
+            await self.async_client.get('/api/async/quotations/')
+        self.assertIn('SELECT', str(raised.exception))
@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from backend.db.pool import pool_stats
+from backend.db.replicas import health, replica_metrics
+from backend.throttling import throttle_metrics
+from .instrumentation import LATENCY_BUCKETS, registry
+
+def _labels(**labels):
+    pairs = ','.join(
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+    return '{' + pairs + '}'
+
+def render_metrics():
+    lines = [
+        '# HELP http_request_duration_seconds Request latency by route, method and status class.',
+        '# TYPE http_request_duration_seconds histogram',
+    ]
+    snapshot = registry.snapshot()
+    for (route, method, status), metrics in sorted(snapshot.items()):
+        labels = {'route': route, 'method': method, 'status': status}
+        for bound, count in zip(LATENCY_BUCKETS, metrics['bucket_counts']):
+            lines.append(f'http_request_duration_seconds_bucket{_labels(**labels, le=bound)} {count}')
+        lines.append(f'http_request_duration_seconds_bucket{_labels(**labels, le="+Inf")} {metrics["count"]}')
+        lines.append(f'http_request_duration_seconds_sum{_labels(**labels)} {metrics["seconds"]:.6f}')
+        lines.append(f'http_request_duration_seconds_count{_labels(**labels)} {metrics["count"]}')
+
+    for name, field, help_text in (
+        ('http_request_db_queries_total', 'db_queries', 'Database queries issued by sampled requests.'),
+        ('http_request_db_seconds_total', 'db_seconds', 'Database time spent by sampled requests.'),
+        ('http_request_serializer_seconds_total', 'serializer_seconds', 'Serializer time spent by sampled requests.'),
+    ):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} counter')
+        for (route, method, status), metrics in sorted(snapshot.items()):
+            lines.append(f'{name}{_labels(route=route, method=method, status=status)} {metrics[field]}')
+
+    lines.append('# HELP throttle_decisions_total Token bucket throttle decisions.')
+    lines.append('# TYPE throttle_decisions_total counter')
+    for (scope, key_type, outcome), count in sorted(dict(throttle_metrics).items()):
+        lines.append(f'throttle_decisions_total{_labels(scope=scope, key_type=key_type, outcome=outcome)} {count}')
+
+    lines.append('# HELP db_pool_connections Connection pool state and counters per database alias.')
+    lines.append('# TYPE db_pool_connections gauge')
+    for alias, stats in sorted(pool_stats().items()):
+        for stat, value in sorted(stats.items()):
+            lines.append(f'db_pool_connections{_labels(alias=alias, stat=stat)} {value}')
+
+    lines.append('# HELP db_replica_reads_total Router decisions for replica-eligible reads.')
+    lines.append('# TYPE db_replica_reads_total counter')
+    for outcome, count in sorted(dict(replica_metrics).items()):
+        lines.append(f'db_replica_reads_total{_labels(outcome=outcome)} {count}')
+
+    lines.append('# HELP db_replica_lag_seconds Replication lag at the last check; -1 if unknown.')
+    lines.append('# TYPE db_replica_lag_seconds gauge')
+    for alias, lag in sorted(dict(health.lag).items()):
+        lines.append(f'db_replica_lag_seconds{_labels(alias=alias)} {-1 if lag is None else lag}')
+
+    return '\n'.join(lines) + '\n'
+
+def metrics(request):
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if not token:
+        # Without a token the endpoint is only served to local development.
+        if not settings.DEBUG:
+            return HttpResponse(status=403)
+    else:
+        supplied = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+        if not constant_time_compare(supplied, token):
+            return HttpResponse(status=401)
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
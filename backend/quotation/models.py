@@ -1,9 +1,11 @@
 from django.db import models
-from rfq.models import RFQ
+from rfq.models import RFQ, Client
+from item.models import Item, Unit
 
 class Quotation(models.Model):
     quotation_no = models.CharField(max_length=50, unique=True)
     rfq = models.ForeignKey(RFQ, on_delete=models.CASCADE)
+    client = models.ForeignKey(Client, on_delete=models.SET_NULL, null=True, blank=True, related_name='quotations')
     company_name = models.CharField(max_length=255, null=True, blank=True)
     address = models.TextField(null=True, blank=True)
     phone = models.CharField(max_length=20, null=True, blank=True)
@@ -28,6 +30,8 @@ class QuotationItem(models.Model):
     unit = models.CharField(max_length=50, null=True, blank=True)
     unit_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     total_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    catalog_item = models.ForeignKey(Item, on_delete=models.SET_NULL, null=True, blank=True, related_name='quotation_items')
+    catalog_unit = models.ForeignKey(Unit, on_delete=models.SET_NULL, null=True, blank=True, related_name='quotation_items')
 
     def __str__(self):
         return f"{self.item_name} - {self.quotation.quotation_no}"
@@ -48,6 +52,8 @@ class PurchaseOrderItem(models.Model):
     quantity = models.IntegerField()
     unit = models.CharField(max_length=50, null=True, blank=True)
     unit_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    catalog_item = models.ForeignKey(Item, on_delete=models.SET_NULL, null=True, blank=True, related_name='purchase_order_items')
+    catalog_unit = models.ForeignKey(Unit, on_delete=models.SET_NULL, null=True, blank=True, related_name='purchase_order_items')
 
     def __str__(self):
         return f"{self.item_name} - {self.purchase_order}"
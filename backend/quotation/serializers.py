@@ -3,13 +3,16 @@ from django.db.models import Max
 from rest_framework import serializers
 from .models import Quotation, QuotationItem, PurchaseOrder, PurchaseOrderItem
 from rfq.models import RFQ
+from item.catalog import resolve_catalog
+from backend.sparse import SparseFieldsetSerializerMixin
+from archive.models import ArchivedRecord
 
 class PurchaseOrderItemSerializer(serializers.ModelSerializer):
     total_price = serializers.SerializerMethodField()
 
     class Meta:
         model = PurchaseOrderItem
-        fields = ['id', 'item_name', 'quantity', 'unit', 'unit_price', 'total_price']
+        fields = ['id', 'item_name', 'quantity', 'unit', 'unit_price', 'total_price', 'catalog_item', 'catalog_unit']
 
     def get_total_price(self, obj):
         if obj.quantity and obj.unit_price is not None:
@@ -34,8 +37,10 @@ class PurchaseOrderSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         items_data = validated_data.pop('items', [])
         purchase_order = PurchaseOrder.objects.create(**validated_data)
-        for item_data in items_data:
-            PurchaseOrderItem.objects.create(purchase_order=purchase_order, **item_data)
+        resolve_catalog(items_data, prefill_price=False)
+        PurchaseOrderItem.objects.bulk_create([
+            PurchaseOrderItem(purchase_order=purchase_order, **item_data) for item_data in items_data
+        ])
         purchase_order.quotation.refresh_from_db()
         return purchase_order
 
@@ -47,22 +52,28 @@ class QuotationItemSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = QuotationItem
-        fields = ['id', 'item_name', 'quantity', 'unit', 'unit_price', 'total_price']
+        fields = ['id', 'item_name', 'quantity', 'unit', 'unit_price', 'total_price', 'catalog_item', 'catalog_unit']
 
     def get_total_price(self, obj):
         if obj.quantity and obj.unit_price is not None:
             return obj.quantity * obj.unit_price
         return 0
 
-class QuotationSerializer(serializers.ModelSerializer):
+class QuotationSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    relations = {
+        'items': {'fields': ('items',), 'prefetch_related': ('items',)},
+        'purchase_order': {'fields': ('purchase_order',), 'prefetch_related': ('purchase_order__items',)},
+    }
+
     items = QuotationItemSerializer(many=True)
     rfq = serializers.PrimaryKeyRelatedField(queryset=RFQ.objects.all())
+    client = serializers.PrimaryKeyRelatedField(read_only=True)
     purchase_order = PurchaseOrderSerializer(many=True, read_only=True)
 
     class Meta:
         model = Quotation
         fields = [
-            'id', 'quotation_no', 'created_at', 'rfq', 'company_name', 'address', 'phone', 'email',
+            'id', 'quotation_no', 'created_at', 'rfq', 'client', 'company_name', 'address', 'phone', 'email',
             'attention_name', 'attention_phone', 'attention_email', 'items', 'due_date',
             'current_status', 'when_approved', 'latest_remarks', 'purchase_order', 'next_followup_date'
         ]
@@ -94,13 +105,14 @@ class QuotationSerializer(serializers.ModelSerializer):
                 items_data = [
                     {
                         'item_name': item.item_name,
-                        'product_name': item.product_name,
                         'quantity': item.quantity,
                         'unit': item.unit,
                         'unit_price': item.unit_price or 0.00,
-                        'total_price': (item.quantity or 0) * (item.unit_price or 0.00)
+                        'total_price': (item.quantity or 0) * (item.unit_price or 0.00),
+                        'catalog_item': item.catalog_item,
+                        'catalog_unit': item.catalog_unit,
                     }
-                    for item in rfq.items.all()
+                    for item in rfq.items.select_related('catalog_item', 'catalog_unit')
                 ]
 
             prefix = "QT-"
@@ -113,14 +125,20 @@ class QuotationSerializer(serializers.ModelSerializer):
                     new_number = 1
             else:
                 new_number = 1
+            # Archived records keep their numbers, so never hand one out again.
+            new_number = max(new_number, ArchivedRecord.last_sequence('quotation', prefix) + 1)
 
             quotation_no = f"{prefix}{new_number:07d}"
             validated_data['quotation_no'] = quotation_no
+            if rfq:
+                validated_data['client'] = rfq.client
 
             quotation = Quotation.objects.create(**validated_data)
 
-            for item_data in items_data:
-                QuotationItem.objects.create(quotation=quotation, **item_data)
+            resolve_catalog(items_data, prefill_price=False)
+            QuotationItem.objects.bulk_create([
+                QuotationItem(quotation=quotation, **item_data) for item_data in items_data
+            ])
 
             return quotation
 
@@ -141,7 +159,9 @@ class QuotationSerializer(serializers.ModelSerializer):
         instance.save()
 
         instance.items.all().delete()
-        for item_data in items_data:
-            QuotationItem.objects.create(quotation=instance, **item_data)
+        resolve_catalog(items_data, prefill_price=False)
+        QuotationItem.objects.bulk_create([
+            QuotationItem(quotation=instance, **item_data) for item_data in items_data
+        ])
 
         return instance
\ No newline at end of file
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import QuotationViewSet, PurchaseOrderViewSet, SendDueReminderView
+from .views import QuotationViewSet, PurchaseOrderViewSet, SendDueReminderView, quotation_list_async, quotation_detail_async
 
 router = DefaultRouter()
 router.register(r'quotations', QuotationViewSet, basename='quotation')
@@ -9,4 +9,6 @@ router.register(r'purchase-orders', PurchaseOrderViewSet, basename='purchase-ord
 urlpatterns = [
     path('', include(router.urls)),
     path('quotations/send-due-reminder/', SendDueReminderView.as_view(), name='send-due-reminder'),
+    path('async/quotations/', quotation_list_async, name='quotation-list-async'),
+    path('async/quotations/<int:pk>/', quotation_detail_async, name='quotation-detail-async'),
 ]
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from .models import Quotation, PurchaseOrder
@@ -7,9 +8,17 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.core.mail import send_mail
 from django.conf import settings
+from backend.throttling import IPTokenBucketThrottle, AccountTokenBucketThrottle
+from backend.sparse import SparseFieldsetViewMixin, narrow_queryset, sparse_context
+from backend.async_views import async_read_view, json_response, serialize_many, serialize_one
+
+logger = logging.getLogger(__name__)
 
 class SendDueReminderView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [IPTokenBucketThrottle, AccountTokenBucketThrottle]
+    throttle_scope = 'reminder'
+    throttle_account_field = 'quotation_id'
 
     def post(self, request):
         quotation_id = request.data.get('quotation_id')
@@ -64,25 +73,43 @@ class SendDueReminderView(APIView):
         except Quotation.DoesNotExist:
             return Response({"error": "Quotation not found"}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            print(f"Failed to send due reminder emails: {str(e)}")
+            logger.warning("Failed to send due reminder emails: %s", e)
             return Response({"error": "Failed to send emails"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class QuotationViewSet(viewsets.ModelViewSet):
+def quotation_queryset(params):
+    queryset = Quotation.objects.prefetch_related('items', 'purchase_order__items')
+    rfq_id = params.get('rfq', None)
+    client_id = params.get('client', None)
+    search = params.get('search', None)
+    if rfq_id:
+        queryset = queryset.filter(rfq_id=rfq_id)
+    if client_id:
+        queryset = queryset.filter(client_id=client_id)
+    if search:
+        queryset = queryset.filter(quotation_no__icontains=search)
+    return queryset
+
+class QuotationViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     queryset = Quotation.objects.all()
     serializer_class = QuotationSerializer
 
     def get_queryset(self):
-        queryset = Quotation.objects.all()
-        rfq_id = self.request.query_params.get('rfq', None)
-        search = self.request.query_params.get('search', None)
-        if rfq_id:
-            queryset = queryset.filter(rfq_id=rfq_id)
-        if search:
-            queryset = queryset.filter(quotation_no__icontains=search)
-        return queryset
+        return quotation_queryset(self.request.query_params)
 
 class PurchaseOrderViewSet(viewsets.ModelViewSet):
     permission_classes = [AllowAny]
-    queryset = PurchaseOrder.objects.all()
-    serializer_class = PurchaseOrderSerializer
\ No newline at end of file
+    queryset = PurchaseOrder.objects.prefetch_related('items')
+    serializer_class = PurchaseOrderSerializer
+
+@async_read_view
+async def quotation_list_async(request):
+    context = {'request': request, **sparse_context(request.GET)}
+    queryset = narrow_queryset(quotation_queryset(request.GET), QuotationSerializer(context=context))
+    return json_response(await serialize_many(QuotationSerializer, queryset, context))
+
+@async_read_view
+async def quotation_detail_async(request, pk):
+    context = {'request': request, **sparse_context(request.GET)}
+    queryset = narrow_queryset(quotation_queryset(request.GET), QuotationSerializer(context=context))
+    return json_response(await serialize_one(QuotationSerializer, queryset, context, pk=pk))
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import ReferenceDataView, reference_data_async
+
+urlpatterns = [
+    path('reference-data/', ReferenceDataView.as_view(), name='reference-data'),
+    path('async/reference-data/', reference_data_async, name='reference-data-async'),
+]
@@ -0,0 +1,83 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework import status
+from authapp.authentication import TokenClaimsAuthentication
+from item.models import Item, Unit
+from item.serializers import ItemSerializer, UnitSerializer
+from team.models import TeamMember
+from team.serializers import TeamMemberSerializer
+from rfq.models import RFQChannel
+from rfq.serializers import RFQChannelSerializer
+from series.models import NumberSeries
+from series.serializers import SeriesReferenceSerializer
+from django.http import HttpResponse
+from backend.cache import anamespace_versions, namespace_versions
+from backend.db.replicas import primary_reads
+from backend.compression import etag_matches
+from backend.async_views import async_read_view, json_response, serialize_many
+
+REFERENCE_NAMESPACES = ('items', 'units', 'teams', 'rfq-channels', 'series-definitions')
+
+REFERENCE_SOURCES = (
+    ('items', Item, ItemSerializer),
+    ('units', Unit, UnitSerializer),
+    ('teams', TeamMember, TeamMemberSerializer),
+    ('rfq_channels', RFQChannel, RFQChannelSerializer),
+    ('series', NumberSeries, SeriesReferenceSerializer),
+)
+
+def version_token(versions):
+    return hashlib.sha256('.'.join(str(v) for v in versions).encode()).hexdigest()[:16]
+
+def get_reference_data_version():
+    return version_token(namespace_versions(REFERENCE_NAMESPACES))
+
+def build_reference_data(version):
+    payload = {'version': version}
+    for name, model, serializer_class in REFERENCE_SOURCES:
+        payload[name] = serializer_class(model.objects.all(), many=True).data
+    return payload
+
+async def abuild_reference_data(version):
+    payload = {'version': version}
+    for name, model, serializer_class in REFERENCE_SOURCES:
+        payload[name] = await serialize_many(serializer_class, model.objects.all())
+    return payload
+
+class ReferenceDataView(APIView):
+    authentication_classes = [TokenClaimsAuthentication]
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        version = get_reference_data_version()
+        etag = f'"{version}"'
+        client_version = request.query_params.get('version')
+        if client_version == version or etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        cache_key = f'reference-data:payload:{version}'
+        payload = cache.get(cache_key)
+        if payload is None:
+            with primary_reads():
+                payload = build_reference_data(version)
+            cache.set(cache_key, payload, getattr(settings, 'REFERENCE_DATA_CACHE_TIMEOUT', 3600))
+        return Response(payload, headers={'ETag': etag})
+
+@async_read_view
+async def reference_data_async(request):
+    version = version_token(await anamespace_versions(REFERENCE_NAMESPACES))
+    etag = f'"{version}"'
+    if request.GET.get('version') == version or etag_matches(request, etag):
+        return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+    cache_key = f'reference-data:payload:{version}'
+    payload = await cache.aget(cache_key)
+    if payload is None:
+        with primary_reads():
+            payload = await abuild_reference_data(version)
+        await cache.aset(cache_key, payload, getattr(settings, 'REFERENCE_DATA_CACHE_TIMEOUT', 3600))
+    return json_response(payload, headers={'ETag': etag})
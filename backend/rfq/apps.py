@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class RfqConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'rfq'
+
+    def ready(self):
+        from django.db.models.signals import post_save, post_delete
+        from backend.cache import invalidate_on_change
+        from .models import RFQChannel, Client
+        from .typeahead import clear_client_typeahead_cache
+
+        invalidate_on_change(RFQChannel, 'rfq-channels')
+        invalidate_on_change(Client, 'clients')
+        post_save.connect(clear_client_typeahead_cache, sender=Client, dispatch_uid='typeahead:clients:save')
+        post_delete.connect(clear_client_typeahead_cache, sender=Client, dispatch_uid='typeahead:clients:delete')
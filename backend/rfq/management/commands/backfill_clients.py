@@ -0,0 +1,89 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from rfq.models import RFQ, Client, client_lookup_key
+from rfq.serializers import CLIENT_FIELDS
+from quotation.models import Quotation
+
+class Command(BaseCommand):
+    help = "Link RFQs and quotations to deduplicated Client records."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        merged = self.refresh_lookup_keys(batch_size)
+        linked = self.link_rfqs(batch_size)
+        quotations = Quotation.objects.filter(client__isnull=True, rfq__client__isnull=False).update(
+            client_id=Subquery(RFQ.objects.filter(pk=OuterRef('rfq_id')).values('client_id')[:1])
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Merged {merged} duplicate clients, linked {linked} RFQs and {quotations} quotations."
+        ))
+
+    def refresh_lookup_keys(self, batch_size):
+        """
+        Recompute every lookup key. lookup_key is unique, so clients whose keys now collide
+        are merged into the oldest one before the new keys are written.
+        """
+        clients = Client.objects.only('id', 'company_name', 'email', 'lookup_key').order_by('id')
+        by_key = {}
+        pending = []
+        for client in clients.iterator(chunk_size=batch_size):
+            lookup_key = client_lookup_key(client.company_name, client.email)
+            if lookup_key:
+                by_key.setdefault(lookup_key, []).append(client.id)
+            if client.lookup_key != lookup_key:
+                client.lookup_key = lookup_key
+                pending.append(client)
+
+        merged = 0
+        for client_ids in by_key.values():
+            if len(client_ids) > 1:
+                merged += self.merge(client_ids[0], client_ids[1:])
+        merged_ids = {client_id for client_ids in by_key.values() for client_id in client_ids[1:]}
+        pending = [client for client in pending if client.id not in merged_ids]
+        with transaction.atomic():
+            # Clear the old keys first so rewriting them never collides mid-update.
+            Client.objects.filter(pk__in=[client.id for client in pending]).update(lookup_key=None)
+            Client.objects.bulk_update(pending, ['lookup_key'], batch_size=batch_size)
+        return merged
+
+    def merge(self, keep_id, other_ids):
+        with transaction.atomic():
+            RFQ.objects.filter(client_id__in=other_ids).update(client_id=keep_id)
+            Quotation.objects.filter(client_id__in=other_ids).update(client_id=keep_id)
+            return Client.objects.filter(pk__in=other_ids).delete()[0]
+
+    def link_rfqs(self, batch_size):
+        client_ids = dict(
+            Client.objects.exclude(lookup_key__isnull=True)
+            .order_by('-id')
+            .values_list('lookup_key', 'id')
+        )
+        fields = ['id', 'company_name', 'email'] + CLIENT_FIELDS
+        linked = 0
+        last_id = 0
+        while True:
+            rows = list(
+                RFQ.objects.filter(client__isnull=True, pk__gt=last_id)
+                .order_by('pk')
+                .values(*fields)[:batch_size]
+            )
+            if not rows:
+                break
+            last_id = rows[-1]['id']
+            by_client = {}
+            for row in rows:
+                lookup_key = client_lookup_key(row['company_name'], row['email'])
+                if not lookup_key:
+                    continue
+                if lookup_key not in client_ids:
+                    client = Client.objects.create(**{field: row[field] for field in fields if field != 'id'})
+                    client_ids[lookup_key] = client.id
+                by_client.setdefault(client_ids[lookup_key], []).append(row['id'])
+            with transaction.atomic():
+                for client_id, rfq_ids in by_client.items():
+                    linked += RFQ.objects.filter(pk__in=rfq_ids).update(client_id=client_id)
+        return linked
@@ -0,0 +1,77 @@
+import random
+import string
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rfq.models import Client, client_lookup_key
+from rfq.typeahead import client_typeahead_cache, search_clients
+
+class Rollback(Exception):
+    pass
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+class Command(BaseCommand):
+    help = "Seed synthetic clients inside a rolled-back transaction and measure typeahead latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=200000)
+        parser.add_argument('--queries', type=int, default=2000)
+        parser.add_argument('--limit', type=int, default=10)
+        parser.add_argument('--p99-ms', type=float, default=50.0)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        try:
+            with transaction.atomic():
+                self.seed_clients(options['clients'])
+                cold = self.run_queries(options['queries'], options['limit'], warm=False)
+                warm = self.run_queries(options['queries'], options['limit'], warm=True)
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            client_typeahead_cache.clear()
+
+        for label, samples in (('cold', cold), ('warm', warm)):
+            self.stdout.write(
+                f"{label}: p50={percentile(samples, 50):.2f}ms "
+                f"p95={percentile(samples, 95):.2f}ms p99={percentile(samples, 99):.2f}ms"
+            )
+        if percentile(cold, 99) > options['p99_ms']:
+            raise CommandError(f"Cold p99 exceeds the {options['p99_ms']}ms target.")
+
+    def word(self, length):
+        return ''.join(self.random.choices(string.ascii_lowercase, k=length)).capitalize()
+
+    def seed_clients(self, total):
+        batch = []
+        for index in range(total):
+            company_name = f"{self.word(6)} {self.word(5)} {index}"
+            email = f"{self.word(5).lower()}{index}@example.com"
+            batch.append(Client(
+                company_name=company_name,
+                email=email,
+                attention_name=f"{self.word(5)} {self.word(7)}",
+                lookup_key=client_lookup_key(company_name, email),
+            ))
+            if len(batch) == 5000:
+                Client.objects.bulk_create(batch)
+                batch = []
+        Client.objects.bulk_create(batch)
+
+    def run_queries(self, total, limit, warm):
+        prefixes = [self.word(self.random.randint(1, 4)) for _ in range(max(1, total // 10) if warm else total)]
+        samples = []
+        for index in range(total):
+            if not warm:
+                client_typeahead_cache.clear()
+            prefix = prefixes[index % len(prefixes)]
+            started = time.perf_counter()
+            search_clients(prefix, limit)
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
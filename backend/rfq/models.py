@@ -1,6 +1,7 @@
-from django.db import models
+from django.db import IntegrityError, models
 from team.models import TeamMember
 from series.models import NumberSeries
+from item.models import Item, Unit
 
 class RFQChannel(models.Model):
     channel_name = models.CharField(max_length=100, unique=True, null=True, blank=True)
@@ -8,21 +9,54 @@ class RFQChannel(models.Model):
     def __str__(self):
         return self.channel_name
 
+def client_lookup_key(company_name=None, email=None):
+    email = (email or '').strip().lower()
+    if email:
+        return f"email:{email}"
+    company_name = ' '.join((company_name or '').split()).lower()
+    if company_name:
+        return f"company:{company_name}"
+    return None
+
+class ClientManager(models.Manager):
+    def resolve(self, company_name=None, email=None, **defaults):
+        lookup_key = client_lookup_key(company_name, email)
+        if not lookup_key:
+            return None
+        try:
+            client, _ = self.get_or_create(
+                lookup_key=lookup_key, defaults={'company_name': company_name, 'email': email, **defaults},
+            )
+        except IntegrityError:
+            # A concurrent request created the same client between our lookup and insert.
+            client = self.get(lookup_key=lookup_key)
+        return client
+
 class Client(models.Model):
-    company_name = models.CharField(max_length=255, null=True, blank=True)
+    company_name = models.CharField(max_length=255, null=True, blank=True, db_index=True)
     address = models.TextField(null=True, blank=True)
     phone = models.CharField(max_length=20, null=True, blank=True)
-    email = models.EmailField(null=True, blank=True)
+    email = models.EmailField(null=True, blank=True, db_index=True)
     rfq_channel = models.CharField(max_length=100, blank=True, null=True)
-    attention_name = models.CharField(max_length=255, blank=True, null=True)
+    attention_name = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     attention_phone = models.CharField(max_length=255, blank=True, null=True)
     attention_email = models.EmailField(blank=True, null=True)
+    # Unique so concurrent creates cannot duplicate a client; run backfill_clients to merge
+    # existing duplicates before applying the constraint.
+    lookup_key = models.CharField(max_length=300, null=True, blank=True, unique=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ClientManager()
+
     def __str__(self):
         return self.company_name or 'Unnamed Client'
 
+    def save(self, *args, **kwargs):
+        self.lookup_key = client_lookup_key(self.company_name, self.email)
+        super().save(*args, **kwargs)
+
 class RFQ(models.Model):
+    client = models.ForeignKey(Client, on_delete=models.SET_NULL, null=True, blank=True, related_name='rfqs')
     company_name = models.CharField(max_length=255, null=True, blank=True)
     address = models.TextField(null=True, blank=True)
     phone = models.CharField(max_length=20, null=True, blank=True)
@@ -54,6 +88,8 @@ class RFQItem(models.Model):
     quantity = models.PositiveIntegerField(null=True, blank=True)
     unit = models.CharField(max_length=100, null=True, blank=True)
     unit_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    catalog_item = models.ForeignKey(Item, on_delete=models.SET_NULL, null=True, blank=True, related_name='rfq_items')
+    catalog_unit = models.ForeignKey(Unit, on_delete=models.SET_NULL, null=True, blank=True, related_name='rfq_items')
     
     def __str__(self):
-        return f"{self.item_name} for RFQ {self.rfq.id}"
\ No newline at end of file
+        return f"{self.item_name} for RFQ {self.rfq.id}"
@@ -1,12 +1,19 @@
+import logging
 from rest_framework import serializers
 from django.core.mail import send_mail
 from django.conf import settings
-from .models import RFQ, RFQChannel, Client, RFQItem
+from django.db import connection, transaction
+from .models import RFQ, RFQChannel, Client, RFQItem, client_lookup_key
 from team.models import TeamMember
 from series.models import NumberSeries
 from quotation.models import QuotationItem  
+from item.models import Item, Unit
+from item.catalog import resolve_catalog
+from backend.sparse import SparseFieldsetSerializerMixin
 from datetime import date
 
+logger = logging.getLogger(__name__)
+
 class RFQChannelSerializer(serializers.ModelSerializer):
     class Meta:
         model = RFQChannel
@@ -23,12 +30,53 @@ class ClientSerializer(serializers.ModelSerializer):
             'created_at'
         ]
 
+    def validate(self, data):
+        instance = self.instance
+        lookup_key = client_lookup_key(
+            data.get('company_name', getattr(instance, 'company_name', None)),
+            data.get('email', getattr(instance, 'email', None)),
+        )
+        duplicates = Client.objects.filter(lookup_key=lookup_key)
+        if instance is not None:
+            duplicates = duplicates.exclude(pk=instance.pk)
+        if lookup_key and duplicates.exists():
+            raise serializers.ValidationError("A client with this email or company name already exists.")
+        return data
+
 class RFQItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = RFQItem
-        fields = ['id', 'item_name', 'quantity', 'unit', 'unit_price']
+        fields = ['id', 'item_name', 'quantity', 'unit', 'unit_price', 'catalog_item', 'catalog_unit']
+
+def lock_rfqs(rfq_ids):
+    """
+    Row-lock the given RFQs until the surrounding transaction ends. Every path that adds items
+    to an existing RFQ takes this lock, which the MySQL id readback in bulk creates relies on.
+    """
+    list(RFQ.objects.select_for_update().filter(id__in=rfq_ids).values_list('id', flat=True))
+
+CLIENT_FIELDS = [
+    'address', 'phone', 'rfq_channel',
+    'attention_name', 'attention_phone', 'attention_email',
+]
+
+def resolve_client(data):
+    return Client.objects.resolve(
+        company_name=data.get('company_name'),
+        email=data.get('email'),
+        **{field: data.get(field) for field in CLIENT_FIELDS}
+    )
+
+class RFQSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    relations = {
+        'items': {'fields': ('items',), 'prefetch_related': ('items',)},
+        'assignee': {
+            'fields': ('assigned_sales_person', 'assign_to_name', 'assign_to_designation', 'assign_to_email'),
+            'select_related': ('assign_to',),
+        },
+    }
 
-class RFQSerializer(serializers.ModelSerializer):
+    client = serializers.PrimaryKeyRelatedField(read_only=True)
     rfq_channel = serializers.CharField(allow_null=True, required=False)
     items = RFQItemSerializer(many=True, required=False)
     assign_to = serializers.PrimaryKeyRelatedField(
@@ -44,7 +92,7 @@ class RFQSerializer(serializers.ModelSerializer):
     class Meta:
         model = RFQ
         fields = [
-            'id', 'created_at', 'company_name', 'address', 'phone', 'email',
+            'id', 'created_at', 'client', 'company_name', 'address', 'phone', 'email',
             'rfq_channel', 'attention_name', 'attention_phone', 'attention_email',
             'due_date', 'assign_to', 'assigned_sales_person',
             'items', 'current_status', 'rfq_no', 'series',
@@ -103,9 +151,9 @@ class RFQSerializer(serializers.ModelSerializer):
                     fail_silently=True,
                 )
                 email_sent = True
-                print(f"Email sent successfully to {assign_to.email} for RFQ #{rfq.rfq_no}")
+                logger.info("Email sent successfully to %s for RFQ #%s", assign_to.email, rfq.rfq_no)
             except Exception as e:
-                print(f"Failed to send email to {assign_to.email} for RFQ #{rfq.rfq_no}: {str(e)}")
+                logger.warning("Failed to send email to %s for RFQ #%s: %s", assign_to.email, rfq.rfq_no, e)
 
             # Email to admin
             admin_email = settings.ADMIN_EMAIL
@@ -134,9 +182,9 @@ class RFQSerializer(serializers.ModelSerializer):
                     recipient_list=[admin_email],
                     fail_silently=True,
                 )
-                print(f"Email sent successfully to {admin_email} for RFQ #{rfq.rfq_no}")
+                logger.info("Email sent successfully to %s for RFQ #%s", admin_email, rfq.rfq_no)
             except Exception as e:
-                print(f"Failed to send email to {admin_email} for RFQ #{rfq.rfq_no}: {str(e)}")
+                logger.warning("Failed to send email to %s for RFQ #%s: %s", admin_email, rfq.rfq_no, e)
                 email_sent = False
 
         return email_sent
@@ -170,9 +218,9 @@ class RFQSerializer(serializers.ModelSerializer):
                     fail_silently=True,
                 )
                 email_sent = True
-                print(f"Reminder email sent successfully to {assign_to.email} for RFQ #{rfq.rfq_no}")
+                logger.info("Reminder email sent successfully to %s for RFQ #%s", assign_to.email, rfq.rfq_no)
             except Exception as e:
-                print(f"Failed to send reminder email to {assign_to.email} for RFQ #{rfq.rfq_no}: {str(e)}")
+                logger.warning("Failed to send reminder email to %s for RFQ #%s: %s", assign_to.email, rfq.rfq_no, e)
 
             # Email to admin
             admin_email = settings.ADMIN_EMAIL
@@ -201,9 +249,9 @@ class RFQSerializer(serializers.ModelSerializer):
                     recipient_list=[admin_email],
                     fail_silently=True,
                 )
-                print(f"Reminder email sent successfully to {admin_email} for RFQ #{rfq.rfq_no}")
+                logger.info("Reminder email sent successfully to %s for RFQ #%s", admin_email, rfq.rfq_no)
             except Exception as e:
-                print(f"Failed to send reminder email to {admin_email} for RFQ #{rfq.rfq_no}: {str(e)}")
+                logger.warning("Failed to send reminder email to %s for RFQ #%s: %s", admin_email, rfq.rfq_no, e)
                 email_sent = False
 
         return email_sent
@@ -237,9 +285,9 @@ class RFQSerializer(serializers.ModelSerializer):
                     fail_silently=True,
                 )
                 email_sent = True
-                print(f"Past due alert email sent successfully to {assign_to.email} for RFQ #{rfq.rfq_no}")
+                logger.info("Past due alert email sent successfully to %s for RFQ #%s", assign_to.email, rfq.rfq_no)
             except Exception as e:
-                print(f"Failed to send past due alert email to {assign_to.email} for RFQ #{rfq.rfq_no}: {str(e)}")
+                logger.warning("Failed to send past due alert email to %s for RFQ #%s: %s", assign_to.email, rfq.rfq_no, e)
 
             # Email to admin
             admin_email = settings.ADMIN_EMAIL
@@ -268,9 +316,9 @@ class RFQSerializer(serializers.ModelSerializer):
                     recipient_list=[admin_email],
                     fail_silently=True,
                 )
-                print(f"Past due alert email sent successfully to {admin_email} for RFQ #{rfq.rfq_no}")
+                logger.info("Past due alert email sent successfully to %s for RFQ #%s", admin_email, rfq.rfq_no)
             except Exception as e:
-                print(f"Failed to send past due alert email to {admin_email} for RFQ #{rfq.rfq_no}: {str(e)}")
+                logger.warning("Failed to send past due alert email to %s for RFQ #%s: %s", admin_email, rfq.rfq_no, e)
                 email_sent = False
 
         return email_sent
@@ -280,9 +328,10 @@ class RFQSerializer(serializers.ModelSerializer):
         assign_to = validated_data.pop('assign_to', None)
         series = validated_data.pop('series', None)
         rfq_no = series.get_next_sequence() if series else None
-        rfq = RFQ.objects.create(rfq_no=rfq_no, series=series, assign_to=assign_to, **validated_data)
-        for item_data in items_data:
-            RFQItem.objects.create(rfq=rfq, **item_data)
+        client = resolve_client(validated_data)
+        rfq = RFQ.objects.create(rfq_no=rfq_no, series=series, assign_to=assign_to, client=client, **validated_data)
+        resolve_catalog(items_data)
+        RFQItem.objects.bulk_create([RFQItem(rfq=rfq, **item_data) for item_data in items_data])
         email_sent = self.send_assignment_email(rfq, assign_to) if assign_to else False
         rfq.email_sent = email_sent
         rfq.save()
@@ -308,14 +357,22 @@ class RFQSerializer(serializers.ModelSerializer):
         instance.assign_to = assign_to
         instance.current_status = validated_data.get('current_status', instance.current_status)
         instance.series = series
+        if instance.client_id is None or {'company_name', 'email'} & validated_data.keys():
+            instance.client = resolve_client({
+                field: getattr(instance, field)
+                for field in ['company_name', 'email'] + CLIENT_FIELDS
+            })
         instance.save()
 
-        instance.items.all().delete()
-        for item_data in items_data:
-            RFQItem.objects.create(rfq=instance, **item_data)
+        resolve_catalog(items_data)
+        with transaction.atomic():
+            lock_rfqs([instance.pk])
+            instance.items.all().delete()
+            RFQItem.objects.bulk_create([RFQItem(rfq=instance, **item_data) for item_data in items_data])
 
         if hasattr(instance, 'quotation'):
             quotation = instance.quotation
+            quotation.client = instance.client
             quotation.company_name = instance.company_name
             quotation.address = instance.address
             quotation.phone = instance.phone
@@ -327,15 +384,19 @@ class RFQSerializer(serializers.ModelSerializer):
             quotation.save()
 
             quotation.items.all().delete()
-            for item_data in items_data:
-                QuotationItem.objects.create(
+            QuotationItem.objects.bulk_create([
+                QuotationItem(
                     quotation=quotation,
                     item_name=item_data.get('item_name'),
                     quantity=item_data.get('quantity'),
                     unit=item_data.get('unit'),
                     unit_price=item_data.get('unit_price'),
-                    total_price=(item_data.get('quantity') or 0) * (item_data.get('unit_price') or 0)
+                    total_price=(item_data.get('quantity') or 0) * (item_data.get('unit_price') or 0),
+                    catalog_item=item_data.get('catalog_item'),
+                    catalog_unit=item_data.get('catalog_unit'),
                 )
+                for item_data in items_data
+            ])
 
         email_sent = False
         if assign_to and (not instance.assign_to or instance.assign_to.id != assign_to.id):
@@ -347,5 +408,131 @@ class RFQSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        representation['email_sent'] = getattr(instance, 'email_sent', False)
-        return representation
\ No newline at end of file
+        requested = self.context.get('fields')
+        if requested is None or 'email_sent' in requested:
+            representation['email_sent'] = getattr(instance, 'email_sent', False)
+        return representation
+
+
+class RFQItemBulkEntrySerializer(serializers.ModelSerializer):
+    # Plain ids instead of related fields: references are checked once per batch, not per row.
+    id = serializers.IntegerField(required=False)
+    rfq = serializers.IntegerField(required=False)
+    catalog_item = serializers.IntegerField(required=False, allow_null=True)
+    catalog_unit = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = RFQItem
+        fields = ['id', 'rfq', 'item_name', 'quantity', 'unit', 'unit_price', 'catalog_item', 'catalog_unit']
+
+class RFQItemBulkSerializer(serializers.Serializer):
+    """
+    Batch of RFQ item creates, updates and deletes across one or many RFQs. The whole
+    batch is validated up front (one query per referenced table) and applied in a single
+    transaction with bulk_create/bulk_update; errors come back aligned with the input.
+    """
+
+    create = RFQItemBulkEntrySerializer(many=True, required=False)
+    update = RFQItemBulkEntrySerializer(many=True, required=False)
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+    def validate(self, data):
+        create, update, delete = data.get('create', []), data.get('update', []), data.get('delete', [])
+        max_items = getattr(settings, 'RFQ_ITEM_BULK_MAX_ITEMS', 500)
+        if len(create) + len(update) + len(delete) > max_items:
+            raise serializers.ValidationError(f"A batch may contain at most {max_items} operations.")
+
+        rfq_ids = {entry['rfq'] for entry in create if entry.get('rfq')}
+        item_ids = [entry['id'] for entry in update if entry.get('id')] + list(delete)
+        catalog_item_ids = {entry['catalog_item'] for entry in create + update if entry.get('catalog_item')}
+        catalog_unit_ids = {entry['catalog_unit'] for entry in create + update if entry.get('catalog_unit')}
+        known_rfqs = set(RFQ.objects.filter(id__in=rfq_ids).values_list('id', flat=True)) if rfq_ids else set()
+        known_items = dict(RFQItem.objects.filter(id__in=item_ids).values_list('id', 'rfq_id')) if item_ids else {}
+        self.catalog_items = Item.objects.only('id', 'price').in_bulk(catalog_item_ids) if catalog_item_ids else {}
+        self.catalog_units = Unit.objects.only('id').in_bulk(catalog_unit_ids) if catalog_unit_ids else {}
+
+        seen = set()
+        errors = {'create': [{} for _ in create], 'update': [{} for _ in update], 'delete': [{} for _ in delete]}
+        for index, entry in enumerate(create):
+            if not entry.get('rfq'):
+                errors['create'][index]['rfq'] = ["This field is required."]
+            elif entry['rfq'] not in known_rfqs:
+                errors['create'][index]['rfq'] = [f"Invalid RFQ id {entry['rfq']}."]
+        for operation, entries in (('update', update), ('delete', [{'id': item_id} for item_id in delete])):
+            for index, entry in enumerate(entries):
+                item_id = entry.get('id')
+                if not item_id:
+                    errors[operation][index]['id'] = ["This field is required."]
+                elif item_id not in known_items:
+                    errors[operation][index]['id'] = [f"Invalid RFQ item id {item_id}."]
+                elif item_id in seen:
+                    errors[operation][index]['id'] = [f"RFQ item {item_id} appears more than once in the batch."]
+                seen.add(item_id)
+                if operation == 'update' and entry.get('rfq') and entry['rfq'] != known_items.get(item_id):
+                    errors[operation][index]['rfq'] = ["Items cannot be moved to another RFQ."]
+        for operation, entries in (('create', create), ('update', update)):
+            for index, entry in enumerate(entries):
+                if entry.get('catalog_item') and entry['catalog_item'] not in self.catalog_items:
+                    errors[operation][index]['catalog_item'] = [f"Invalid catalog item id {entry['catalog_item']}."]
+                if entry.get('catalog_unit') and entry['catalog_unit'] not in self.catalog_units:
+                    errors[operation][index]['catalog_unit'] = [f"Invalid catalog unit id {entry['catalog_unit']}."]
+
+        if any(any(entry_errors) for entry_errors in errors.values()):
+            raise serializers.ValidationError({key: value for key, value in errors.items() if any(value)})
+        data['rfq_ids'] = rfq_ids | {known_items[item_id] for item_id in item_ids}
+        return data
+
+    def link_catalog(self, entry):
+        if entry.get('catalog_item'):
+            entry['catalog_item'] = self.catalog_items[entry['catalog_item']]
+        if entry.get('catalog_unit'):
+            entry['catalog_unit'] = self.catalog_units[entry['catalog_unit']]
+        return entry
+
+    def save(self):
+        data = self.validated_data
+        with transaction.atomic():
+            # Lock the parent RFQs so concurrent batches on the same RFQs apply one after another.
+            lock_rfqs(data['rfq_ids'])
+
+            create_data = [self.link_catalog(dict(entry)) for entry in data.get('create', [])]
+            resolve_catalog(create_data)
+            created = [
+                RFQItem(rfq_id=entry.pop('rfq'), **{key: value for key, value in entry.items() if key != 'id'})
+                for entry in create_data
+            ]
+            self.bulk_create(created)
+
+            updates = data.get('update', [])
+            instances = RFQItem.objects.select_for_update().in_bulk([entry['id'] for entry in updates])
+            updated, changed_fields = [], set()
+            for entry in updates:
+                entry = self.link_catalog(dict(entry))
+                instance = instances[entry.pop('id')]
+                entry.pop('rfq', None)
+                for field, value in entry.items():
+                    setattr(instance, field, value)
+                changed_fields.update(entry)
+                updated.append(instance)
+            if updated and changed_fields:
+                RFQItem.objects.bulk_update(updated, sorted(changed_fields))
+
+            deleted = list(data.get('delete', []))
+            if deleted:
+                RFQItem.objects.filter(id__in=deleted).delete()
+        return created, updated, deleted
+
+    def bulk_create(self, objects):
+        if not objects:
+            return
+        if connection.features.can_return_rows_from_bulk_insert:
+            RFQItem.objects.bulk_create(objects)
+            return
+        # MySQL does not return ids from bulk inserts. The parent RFQs are locked (see lock_rfqs),
+        # so the rows above the previous high-water mark are this batch, in insert order.
+        rfq_ids = {obj.rfq_id for obj in objects}
+        high_water = RFQItem.objects.filter(rfq_id__in=rfq_ids).order_by('-id').values_list('id', flat=True).first() or 0
+        RFQItem.objects.bulk_create(objects)
+        new_ids = RFQItem.objects.filter(rfq_id__in=rfq_ids, id__gt=high_water).order_by('id').values_list('id', flat=True)
+        for obj, pk in zip(objects, new_ids):
+            obj.pk = pk
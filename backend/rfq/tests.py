@@ -1,3 +1,223 @@
-from django.test import TestCase
+import json
+from contextlib import contextmanager
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from item.models import Item
+from performance.querywatch import query_hook
+from team.models import TeamMember
+from .models import RFQ, Client, RFQItem
+from .serializers import lock_rfqs
 
-# Create your tests here.
+class RFQItemBulkTests(TestCase):
+    def setUp(self):
+        self.rfq = RFQ.objects.create(company_name='Acme')
+        self.other_rfq = RFQ.objects.create(company_name='Globex')
+        self.items = [RFQItem.objects.create(rfq=self.rfq, item_name=f'Item {index}', quantity=1) for index in range(3)]
+        self.gauge = Item.objects.create(name='Gauge', price='12.50')
+
+    def post(self, body):
+        return self.client.post('/api/add-items/bulk/', data=json.dumps(body), content_type='application/json')
+
+    def test_create_update_delete(self):
+        response = self.post({
+            'create': [{'rfq': self.rfq.id, 'item_name': 'gauge', 'quantity': 2}],
+            'update': [{'id': self.items[0].id, 'quantity': 7}],
+            'delete': [self.items[1].id],
+        })
+        self.assertEqual(response.status_code, 200, response.content)
+        created = response.json()['created'][0]
+        self.assertEqual((created['rfq'], created['catalog_item'], created['unit_price']), (self.rfq.id, self.gauge.id, '12.50'))
+        self.assertEqual(RFQItem.objects.get(id=self.items[0].id).quantity, 7)
+        self.assertFalse(RFQItem.objects.filter(id=self.items[1].id).exists())
+
+    def test_create_without_returned_ids_reads_them_back(self):
+        with mock.patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False):
+            response = self.post({'create': [
+                {'rfq': self.rfq.id, 'item_name': 'First', 'quantity': 1},
+                {'rfq': self.other_rfq.id, 'item_name': 'Second', 'quantity': 1},
+            ]})
+        self.assertEqual(response.status_code, 200, response.content)
+        for entry in response.json()['created']:
+            self.assertEqual(RFQItem.objects.get(id=entry['id']).item_name, entry['item_name'])
+
+    def test_create_errors_align_with_input(self):
+        response = self.post({'create': [
+            {'rfq': self.rfq.id, 'item_name': 'Valid', 'quantity': 1},
+            {'item_name': 'No RFQ', 'quantity': 1},
+            {'rfq': 999999, 'item_name': 'Unknown RFQ', 'quantity': 1},
+            {'rfq': self.rfq.id, 'item_name': 'Bad catalog', 'quantity': 1, 'catalog_item': 987654},
+        ]})
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['create']
+        self.assertEqual(errors[0], {})
+        self.assertIn('rfq', errors[1])
+        self.assertIn('rfq', errors[2])
+        self.assertIn('catalog_item', errors[3])
+        self.assertEqual(RFQItem.objects.count(), 3)
+
+    def test_update_errors(self):
+        response = self.post({'update': [
+            {'id': self.items[0].id, 'rfq': self.other_rfq.id},
+            {'quantity': 2},
+            {'id': 424242, 'quantity': 2},
+        ]})
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['update']
+        self.assertEqual(errors[0], {'rfq': ["Items cannot be moved to another RFQ."]})
+        self.assertIn('id', errors[1])
+        self.assertIn('id', errors[2])
+        self.assertEqual(RFQItem.objects.get(id=self.items[0].id).rfq_id, self.rfq.id)
+
+    def test_delete_errors(self):
+        response = self.post({
+            'update': [{'id': self.items[0].id, 'quantity': 5}],
+            'delete': [self.items[0].id, 424242],
+        })
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['delete']
+        self.assertIn('more than once', errors[0]['id'][0])
+        self.assertIn('id', errors[1])
+        self.assertEqual(RFQItem.objects.count(), 3)
+
+    @override_settings(RFQ_ITEM_BULK_MAX_ITEMS=2)
+    def test_batch_size_limit(self):
+        response = self.post({'delete': [item.id for item in self.items]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(RFQItem.objects.count(), 3)
+
+class RFQUpdateTests(TestCase):
+    def test_update_replaces_items_under_the_rfq_lock(self):
+        rfq = RFQ.objects.create(company_name='Acme')
+        RFQItem.objects.create(rfq=rfq, item_name='Old', quantity=1)
+        with mock.patch('rfq.serializers.lock_rfqs', wraps=lock_rfqs) as lock:
+            response = self.client.put(
+                f'/api/add-rfqs/{rfq.id}/',
+                data=json.dumps({'company_name': 'Acme', 'items': [{'item_name': 'New', 'quantity': 3}]}),
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200, response.content)
+        lock.assert_called_once_with([rfq.id])
+        self.assertEqual(list(rfq.items.values_list('item_name', 'quantity')), [('New', 3)])
+
+COMPACT_FIELDS = {
+    'id', 'created_at', 'client', 'company_name', 'address', 'phone', 'email', 'rfq_channel',
+    'attention_name', 'attention_phone', 'attention_email', 'due_date', 'current_status',
+    'rfq_no', 'series', 'assign_to', 'email_sent',
+}
+
+SPARSE_CASES = [
+    # (query string, rendered keys, queries)
+    ('expand=', COMPACT_FIELDS, 1),
+    ('expand=items', COMPACT_FIELDS | {'items'}, 2),
+    ('fields=rfq_no,assign_to_name', {'id', 'rfq_no', 'assign_to_name'}, 1),
+    ('fields=rfq_no,no_such_field', {'id', 'rfq_no'}, 1),
+]
+
+@contextmanager
+def counted_queries():
+    """assertNumQueries for async tests: counts queries in sync_to_async threads too."""
+    queries = []
+
+    def count(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with query_hook(count):
+        yield queries
+
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        member = TeamMember.objects.create(name='Dana', designation='Sales', email='dana@example.com')
+        self.rfqs = []
+        for index in range(3):
+            rfq = RFQ.objects.create(company_name=f'Client {index}', rfq_no=f'RFQ-{index}', assign_to=member)
+            RFQItem.objects.create(rfq=rfq, item_name='Gauge', quantity=2)
+            self.rfqs.append(rfq)
+
+    def assertShape(self, row, keys):
+        self.assertEqual(set(row), keys)
+        if 'items' in keys:
+            self.assertEqual([item['item_name'] for item in row['items']], ['Gauge'])
+        if 'assign_to_name' in keys:
+            self.assertEqual(row['assign_to_name'], 'Dana')
+
+    def test_list(self):
+        for params, keys, queries in SPARSE_CASES:
+            with self.subTest(params), self.assertNumQueries(queries):
+                response = self.client.get(f'/api/add-rfqs/?{params}')
+            self.assertEqual(len(response.json()), 3)
+            for row in response.json():
+                self.assertShape(row, keys)
+
+    def test_detail(self):
+        for params, keys, queries in SPARSE_CASES:
+            with self.subTest(params), self.assertNumQueries(queries):
+                response = self.client.get(f'/api/add-rfqs/{self.rfqs[0].id}/?{params}')
+            self.assertShape(response.json(), keys)
+
+    async def test_async_list(self):
+        for params, keys, queries in SPARSE_CASES:
+            with self.subTest(params), counted_queries() as executed:
+                response = await self.async_client.get(f'/api/async/add-rfqs/?{params}')
+            self.assertEqual(len(executed), queries, executed)
+            self.assertEqual(len(response.json()), 3)
+            for row in response.json():
+                self.assertShape(row, keys)
+
+    async def test_async_detail(self):
+        for params, keys, queries in SPARSE_CASES:
+            with self.subTest(params), counted_queries() as executed:
+                response = await self.async_client.get(f'/api/async/add-rfqs/{self.rfqs[0].id}/?{params}')
+            self.assertEqual(len(executed), queries, executed)
+            self.assertShape(response.json(), keys)
+
+class ClientResolveTests(TestCase):
+    def test_resolve_reuses_the_client_for_the_same_email(self):
+        first = Client.objects.resolve(company_name='Acme', email='Buyer@Acme.com ')
+        second = Client.objects.resolve(company_name='ACME LLC', email='buyer@acme.com')
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Client.objects.count(), 1)
+
+    def test_resolve_recovers_from_a_concurrent_insert(self):
+        existing = Client.objects.create(company_name='Acme', email='buyer@acme.com')
+        real_get = Client.objects.get
+        lookups = []
+
+        def get(**kwargs):
+            # The first lookup runs before the concurrent insert committed.
+            lookups.append(kwargs)
+            if len(lookups) == 1:
+                raise Client.DoesNotExist
+            return real_get(**kwargs)
+
+        with mock.patch.object(Client.objects, 'get', side_effect=get):
+            client = Client.objects.resolve(company_name='Acme', email='buyer@acme.com')
+        self.assertEqual(client.pk, existing.pk)
+        self.assertEqual(Client.objects.count(), 1)
+
+    def test_lookup_key_is_unique(self):
+        Client.objects.create(company_name='Acme', email='buyer@acme.com')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Client.objects.create(company_name='Other', email='BUYER@acme.com')
+
+    def test_api_rejects_a_duplicate_client(self):
+        Client.objects.create(company_name='Acme', email='buyer@acme.com')
+        response = self.client.post(
+            '/api/clients/', json.dumps({'company_name': 'Acme Two', 'email': 'buyer@acme.com'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Client.objects.count(), 1)
+
+    def test_backfill_merges_clients_whose_keys_now_collide(self):
+        keep = Client.objects.create(company_name='Acme', email='buyer@acme.com')
+        stale = Client.objects.create(company_name='Acme', email='other@acme.com')
+        Client.objects.filter(pk=stale.pk).update(email='BUYER@ACME.COM', lookup_key='email:stale')
+        rfq = RFQ.objects.create(company_name='Acme', client=stale)
+        call_command('backfill_clients', stdout=StringIO())
+        self.assertEqual(list(Client.objects.values_list('pk', 'lookup_key')), [(keep.pk, 'email:buyer@acme.com')])
+        rfq.refresh_from_db()
+        self.assertEqual(rfq.client_id, keep.pk)
@@ -0,0 +1,44 @@
+from django.conf import settings
+from backend.db.replicas import primary_reads
+from backend.lru_cache import LRUCache
+from .models import Client
+
+TYPEAHEAD_FIELDS = ['id', 'company_name', 'attention_name', 'email', 'phone']
+MATCH_FIELDS = ['company_name', 'attention_name', 'email']
+
+client_typeahead_cache = LRUCache(
+    max_size=getattr(settings, 'CLIENT_TYPEAHEAD_CACHE_SIZE', 2048),
+    ttl=getattr(settings, 'CLIENT_TYPEAHEAD_CACHE_TTL', 60),
+)
+
+def clear_client_typeahead_cache(sender, **kwargs):
+    client_typeahead_cache.clear()
+
+def search_clients(query, limit):
+    """Prefix-match clients, ranking company name hits above attention name and email hits."""
+    query = ' '.join(query.split()).lower()
+    key = (query, limit)
+    results = client_typeahead_cache.get(key)
+    if results is not None:
+        return results
+
+    results = []
+    seen = set()
+    with primary_reads():
+        for field in MATCH_FIELDS:
+            remaining = limit - len(results)
+            if remaining <= 0:
+                break
+            rows = (
+                Client.objects.filter(**{f'{field}__istartswith': query})
+                .exclude(pk__in=seen)
+                .order_by(field, 'id')
+                .values(*TYPEAHEAD_FIELDS)[:remaining]
+            )
+            for row in rows:
+                row['matched_on'] = field
+                seen.add(row['id'])
+                results.append(row)
+
+    client_typeahead_cache.set(key, results)
+    return results
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from rfq.views import RFQViewSet, RFQChannelViewSet, ClientViewSet, RFQItemViewSet
+from rfq.views import RFQViewSet, RFQChannelViewSet, ClientViewSet, RFQItemViewSet, rfq_list_async, rfq_detail_async
 
 router = DefaultRouter()
 router.register(r'add-rfqs', RFQViewSet, basename='rfq')
@@ -10,4 +10,6 @@ router.register(r'add-items', RFQItemViewSet, basename='rfqitem')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('async/add-rfqs/', rfq_list_async, name='rfq-list-async'),
+    path('async/add-rfqs/<int:pk>/', rfq_detail_async, name='rfq-detail-async'),
 ]
\ No newline at end of file
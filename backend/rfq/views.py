@@ -1,13 +1,33 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from .models import RFQ, RFQChannel, Client, RFQItem
-from .serializers import RFQSerializer, RFQChannelSerializer, ClientSerializer, RFQItemSerializer
+from .serializers import RFQSerializer, RFQChannelSerializer, ClientSerializer, RFQItemSerializer, RFQItemBulkSerializer, lock_rfqs
 from rest_framework.permissions import AllowAny
+from django.conf import settings
+from django.db import transaction
+from .typeahead import search_clients
+from authapp.authentication import TokenClaimsAuthentication
+from backend.cache import CachedResponseMixin
+from archive.models import ArchivedRecord
+from backend.sparse import SparseFieldsetViewMixin, narrow_queryset, sparse_context
+from backend.async_views import async_read_view, json_response, serialize_many, serialize_one
 
-class RFQViewSet(viewsets.ModelViewSet):
+def rfq_queryset(params):
+    queryset = RFQ.objects.select_related('assign_to').prefetch_related('items')
+    client_id = params.get('client', None)
+    if client_id:
+        queryset = queryset.filter(client_id=client_id)
+    return queryset
+
+class RFQViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     queryset = RFQ.objects.all()
     serializer_class = RFQSerializer
 
+    def get_queryset(self):
+        return rfq_queryset(self.request.query_params)
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         series = instance.series
@@ -15,13 +35,14 @@ class RFQViewSet(viewsets.ModelViewSet):
         
         if series:
             rfqs = RFQ.objects.filter(series=series).order_by('created_at')
-            sequence = 1
+            # Archived RFQs keep their numbers; renumber the live ones after them.
+            sequence = ArchivedRecord.last_sequence('rfq', f"{series.prefix}-") + 1
             for rfq in rfqs:
                 rfq.rfq_no = f"{series.prefix}-{str(sequence).zfill(7)}"
                 rfq.save()
                 sequence += 1
             series.current_sequence = sequence - 1
-            series.save()
+            series.save(update_fields=['current_sequence', 'updated_at'])
         
         return response
 
@@ -29,13 +50,76 @@ class RFQItemViewSet(viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     queryset = RFQItem.objects.all()
     serializer_class = RFQItemSerializer
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            rfq = serializer.validated_data.get('rfq')
+            if rfq is not None:
+                lock_rfqs([rfq.pk])
+            serializer.save()
+
+    def perform_update(self, serializer):
+        # Moving an item into another RFQ counts as adding to it.
+        with transaction.atomic():
+            rfq = serializer.validated_data.get('rfq')
+            if rfq is not None:
+                lock_rfqs([rfq.pk])
+            serializer.save()
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        serializer = RFQItemBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        created, updated, deleted = serializer.save()
+        return Response({
+            'created': [{**RFQItemSerializer(item).data, 'rfq': item.rfq_id} for item in created],
+            'updated': [{**RFQItemSerializer(item).data, 'rfq': item.rfq_id} for item in updated],
+            'deleted': [{'id': item_id} for item_id in deleted],
+        })
     
-class RFQChannelViewSet(viewsets.ModelViewSet):
+class RFQChannelViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ('rfq-channels',)
     permission_classes = [AllowAny]
     queryset = RFQChannel.objects.all()
     serializer_class = RFQChannelSerializer
 
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ('clients',)
     permission_classes = [AllowAny]
     queryset = Client.objects.all()
-    serializer_class = ClientSerializer
\ No newline at end of file
+    serializer_class = ClientSerializer
+
+    @action(detail=False, methods=['get'], authentication_classes=[TokenClaimsAuthentication])
+    def typeahead(self, request):
+        query = request.query_params.get('q', '').strip()
+        max_limit = getattr(settings, 'CLIENT_TYPEAHEAD_MAX_LIMIT', 25)
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), max_limit)
+        except ValueError:
+            limit = 10
+        if len(query) < getattr(settings, 'CLIENT_TYPEAHEAD_MIN_LENGTH', 1) or limit < 1:
+            return Response([])
+        return Response(search_clients(query, limit))
+
+    @action(detail=True, methods=['get'])
+    def rfqs(self, request, pk=None):
+        rfqs = (
+            RFQ.objects.filter(client_id=pk)
+            .select_related('assign_to')
+            .prefetch_related('items')
+            .order_by('-created_at')
+        )
+        serializer = RFQSerializer(rfqs, many=True, context=self.get_serializer_context())
+        return Response(serializer.data)
+
+@async_read_view
+async def rfq_list_async(request):
+    context = {'request': request, **sparse_context(request.GET)}
+    queryset = narrow_queryset(rfq_queryset(request.GET), RFQSerializer(context=context))
+    return json_response(await serialize_many(RFQSerializer, queryset, context))
+
+@async_read_view
+async def rfq_detail_async(request, pk):
+    context = {'request': request, **sparse_context(request.GET)}
+    queryset = narrow_queryset(rfq_queryset(request.GET), RFQSerializer(context=context))
+    return json_response(await serialize_one(RFQSerializer, queryset, context, pk=pk))
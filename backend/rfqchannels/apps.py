@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class RfqchannelsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'rfqchannels'
+
+    def ready(self):
+        from backend.cache import invalidate_on_change
+        from .models import RFQChannel
+
+        invalidate_on_change(RFQChannel, 'rfq-channels')
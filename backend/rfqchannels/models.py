@@ -8,4 +8,4 @@ class RFQChannel(models.Model):
 
     class Meta:
         verbose_name = "RFQ Channel"
-        verbose_name_plural = "RFQ Channels"
\ No newline at end of file
+        verbose_name_plural = "RFQ Channels"
@@ -4,8 +4,10 @@ from rest_framework import status
 from .models import RFQChannel
 from .serializers import RFQChannelSerializer
 from rest_framework.permissions import AllowAny
+from backend.cache import CachedResponseMixin
 
-class RFQChannelViewSet(viewsets.ModelViewSet):
+class RFQChannelViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ('rfq-channels',)
     queryset = RFQChannel.objects.all()
     serializer_class = RFQChannelSerializer
     permission_classes = [AllowAny]
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class SeriesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'series'
+
+    def ready(self):
+        from backend.cache import invalidate_on_change
+        from .models import NumberSeries
+
+        invalidate_on_change(NumberSeries, 'series')
+        # Reference data omits the counters, so issuing a number does not invalidate it.
+        invalidate_on_change(NumberSeries, 'series-definitions', ignore_fields=('current_sequence', 'updated_at'))
@@ -12,5 +12,5 @@ class NumberSeries(models.Model):
 
     def get_next_sequence(self):
         self.current_sequence += 1
-        self.save()
-        return f"{self.prefix}-{str(self.current_sequence).zfill(7)}"
\ No newline at end of file
+        self.save(update_fields=['current_sequence', 'updated_at'])
+        return f"{self.prefix}-{str(self.current_sequence).zfill(7)}"
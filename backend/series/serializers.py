@@ -4,4 +4,9 @@ from .models import NumberSeries
 class NumberSeriesSerializer(serializers.ModelSerializer):
     class Meta:
         model = NumberSeries
-        fields = ['id', 'series_name', 'prefix', 'current_sequence', 'created_at', 'updated_at']
\ No newline at end of file
+        fields = ['id', 'series_name', 'prefix', 'current_sequence', 'created_at', 'updated_at']
+
+class SeriesReferenceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = NumberSeries
+        fields = ['id', 'series_name', 'prefix', 'created_at']
@@ -1,3 +1,24 @@
+from django.core.cache import cache
 from django.test import TestCase
+from backend.cache import namespace_versions
+from .models import NumberSeries
 
-# Create your tests here.
+class SeriesInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.series = NumberSeries.objects.create(series_name='RFQ', prefix='RFQ')
+
+    def test_issuing_a_number_keeps_reference_data_cached(self):
+        before = namespace_versions(['series', 'series-definitions'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.series.get_next_sequence(), 'RFQ-0000001')
+        after = namespace_versions(['series', 'series-definitions'])
+        self.assertEqual(after[1], before[1])
+        self.assertEqual(after[0], before[0] + 1)
+
+    def test_renaming_a_series_invalidates_reference_data(self):
+        before = namespace_versions(['series-definitions'])
+        self.series.series_name = 'Enquiries'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.series.save()
+        self.assertEqual(namespace_versions(['series-definitions']), [before[0] + 1])
@@ -2,8 +2,10 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from .models import NumberSeries
 from .serializers import NumberSeriesSerializer
+from backend.cache import CachedResponseMixin
 
-class NumberSeriesViewSet(viewsets.ModelViewSet):
+class NumberSeriesViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ('series',)
     permission_classes = [AllowAny]
     queryset = NumberSeries.objects.all()
     serializer_class = NumberSeriesSerializer
\ No newline at end of file